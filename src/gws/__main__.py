@@ -3,7 +3,7 @@
 import os
 os.environ.setdefault("PYTHONUNBUFFERED", "1")
 
-from gws.cli import app
+from gws.cli import run
 
 if __name__ == "__main__":
-    app()
+    run()
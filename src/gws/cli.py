@@ -9,7 +9,7 @@ from gws import __version__
 from gws.auth.provider import resolve_auth_provider
 from gws.config import Config
 from gws.output import output_json, output_success, output_error
-from gws.exceptions import ExitCode, AuthError
+from gws.exceptions import ExitCode, AuthError, GWSError
 
 # Main app
 app = typer.Typer(
@@ -1120,5 +1120,23 @@ app.add_typer(contacts.app, name="contacts")
 app.add_typer(convert.app, name="convert")
 
 
+def run() -> None:
+    """Console entry point.
+
+    Runs the Typer app and reports any GWSError that escapes a command as JSON
+    error output, exiting with the error's exit code.
+    """
+    try:
+        app()
+    except GWSError as e:
+        output_error(
+            error_code=e.error_code,
+            operation=e.operation or "gws",
+            message=e.message,
+            details=e.details,
+        )
+        raise SystemExit(e.exit_code)
+
+
 if __name__ == "__main__":
-    app()
+    run()
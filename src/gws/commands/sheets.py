@@ -1054,10 +1054,14 @@ def create_filter_view(
 @app.command("list-filter-views")
 def list_filter_views(
     spreadsheet_id: Annotated[str, typer.Argument(help="Spreadsheet ID.")],
+    max_results: Annotated[
+        Optional[int],
+        typer.Option("--max", "-n", help="Maximum filter views to return (count stays the total)."),
+    ] = None,
 ) -> None:
     """List all filter views in a spreadsheet."""
     service = SheetsService()
-    service.list_filter_views(spreadsheet_id=spreadsheet_id)
+    service.list_filter_views(spreadsheet_id=spreadsheet_id, max_results=max_results)
 
 
 @app.command("delete-filter-view")
@@ -1263,6 +1267,15 @@ def list_named_ranges(
     service.list_named_ranges(spreadsheet_id=spreadsheet_id)
 
 
+@app.command("list-all")
+def list_all(
+    spreadsheet_id: Annotated[str, typer.Argument(help="Spreadsheet ID.")],
+) -> None:
+    """List pivot tables, protected ranges and named ranges together."""
+    service = SheetsService()
+    service.list_all(spreadsheet_id=spreadsheet_id)
+
+
 @app.command("delete-named-range")
 def delete_named_range(
     spreadsheet_id: Annotated[str, typer.Argument(help="Spreadsheet ID.")],
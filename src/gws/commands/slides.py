@@ -36,6 +36,17 @@ def read_presentation(
     service.read(presentation_id=presentation_id, page_object_id=page_id)
 
 
+@app.command("read-pages")
+def read_pages(
+    presentation_id: Annotated[str, typer.Argument(help="Presentation ID.")],
+    page_ids: Annotated[str, typer.Argument(help="Comma-separated page/slide object IDs to read.")],
+) -> None:
+    """Read several slides in one batch request."""
+    page_id_list = [p.strip() for p in page_ids.split(",") if p.strip()]
+    service = SlidesService()
+    service.read_pages(presentation_id=presentation_id, page_object_ids=page_id_list)
+
+
 @app.command("create")
 def create_presentation(
     title: Annotated[str, typer.Argument(help="Presentation title.")],
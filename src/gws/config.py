@@ -76,8 +76,9 @@ class Config:
         "sheets": [
             "metadata", "read", "batch-get", "list-filter-views",
             "list-pivot-tables", "list-protected-ranges", "list-named-ranges",
+            "list-all",
         ],
-        "slides": ["metadata", "read", "get-speaker-notes"],
+        "slides": ["metadata", "read", "read-pages", "get-speaker-notes"],
         "drive": [
             "list", "search", "get", "download", "export", "list-comments",
             "list-revisions", "get-revision", "list-trash", "list-permissions",
@@ -24,35 +24,57 @@ class ExitCode(IntEnum):
 
 
 class GWSError(Exception):
-    """Base exception for GWS CLI."""
+    """Base exception for GWS CLI.
 
-    exit_code = ExitCode.OPERATION_FAILED
+    The CLI entry point reports uncaught GWSErrors as JSON error output using
+    `error_code` and `operation`, then exits with `exit_code`.
+    """
 
-    def __init__(self, message: str, details: str | None = None):
+    exit_code = ExitCode.OPERATION_FAILED
+    error_code = "OPERATION_FAILED"
+
+    def __init__(
+        self,
+        message: str,
+        details: str | None = None,
+        operation: str | None = None,
+    ):
         super().__init__(message)
         self.message = message
         self.details = details
+        self.operation = operation
 
 
 class AuthError(GWSError):
     """Authentication error."""
 
     exit_code = ExitCode.AUTH_ERROR
+    error_code = "AUTH_ERROR"
 
 
 class APIError(GWSError):
     """Google API error."""
 
     exit_code = ExitCode.API_ERROR
+    error_code = "API_ERROR"
 
 
 class InvalidArgsError(GWSError):
     """Invalid arguments error."""
 
     exit_code = ExitCode.INVALID_ARGS
+    error_code = "INVALID_ARGS"
+
+
+class NotFoundError(GWSError):
+    """Requested resource does not exist."""
+
+    exit_code = ExitCode.NOT_FOUND
+    error_code = "NOT_FOUND"
 
 
 class ConfigError(GWSError):
     """Configuration error."""
 
     exit_code = ExitCode.OPERATION_FAILED
+    error_code = "CONFIG_ERROR"
@@ -2,6 +2,7 @@
 
 import json
 import sys
+import threading
 from typing import Any
 
 from prompt_security import output_external_content as _output_external_content
@@ -10,6 +11,11 @@ from prompt_security import generate_markers
 
 from gws.config import Config
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 # Session-scoped security markers — generated once at import time.
 # For CLI tools the human controls the pipeline, so these are defense-in-depth.
 _SESSION_START, _SESSION_END = generate_markers()
@@ -20,9 +26,47 @@ def _get_session_markers() -> tuple[str, str]:
     return _SESSION_START, _SESSION_END
 
 
+# Serializes writes so documents printed from worker threads never interleave.
+_output_lock = threading.Lock()
+
+
+# Datetimes and dataclasses go through `default=str`, as they do with json.dumps.
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Encode data as indented JSON, using orjson when it is installed.
+
+    The result decodes to the same value json.dumps output does, but is not
+    always byte-identical: orjson writes exponents without padding (1e-7 for
+    1e-07) and writes non-finite floats as null where json.dumps writes NaN.
+    Falls back to the stdlib encoder for anything orjson rejects (e.g. integers
+    wider than 64 bits) and for non-ASCII output, so stdout keeps the escaped,
+    encoding-safe form json.dumps produces.
+    """
+    if orjson is not None:
+        try:
+            text = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+        else:
+            if text.isascii():
+                return text
+    return json.dumps(data, indent=2, default=str)
+
+
 def output_json(data: dict[str, Any]) -> None:
     """Output JSON to stdout."""
-    print(json.dumps(data, indent=2, default=str))
+    text = _dumps(data)
+    with _output_lock:
+        print(text)
 
 
 def output_success(operation: str, **kwargs: Any) -> None:
@@ -7,7 +7,7 @@ import shutil
 from pathlib import Path
 from typing import Any
 
-from googleapiclient.discovery import build, Resource
+from googleapiclient.discovery import Resource
 from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
 from googleapiclient.errors import HttpError
 
@@ -32,16 +32,14 @@ class ConvertService(BaseService):
     def docs_service(self) -> Resource:
         """Lazy-load Docs service for document manipulation."""
         if self._docs_service is None:
-            credentials = self.auth_manager.get_credentials()
-            self._docs_service = build("docs", "v1", credentials=credentials)
+            self._docs_service = self._build("docs", "v1")
         return self._docs_service
 
     @property
     def slides_service(self) -> Resource:
         """Lazy-load Slides service for presentation creation."""
         if self._slides_service is None:
-            credentials = self.auth_manager.get_credentials()
-            self._slides_service = build("slides", "v1", credentials=credentials)
+            self._slides_service = self._build("slides", "v1")
         return self._slides_service
 
     def _create_temp_folder(self) -> str:
@@ -1,22 +1,1020 @@
 """Google Sheets service operations."""
 
-from typing import Any
+import functools
+import gzip
+import itertools
+import operator
+import time
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from gws.services.base import BaseService
 import json
-from gws.output import output_success, output_error, output_external_content
-from gws.exceptions import ExitCode
-from gws.utils.colors import parse_hex_color
+from gws.output import output_success, output_external_content
+from gws.exceptions import APIError, GWSError, InvalidArgsError, NotFoundError
+from gws.utils.colors import parse_color_arg
+from gws.utils.json_model import encoded_size
+
+_MERGE_TYPES: frozenset[str] = frozenset({"MERGE_ALL", "MERGE_COLUMNS", "MERGE_ROWS"})
+
+_CONDITION_TYPES: frozenset[str] = frozenset({
+    "NUMBER_GREATER",
+    "NUMBER_GREATER_THAN_EQ",
+    "NUMBER_LESS",
+    "NUMBER_LESS_THAN_EQ",
+    "NUMBER_EQ",
+    "NUMBER_NOT_EQ",
+    "NUMBER_BETWEEN",
+    "NUMBER_NOT_BETWEEN",
+    "TEXT_CONTAINS",
+    "TEXT_NOT_CONTAINS",
+    "TEXT_STARTS_WITH",
+    "TEXT_ENDS_WITH",
+    "TEXT_EQ",
+    "BLANK",
+    "NOT_BLANK",
+    "CUSTOM_FORMULA",
+})
+
+_VALIDATION_TYPES: frozenset[str] = frozenset({
+    "ONE_OF_LIST",
+    "NUMBER_GREATER",
+    "NUMBER_LESS",
+    "NUMBER_EQUAL",
+    "NUMBER_NOT_EQUAL",
+    "NUMBER_GREATER_THAN_EQ",
+    "NUMBER_LESS_THAN_EQ",
+    "NUMBER_BETWEEN",
+    "NUMBER_NOT_BETWEEN",
+    "TEXT_CONTAINS",
+    "TEXT_NOT_CONTAINS",
+    "TEXT_STARTS_WITH",
+    "TEXT_ENDS_WITH",
+    "TEXT_EQ",
+    "TEXT_IS_EMAIL",
+    "TEXT_IS_URL",
+    "DATE_EQ",
+    "DATE_BEFORE",
+    "DATE_AFTER",
+    "DATE_ON_OR_BEFORE",
+    "DATE_ON_OR_AFTER",
+    "DATE_BETWEEN",
+    "DATE_NOT_BETWEEN",
+    "DATE_IS_VALID",
+    "CUSTOM_FORMULA",
+    "BOOLEAN",
+})
+_VALIDATION_TYPES_SORTED: tuple[str, ...] = tuple(sorted(_VALIDATION_TYPES))
+
+_CHART_TYPES: frozenset[str] = frozenset({"LINE", "COLUMN", "BAR", "PIE", "SCATTER", "AREA"})
+_CHART_TYPES_SORTED: tuple[str, ...] = tuple(sorted(_CHART_TYPES))
+
+_DELIMITER_TYPES: frozenset[str] = frozenset({
+    "COMMA", "SEMICOLON", "PERIOD", "SPACE", "CUSTOM", "AUTODETECT",
+})
+_DELIMITER_TYPES_SORTED: tuple[str, ...] = tuple(sorted(_DELIMITER_TYPES))
+
+# Pivot value summarize functions; CUSTOM is left out as it needs a formula.
+_SUMMARIZE_FUNCTIONS: frozenset[str] = frozenset({
+    "SUM", "COUNTA", "COUNT", "COUNTUNIQUE", "AVERAGE", "MAX", "MIN",
+    "MEDIAN", "PRODUCT", "STDEV", "STDEVP", "VAR", "VARP",
+})
+
+# Request types whose effect does not change when applied twice in a row.
+_IDEMPOTENT_REQUESTS: frozenset[str] = frozenset({
+    "repeatCell",
+    "trimWhitespace",
+    "updateBanding",
+    "updateBorders",
+    "updateChartSpec",
+    "updateDimensionProperties",
+    "updateFilterView",
+    "updateSheetProperties",
+})
+
+# Case-folded lookups that map user input straight to the canonical API value.
+_MERGE_CANON: dict[str, str] = {t.lower(): t for t in _MERGE_TYPES}
+_CONDITION_CANON: dict[str, str] = {t.lower(): t for t in _CONDITION_TYPES}
+
+# Field masks for the metadata listers. Protected and named ranges share one
+# mask so listing both costs a single (cached) GET.
+_RANGES_FIELDS = (
+    "namedRanges(namedRangeId,name,range),sheets(properties(sheetId,title),protectedRanges)"
+)
+# Pivot tables are read from their anchor cells; only the parts the listing
+# reports are requested, not criteria, filter specs or value layout.
+_PIVOT_CELL_FIELDS = "data(rowData(values(pivotTable(source,rows,columns,values))))"
+_PIVOT_FIELDS = f"sheets(properties(sheetId,title),{_PIVOT_CELL_FIELDS})"
+# Union of the two masks above, so list_all() takes one round trip.
+_INVENTORY_FIELDS = (
+    "namedRanges(namedRangeId,name,range),"
+    f"sheets(properties(sheetId,title),protectedRanges,{_PIVOT_CELL_FIELDS})"
+)
+
+# add_banding palette when no colors are given: blue header, white/light-gray bands.
+_DEFAULT_BANDING_COLORS: dict[str, tuple[float, float, float]] = {
+    "headerColor": (0.26, 0.52, 0.96),
+    "firstBandColor": (1.0, 1.0, 1.0),
+    "secondBandColor": (0.95, 0.95, 0.95),
+}
+
+# (sheetId, title) from a sheet's properties in one call.
+_sheet_id_and_title = operator.itemgetter("sheetId", "title")
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _api_error(operation: str) -> Callable[[_F], _F]:
+    """Convert Google API HttpErrors raised by the wrapped method into APIError.
+
+    GWSErrors raised without an operation (e.g. by the shared range helpers)
+    are tagged with this one on the way out.
+
+    Args:
+        operation: Operation name reported with the error (e.g. "sheets.merge_cells").
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except HttpError as e:
+                raise APIError(
+                    f"Google Sheets API error: {e.reason}",
+                    operation=operation,
+                ) from e
+            except GWSError as e:
+                if e.operation is None:
+                    e.operation = operation
+                raise
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _grid_range(
+    sheet_id: int,
+    start_row: int,
+    end_row: int,
+    start_col: int,
+    end_col: int,
+) -> dict[str, Any]:
+    """Build a GridRange covering rows [start_row, end_row) and columns [start_col, end_col).
+
+    Raises:
+        InvalidArgsError: If an index is negative or a range ends before it starts.
+    """
+    if not (0 <= start_row <= end_row and 0 <= start_col <= end_col):
+        raise InvalidArgsError(
+            f"Invalid range: rows {start_row}-{end_row}, columns {start_col}-{end_col} "
+            "(indices must be non-negative and end must not precede start)"
+        )
+    return {
+        "sheetId": sheet_id,
+        "startRowIndex": start_row,
+        "endRowIndex": end_row,
+        "startColumnIndex": start_col,
+        "endColumnIndex": end_col,
+    }
+
+
+def _open_grid_range(
+    sheet_id: int,
+    start_row: int = 0,
+    end_row: int | None = None,
+    start_col: int = 0,
+    end_col: int | None = None,
+) -> dict[str, Any]:
+    """Build a GridRange whose omitted bounds extend to the edges of the sheet.
+
+    Zero starts and None ends are left out of the request rather than sent,
+    since the API reads a missing bound as the sheet edge.
+
+    Raises:
+        InvalidArgsError: If an index is negative or a range ends before it starts.
+    """
+    if (
+        start_row < 0
+        or start_col < 0
+        or (end_row is not None and end_row < start_row)
+        or (end_col is not None and end_col < start_col)
+    ):
+        raise InvalidArgsError(
+            f"Invalid range: rows {start_row}-{end_row}, columns {start_col}-{end_col} "
+            "(indices must be non-negative and end must not precede start)"
+        )
+    bounds = {
+        "startRowIndex": start_row or None,
+        "endRowIndex": end_row,
+        "startColumnIndex": start_col or None,
+        "endColumnIndex": end_col,
+    }
+    return {"sheetId": sheet_id, **{key: value for key, value in bounds.items() if value is not None}}
+
+
+def _dimension_range(sheet_id: int, dimension: str, start: int, end: int) -> dict[str, Any]:
+    """Build a DimensionRange for ROWS or COLUMNS requests."""
+    return {
+        "sheetId": sheet_id,
+        "dimension": dimension,
+        "startIndex": start,
+        "endIndex": end,
+    }
+
+
+def _dig(value: Any, *path: str | int) -> Any:
+    """Follow `path` through nested dicts and lists, returning None if it breaks.
+
+    A missing key, a short list, or a null along the way all yield None, so
+    callers need no defensive `.get(..., {})` chains.
+    """
+    try:
+        for key in path:
+            value = value[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return value
+
+
+def _first_reply(result: dict[str, Any], *path: str) -> Any:
+    """Return the value at `path` inside the first batchUpdate reply, or None."""
+    return _dig(result, "replies", 0, *path)
+
+
+def _pivot_table_request(
+    source_sheet_id: int,
+    source_start_row: int,
+    source_end_row: int,
+    source_start_col: int,
+    source_end_col: int,
+    target_sheet_id: int,
+    target_row: int,
+    target_col: int,
+    row_source_columns: list[int],
+    value_source_columns: list[int],
+    value_functions: list[str] | None = None,
+    column_source_columns: list[int] | None = None,
+) -> dict[str, Any]:
+    """Build the updateCells request that anchors a pivot table (see create_pivot_table).
+
+    Raises:
+        InvalidArgsError: If the source range is empty, or value_functions is
+            longer than value_source_columns or names an unknown function.
+    """
+    if source_end_row <= source_start_row or source_end_col <= source_start_col:
+        raise InvalidArgsError(
+            f"Pivot source range is empty: rows {source_start_row}-{source_end_row}, "
+            f"columns {source_start_col}-{source_end_col}"
+        )
+    upper_functions = [func.upper() for func in value_functions or ()]
+    if len(upper_functions) > len(value_source_columns):
+        raise InvalidArgsError(
+            f"Got {len(upper_functions)} value functions for "
+            f"{len(value_source_columns)} value columns"
+        )
+    unknown = set(upper_functions) - _SUMMARIZE_FUNCTIONS
+    if unknown:
+        raise InvalidArgsError(
+            f"Unknown summarize functions {sorted(unknown)}; "
+            f"must be one of: {sorted(_SUMMARIZE_FUNCTIONS)}"
+        )
+    # Value columns without a matching function are summed.
+    functions = itertools.chain(upper_functions, itertools.repeat("SUM"))
+    rows = [
+        {"sourceColumnOffset": col_idx, "showTotals": True, "sortOrder": "ASCENDING"}
+        for col_idx in row_source_columns
+    ]
+    values = [
+        {"sourceColumnOffset": col_idx, "summarizeFunction": func}
+        for col_idx, func in zip(value_source_columns, functions)
+    ]
+    columns = [
+        {"sourceColumnOffset": col_idx, "showTotals": True, "sortOrder": "ASCENDING"}
+        for col_idx in column_source_columns or ()
+    ]
+
+    pivot_table: dict[str, Any] = {
+        "source": _grid_range(
+            source_sheet_id,
+            source_start_row,
+            source_end_row,
+            source_start_col,
+            source_end_col,
+        ),
+        "rows": rows,
+        "values": values,
+    }
+    if columns:
+        pivot_table["columns"] = columns
+
+    return {
+        "updateCells": {
+            "rows": [{
+                "values": [{
+                    "pivotTable": pivot_table
+                }]
+            }],
+            "start": {
+                "sheetId": target_sheet_id,
+                "rowIndex": target_row,
+                "columnIndex": target_col,
+            },
+            "fields": "pivotTable",
+        }
+    }
+
+
+def _protected_range_request(
+    sheet_id: int,
+    start_row: int,
+    end_row: int,
+    start_col: int,
+    end_col: int,
+    description: str | None = None,
+    warning_only: bool = False,
+    editors: list[str] | None = None,
+) -> dict[str, Any]:
+    """Build an addProtectedRange request (see protect_range)."""
+    protected_range: dict[str, Any] = {
+        "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+        "warningOnly": warning_only,
+    }
+
+    if description:
+        protected_range["description"] = description
+
+    if editors:
+        protected_range["editors"] = {"users": editors}
+
+    return {"addProtectedRange": {"protectedRange": protected_range}}
+
+
+def _named_range_request(
+    name: str,
+    sheet_id: int,
+    start_row: int,
+    end_row: int,
+    start_col: int,
+    end_col: int,
+) -> dict[str, Any]:
+    """Build an addNamedRange request (see create_named_range)."""
+    return {
+        "addNamedRange": {
+            "namedRange": {
+                "name": name,
+                "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col)
+            }
+        }
+    }
+
+
+def _move_dimension_request(
+    dimension: str,
+    sheet_id: int,
+    source_start: int,
+    source_end: int,
+    destination_index: int,
+) -> dict[str, Any]:
+    """Build a moveDimension request (see move_rows and move_columns)."""
+    return {
+        "moveDimension": {
+            "source": _dimension_range(sheet_id, dimension, source_start, source_end),
+            "destinationIndex": destination_index,
+        }
+    }
+
+
+def _copy_paste_request(
+    source_sheet_id: int,
+    source_start_row: int,
+    source_end_row: int,
+    source_start_col: int,
+    source_end_col: int,
+    dest_sheet_id: int,
+    dest_start_row: int,
+    dest_start_col: int,
+    paste_type: str = "PASTE_NORMAL",
+) -> dict[str, Any]:
+    """Build a copyPaste request with a destination the size of the source (see copy_paste)."""
+    return {
+        "copyPaste": {
+            "source": _grid_range(
+                source_sheet_id,
+                source_start_row,
+                source_end_row,
+                source_start_col,
+                source_end_col,
+            ),
+            "destination": _grid_range(
+                dest_sheet_id,
+                dest_start_row,
+                dest_start_row + (source_end_row - source_start_row),
+                dest_start_col,
+                dest_start_col + (source_end_col - source_start_col),
+            ),
+            "pasteType": paste_type,
+        }
+    }
+
+
+def _auto_fill_request(
+    sheet_id: int,
+    source_start_row: int,
+    source_end_row: int,
+    source_start_col: int,
+    source_end_col: int,
+    fill_start_row: int,
+    fill_end_row: int,
+    fill_start_col: int,
+    fill_end_col: int,
+    use_alternate_series: bool = False,
+) -> dict[str, Any]:
+    """Build an autoFill request (see auto_fill).
+
+    The fill extends the source down when the fill range ends below it, and
+    otherwise to the right.
+
+    Raises:
+        InvalidArgsError: If the fill range does not extend past the source.
+    """
+    row_extent = fill_end_row - source_end_row
+    col_extent = fill_end_col - source_end_col
+    dimension, fill_length = ("ROWS", row_extent) if row_extent > 0 else ("COLUMNS", col_extent)
+    if fill_length <= 0:
+        raise InvalidArgsError(
+            f"Fill range (rows to {fill_end_row}, columns to {fill_end_col}) does not "
+            f"extend past the source (rows to {source_end_row}, columns to {source_end_col})"
+        )
+    return {
+        "autoFill": {
+            "useAlternateSeries": use_alternate_series,
+            "sourceAndDestination": {
+                "source": _grid_range(
+                    sheet_id,
+                    source_start_row,
+                    source_end_row,
+                    source_start_col,
+                    source_end_col,
+                ),
+                "dimension": dimension,
+                "fillLength": fill_length,
+            },
+        }
+    }
+
+
+def _build_requests(
+    operation: str,
+    builder: Callable[..., dict[str, Any]],
+    specs: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Build one request per spec dict by passing it to `builder` as keyword arguments.
+
+    Raises:
+        InvalidArgsError: If `specs` is empty or an entry has missing or unknown keys.
+    """
+    if not specs:
+        raise InvalidArgsError("At least one entry is required", operation=operation)
+    requests = []
+    for index, spec in enumerate(specs):
+        try:
+            requests.append(builder(**spec))
+        except TypeError as e:
+            raise InvalidArgsError(f"Invalid entry {index}: {e}", operation=operation) from e
+    return requests
+
+
+def _repeats_idempotent(queued: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Return True if `new` is an idempotent request identical to `queued`.
+
+    Only back-to-back repeats qualify: an identical request further back may
+    undo a change queued in between.
+    """
+    return queued == new and next(iter(new), None) in _IDEMPOTENT_REQUESTS
+
+
+def _clears_filter_before_set(queued: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Return True if `queued` clears the basic filter that `new` then sets.
+
+    setBasicFilter replaces any existing filter on the sheet, so the clear is
+    redundant and `new` can take its place.
+    """
+    clear = queued.get("clearBasicFilter")
+    set_filter = new.get("setBasicFilter")
+    if clear is None or set_filter is None:
+        return False
+    return clear.get("sheetId") == set_filter["filter"]["range"].get("sheetId")
+
+
+def _flatten_range(grid_range: dict[str, Any]) -> dict[str, Any]:
+    """Map a GridRange to the snake_case keys used in listing output."""
+    return {
+        "sheet_id": grid_range.get("sheetId"),
+        "start_row": grid_range.get("startRowIndex"),
+        "end_row": grid_range.get("endRowIndex"),
+        "start_col": grid_range.get("startColumnIndex"),
+        "end_col": grid_range.get("endColumnIndex"),
+    }
+
+
+def _pivot_table_entries(spreadsheet: dict[str, Any]) -> list[dict[str, Any]]:
+    """Summarize the pivot tables in a spreadsheet fetched with _PIVOT_FIELDS."""
+    # Pivot tables live on their anchor cell; Sheet resources have no
+    # separate pivot table list.
+    pivot_tables = []
+    append = pivot_tables.append
+    for sheet in spreadsheet.get("sheets", []):
+        sheet_id, sheet_title = _sheet_id_and_title(sheet["properties"])
+        for grid in sheet.get("data", []):
+            for row in grid.get("rowData", []):
+                for cell in row.get("values", []):
+                    pivot = cell.get("pivotTable")
+                    if pivot is None:
+                        continue
+                    append({
+                        "sheet_id": sheet_id,
+                        "sheet_title": sheet_title,
+                        "source": pivot.get("source"),
+                        "rows": len(pivot.get("rows", [])),
+                        "columns": len(pivot.get("columns", [])),
+                        "values": len(pivot.get("values", [])),
+                    })
+    return pivot_tables
+
+
+def _protected_range_entries(spreadsheet: dict[str, Any]) -> list[dict[str, Any]]:
+    """Summarize the protected ranges in a spreadsheet fetched with _RANGES_FIELDS."""
+    protected_ranges = []
+    append = protected_ranges.append
+    for sheet in spreadsheet.get("sheets", []):
+        ranges = sheet.get("protectedRanges")
+        if not ranges:
+            continue
+        sheet_id, sheet_title = _sheet_id_and_title(sheet["properties"])
+        for pr in ranges:
+            append({
+                "protected_range_id": pr.get("protectedRangeId"),
+                "description": pr.get("description"),
+                "sheet_id": sheet_id,
+                "sheet_title": sheet_title,
+                "range": pr.get("range"),
+                "warning_only": pr.get("warningOnly", False),
+                "editors": pr.get("editors", {}).get("users", []),
+            })
+    return protected_ranges
+
+
+def _named_range_entries(spreadsheet: dict[str, Any]) -> list[dict[str, Any]]:
+    """Summarize the named ranges in a spreadsheet fetched with _RANGES_FIELDS."""
+    return [
+        {
+            "named_range_id": nr.get("namedRangeId"),
+            "name": nr.get("name"),
+            **_flatten_range(nr.get("range", {})),
+        }
+        for nr in spreadsheet.get("namedRanges", [])
+    ]
+
+
+def _merge_adjacent_validation(queued: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Fold `new` into `queued` when both set the same validation on touching ranges.
+
+    Applying one rule to two adjacent rectangles is the same as applying it to
+    their union, so the pair becomes a single setDataValidation. Only ranges
+    that share a sheet and the full span of the other axis are merged.
+
+    Returns:
+        True if `queued` was widened to cover `new`.
+    """
+    a = queued.get("setDataValidation")
+    b = new.get("setDataValidation")
+    if a is None or b is None or a.get("rule") != b.get("rule"):
+        return False
+    # Formula references are relative to the range's top-left cell, so a
+    # widened range would shift them for the cells that came from `new`.
+    condition = (a.get("rule") or {}).get("condition", {})
+    if any(str(v.get("userEnteredValue", "")).startswith("=") for v in condition.get("values", [])):
+        return False
+    ra, rb = a["range"], b["range"]
+    keys = ("sheetId", "startRowIndex", "endRowIndex", "startColumnIndex", "endColumnIndex")
+    if any(not isinstance(r.get(k), int) for r in (ra, rb) for k in keys):
+        return False
+    if ra["sheetId"] != rb["sheetId"]:
+        return False
+
+    same_rows = (ra["startRowIndex"], ra["endRowIndex"]) == (rb["startRowIndex"], rb["endRowIndex"])
+    same_cols = (ra["startColumnIndex"], ra["endColumnIndex"]) == (
+        rb["startColumnIndex"],
+        rb["endColumnIndex"],
+    )
+    if same_rows and (
+        ra["endColumnIndex"] == rb["startColumnIndex"]
+        or rb["endColumnIndex"] == ra["startColumnIndex"]
+    ):
+        ra["startColumnIndex"] = min(ra["startColumnIndex"], rb["startColumnIndex"])
+        ra["endColumnIndex"] = max(ra["endColumnIndex"], rb["endColumnIndex"])
+        return True
+    if same_cols and (
+        ra["endRowIndex"] == rb["startRowIndex"] or rb["endRowIndex"] == ra["startRowIndex"]
+    ):
+        ra["startRowIndex"] = min(ra["startRowIndex"], rb["startRowIndex"])
+        ra["endRowIndex"] = max(ra["endRowIndex"], rb["endRowIndex"])
+        return True
+    return False
+
+
+class SheetsBatch:
+    """Queue batchUpdate requests for one spreadsheet and send them together.
+
+    Created with SheetsService.batch(). While the context is open, batchable
+    SheetsService methods called for the same spreadsheet queue their requests
+    and return None instead of sending them. On a clean exit the queue is sent
+    as a single batchUpdate and each operation's reply handler runs in call
+    order, emitting the usual success output; handler return values are
+    collected in `results`. If the block raises, queued requests are dropped.
+    Methods validate their arguments before queuing, so a GWSError caught
+    inside the block leaves the rest of the queue intact.
+
+    Any other API call made through the service while requests are queued
+    flushes the queue first, so requests always reach the API in call order.
+
+    Queues longer than SheetsService.MAX_BATCH_REQUESTS requests or
+    MAX_BATCH_BYTES of JSON are sent as several consecutive batchUpdates,
+    split between operations. Each batchUpdate is atomic on its own, but a
+    split queue is not: if a later part fails, earlier parts stay applied.
+
+    A setDataValidation that applies the same rule to a range touching the
+    previously queued one is folded into it, and a setBasicFilter replaces a
+    clearBasicFilter queued just before it for the same sheet. An idempotent
+    update (banding, filter view, formatting, sheet or dimension properties)
+    identical to the request queued just before it is dropped. In each case
+    the later handler receives no replies.
+    """
+
+    __slots__ = ("_service", "spreadsheet_id", "_requests", "_handlers", "results")
+
+    def __init__(self, service: "SheetsService", spreadsheet_id: str):
+        self._service = service
+        self.spreadsheet_id = spreadsheet_id
+        self._requests: list[dict[str, Any]] = []
+        # (number of requests, reply handler) per queued operation
+        self._handlers: list[tuple[int, Callable[[dict[str, Any]], Any]]] = []
+        self.results: list[Any] = []
+
+    def __enter__(self) -> "SheetsBatch":
+        if self._service._batch is not None:
+            raise InvalidArgsError("A batch is already open", operation="sheets.batch")
+        self._service._batch = self
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._service._batch = None
+
+    @property
+    def pending(self) -> int:
+        """Number of queued requests."""
+        return len(self._requests)
+
+    def add(
+        self,
+        requests: list[dict[str, Any]],
+        on_reply: Callable[[dict[str, Any]], Any],
+    ) -> None:
+        """Queue requests with the handler that receives their replies."""
+        if len(requests) == 1 and self._requests:
+            queued, new = self._requests[-1], requests[0]
+            if _clears_filter_before_set(queued, new):
+                self._requests[-1] = new
+                self._handlers.append((0, on_reply))
+                return
+            if _merge_adjacent_validation(queued, new) or _repeats_idempotent(queued, new):
+                self._handlers.append((0, on_reply))
+                return
+        self._requests.extend(requests)
+        self._handlers.append((len(requests), on_reply))
+
+    def flush(self) -> list[Any]:
+        """Send queued requests and run their reply handlers.
+
+        Requests go out as one batchUpdate, or as several when the queue
+        exceeds the service's size limits (see _chunks). Each handler receives
+        a response dict whose `replies` holds only the replies for its own
+        requests.
+
+        Returns:
+            The handler return values for this flush, in call order.
+        """
+        if not self._requests:
+            return []
+        requests, handlers = self._requests, self._handlers
+        self._requests, self._handlers = [], []
+
+        flushed = []
+        for chunk_requests, chunk_handlers in self._chunks(requests, handlers):
+            try:
+                result = self._service._batch_update(self.spreadsheet_id, chunk_requests)
+            except HttpError as e:
+                self.results.extend(flushed)
+                raise APIError(
+                    f"Google Sheets API error: {e.reason}",
+                    operation="sheets.batch",
+                ) from e
+
+            replies = result.get("replies", [])
+            spreadsheet_id = result.get("spreadsheetId", self.spreadsheet_id)
+            offset = 0
+            for count, on_reply in chunk_handlers:
+                flushed.append(on_reply({
+                    "spreadsheetId": spreadsheet_id,
+                    "replies": replies[offset:offset + count],
+                }))
+                offset += count
+        self.results.extend(flushed)
+        return flushed
+
+    def _chunks(
+        self,
+        requests: list[dict[str, Any]],
+        handlers: list[tuple[int, Callable[[dict[str, Any]], Any]]],
+    ) -> Iterator[tuple[list[dict[str, Any]], list[tuple[int, Callable[[dict[str, Any]], Any]]]]]:
+        """Split the queue into batchUpdate-sized (requests, handlers) parts.
+
+        Parts break only between operations, so a multi-request operation is
+        never split. An operation over the limits on its own is sent alone.
+        """
+        max_requests = self._service.MAX_BATCH_REQUESTS
+        max_bytes = self._service.MAX_BATCH_BYTES
+        if len(requests) <= max_requests and encoded_size(requests) <= max_bytes:
+            yield requests, handlers
+            return
+
+        start = end = size = 0
+        part_handlers: list[tuple[int, Callable[[dict[str, Any]], Any]]] = []
+        for count, on_reply in handlers:
+            op_size = encoded_size(requests[end:end + count]) if count else 0
+            if part_handlers and count and (
+                end + count - start > max_requests or size + op_size > max_bytes
+            ):
+                yield requests[start:end], part_handlers
+                start, size, part_handlers = end, 0, []
+            part_handlers.append((count, on_reply))
+            end += count
+            size += op_size
+        yield requests[start:end], part_handlers
 
 
 class SheetsService(BaseService):
     """Google Sheets operations."""
 
+    __slots__ = ("_metadata_cache", "_batch", "_spreadsheets_resource", "_values_resource")
+
     SERVICE_NAME = "sheets"
     VERSION = "v4"
 
+    # Seconds a cached spreadsheet metadata response stays valid.
+    METADATA_CACHE_TTL: float = 5.0
+
+    # batchUpdate bodies at least this many bytes long are sent gzip-compressed.
+    GZIP_MIN_BODY_BYTES: int = 1024
+
+    # A flushed batch() queue is split into several batchUpdates beyond these.
+    MAX_BATCH_REQUESTS: int = 500
+    MAX_BATCH_BYTES: int = 8 * 1024 * 1024
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # spreadsheet_id -> fields mask -> (fetched_at, response)
+        self._metadata_cache: dict[str, dict[str, tuple[float, dict[str, Any]]]] = {}
+        self._batch: SheetsBatch | None = None
+        self._spreadsheets_resource: Any = None
+        self._values_resource: Any = None
+
+    @property
+    def _spreadsheets(self) -> Any:
+        """The spreadsheets() collection, built once per service.
+
+        Each `Resource.spreadsheets()` call constructs a fresh collection object
+        from the discovery document, so hot paths reuse a single instance.
+        """
+        if self._spreadsheets_resource is None:
+            self._spreadsheets_resource = self.service.spreadsheets()
+        return self._spreadsheets_resource
+
+    @property
+    def _values(self) -> Any:
+        """The spreadsheets().values() collection, built once per service."""
+        if self._values_resource is None:
+            self._values_resource = self._spreadsheets.values()
+        return self._values_resource
+
+    def batch(self, spreadsheet_id: str) -> SheetsBatch:
+        """Open a batch that sends queued requests for `spreadsheet_id` as one batchUpdate.
+
+        Usage:
+            with service.batch(spreadsheet_id) as batch:
+                service.sort_range(spreadsheet_id, ...)
+                service.add_banding(spreadsheet_id, ...)
+            batch.results  # one entry per queued operation
+        """
+        return SheetsBatch(self, spreadsheet_id)
+
+    def fan_out(
+        self,
+        method: str,
+        spreadsheet_ids: Iterable[str],
+        *args: Any,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Call one SheetsService method for several spreadsheets concurrently.
+
+        Each call is `getattr(service, method)(spreadsheet_id, *args, **kwargs)`.
+        Worker threads get their own SheetsService, since API clients and their
+        HTTP transports are not thread-safe.
+
+        Args:
+            method: Name of a public SheetsService method taking spreadsheet_id first.
+            spreadsheet_ids: Spreadsheets to run the method against.
+            max_workers: Thread cap (defaults to MAX_PARALLEL_REQUESTS).
+
+        Returns:
+            One entry per spreadsheet, in input order: the method's return value,
+            or the GWSError it raised. A failure for one spreadsheet does not stop
+            the others.
+        """
+        if (
+            method.startswith("_")
+            or method in ("batch", "fan_out", "execute_parallel")
+            or not callable(getattr(self, method, None))
+        ):
+            raise InvalidArgsError(
+                f"Unknown Sheets operation: {method}",
+                operation="sheets.fan_out",
+            )
+        return self._run_parallel(
+            lambda service, spreadsheet_id: getattr(service, method)(
+                spreadsheet_id, *args, **kwargs
+            ),
+            spreadsheet_ids,
+            max_workers,
+        )
+
+    def execute_parallel(
+        self,
+        jobs: Iterable[tuple[str, list[dict[str, Any]]]],
+        max_workers: int | None = None,
+    ) -> list[Any]:
+        """Send one batchUpdate per (spreadsheet_id, requests) job concurrently.
+
+        Unlike fan_out(), each spreadsheet gets its own request list. Nothing is
+        printed; callers get the raw responses. Rate-limited (429) responses are
+        retried with backoff like any other call.
+
+        Args:
+            jobs: (spreadsheet_id, requests) pairs.
+            max_workers: Thread cap (defaults to MAX_PARALLEL_REQUESTS).
+
+        Returns:
+            One entry per job, in input order: the batchUpdate response, or the
+            GWSError it raised.
+        """
+
+        @_api_error("sheets.execute_parallel")
+        def run(service: "SheetsService", job: tuple[str, list[dict[str, Any]]]) -> Any:
+            spreadsheet_id, requests = job
+            return service._batch_update(spreadsheet_id, requests)
+
+        return self._run_parallel(run, jobs, max_workers)
+
+    def execute(self, request: Any) -> Any:
+        """Execute a request, first sending any requests queued in an open batch."""
+        if self._batch is not None and self._batch.pending:
+            self._batch.flush()
+        return super().execute(request)
+
+    def _submit(
+        self,
+        spreadsheet_id: str,
+        requests: list[dict[str, Any]],
+        on_reply: Callable[[dict[str, Any]], Any],
+    ) -> Any:
+        """Send `requests` now, or queue them if a batch is open for the spreadsheet.
+
+        `on_reply` receives the batchUpdate response and its return value is
+        returned. When the requests are queued, None is returned and `on_reply`
+        runs when the batch is flushed.
+        """
+        if self._batch is not None and self._batch.spreadsheet_id == spreadsheet_id:
+            self._batch.add(requests, on_reply)
+            return None
+        return on_reply(self._batch_update(spreadsheet_id, requests))
+
+    def _submit_and_report(
+        self,
+        spreadsheet_id: str,
+        requests: list[dict[str, Any]],
+        operation: str,
+        /,
+        **fields: Any,
+    ) -> dict[str, Any] | None:
+        """_submit() for mutations whose success output needs nothing from the reply.
+
+        Reports `operation` with the spreadsheet ID and `fields` once the
+        requests have been applied, and returns the batchUpdate response (None
+        while queued in a batch).
+        """
+
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            output_success(operation=operation, spreadsheet_id=spreadsheet_id, **fields)
+            return result
+
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    def _get_spreadsheet(self, spreadsheet_id: str, fields: str) -> dict[str, Any]:
+        """Fetch spreadsheet metadata restricted to `fields`, reusing recent responses.
+
+        Entries expire after METADATA_CACHE_TTL seconds. Mutations issued through
+        _batch_update() refresh them from the batchUpdate response. Requests
+        queued in an open batch are sent first, so the response reflects them.
+        """
+        if self._batch is not None and self._batch.pending:
+            self._batch.flush()
+        entries = self._metadata_cache.setdefault(spreadsheet_id, {})
+        cached = entries.get(fields)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.METADATA_CACHE_TTL:
+            return cached[1]
+
+        spreadsheet: dict[str, Any] = self.execute(
+            self._spreadsheets
+            .get(spreadsheetId=spreadsheet_id, fields=fields)
+        )
+        entries[fields] = (now, spreadsheet)
+        return spreadsheet
+
+    def _batch_update(self, spreadsheet_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send a batchUpdate, keeping cached metadata for the spreadsheet current.
+
+        The response is limited to the spreadsheet ID and per-request replies.
+        When metadata for the spreadsheet is cached, the updated spreadsheet is
+        also requested back (restricted to the field masks of unexpired entries)
+        and stored in place, so later lookups skip the follow-up GET. Expired
+        entries are dropped rather than refreshed. On failure the cached entries
+        are dropped.
+        """
+        now = time.monotonic()
+        masks = [
+            mask
+            for mask, (fetched_at, _) in self._metadata_cache.pop(spreadsheet_id, {}).items()
+            if now - fetched_at < self.METADATA_CACHE_TTL
+        ]
+        body: dict[str, Any] = {
+            "requests": requests,
+            "includeSpreadsheetInResponse": bool(masks),
+            "responseIncludeGridData": False,
+        }
+        fields = "spreadsheetId,replies"
+        if masks:
+            fields += f",updatedSpreadsheet({','.join(masks)})"
+
+        result: dict[str, Any] = self.execute(
+            self._gzip_body(
+                self._spreadsheets
+                .batchUpdate(spreadsheetId=spreadsheet_id, body=body, fields=fields)
+            )
+        )
+
+        updated = result.pop("updatedSpreadsheet", None)
+        if masks and updated is not None:
+            now = time.monotonic()
+            self._metadata_cache[spreadsheet_id] = {mask: (now, updated) for mask in masks}
+        return result
+
+    def _gzip_body(self, request: HttpRequest) -> HttpRequest:
+        """Compress a large request body in place and mark it Content-Encoding: gzip.
+
+        Long validation lists and multi-series charts produce bodies that
+        shrink several-fold; level 1 keeps the CPU cost negligible. Small
+        bodies are left alone since the gzip header outweighs the saving.
+        """
+        body = request.body
+        if not isinstance(body, (str, bytes)) or len(body) < self.GZIP_MIN_BODY_BYTES:
+            return request
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        request.body = gzip.compress(body, compresslevel=1)
+        request.body_size = len(request.body)
+        request.headers["content-encoding"] = "gzip"
+        return request
+
     def _unescape_text(self, text: str) -> str:
         """Remove unnecessary escape sequences from text.
 
@@ -25,44 +1023,58 @@ class SheetsService(BaseService):
         """
         return text.replace("\\!", "!")
 
+    @_api_error("sheets.metadata")
     def metadata(self, spreadsheet_id: str) -> dict[str, Any]:
         """Get spreadsheet metadata."""
-        try:
-            spreadsheet = self.execute(
-                self.service.spreadsheets()
-                .get(
-                    spreadsheetId=spreadsheet_id,
-                    fields="spreadsheetId,properties,sheets(properties)",
-                )
-            )
-
-            sheets = [
-                {
-                    "title": sheet["properties"]["title"],
-                    "sheet_id": sheet["properties"]["sheetId"],
-                    "index": sheet["properties"]["index"],
-                    "row_count": sheet["properties"]["gridProperties"]["rowCount"],
-                    "column_count": sheet["properties"]["gridProperties"]["columnCount"],
-                }
-                for sheet in spreadsheet.get("sheets", [])
-            ]
-
-            output_success(
-                operation="sheets.metadata",
-                spreadsheet_id=spreadsheet_id,
-                title=spreadsheet.get("properties", {}).get("title", ""),
-                sheets=sheets,
-                sheet_count=len(sheets),
-            )
-            return spreadsheet
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.metadata",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        spreadsheet = self.execute(
+            self._spreadsheets
+            .get(
+                spreadsheetId=spreadsheet_id,
+                fields="spreadsheetId,properties,sheets(properties)",
+            )
+        )
+
+        sheets = [
+            {
+                "title": sheet["properties"]["title"],
+                "sheet_id": sheet["properties"]["sheetId"],
+                "index": sheet["properties"]["index"],
+                "row_count": sheet["properties"]["gridProperties"]["rowCount"],
+                "column_count": sheet["properties"]["gridProperties"]["columnCount"],
+            }
+            for sheet in spreadsheet.get("sheets", [])
+        ]
+
+        output_success(
+            operation="sheets.metadata",
+            spreadsheet_id=spreadsheet_id,
+            title=spreadsheet.get("properties", {}).get("title", ""),
+            sheets=sheets,
+            sheet_count=len(sheets),
+        )
+        return spreadsheet
+
+    @_api_error("sheets.get_sheet_id")
+    def get_sheet_id(self, spreadsheet_id: str, title: str) -> int:
+        """Return the numeric ID of the sheet named `title`.
+
+        Lookups share the metadata cache, so resolving several names in one
+        run costs a single GET, and sheets added or removed through this
+        service are picked up from the batchUpdate response. Nothing is printed.
+
+        Raises:
+            NotFoundError: If no sheet has that title.
+        """
+        spreadsheet = self._get_spreadsheet(
+            spreadsheet_id, fields="sheets(properties(sheetId,title))"
+        )
+        for sheet in spreadsheet.get("sheets", []):
+            sheet_id, sheet_title = _sheet_id_and_title(sheet["properties"])
+            if sheet_title == title:
+                return sheet_id
+        raise NotFoundError(f"Sheet {title!r} not found")
+
+    @_api_error("sheets.read")
     def read(
         self,
         spreadsheet_id: str,
@@ -79,62 +1091,53 @@ class SheetsService(BaseService):
                 - UNFORMATTED_VALUE: Raw values without formatting
                 - FORMULA: The formulas in cells (not computed values)
         """
-        try:
-            # Unescape shell-escaped characters in range
-            if range_notation:
-                range_notation = self._unescape_text(range_notation)
-            if range_notation:
-                result = self.execute(
-                    self.service.spreadsheets()
-                    .values()
-                    .get(
-                        spreadsheetId=spreadsheet_id,
-                        range=range_notation,
-                        valueRenderOption=value_render_option,
-                    )
-                )
-            else:
-                # Get all data from first sheet
-                spreadsheet = self.execute(
-                    self.service.spreadsheets()
-                    .get(
-                        spreadsheetId=spreadsheet_id,
-                        fields="sheets(properties(title))",
-                    )
+        # Unescape shell-escaped characters in range
+        if range_notation:
+            range_notation = self._unescape_text(range_notation)
+        if range_notation:
+            result = self.execute(
+                self._values
+                .get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_notation,
+                    valueRenderOption=value_render_option,
                 )
-                first_sheet = spreadsheet["sheets"][0]["properties"]["title"]
-                result = self.execute(
-                    self.service.spreadsheets()
-                    .values()
-                    .get(
-                        spreadsheetId=spreadsheet_id,
-                        range=first_sheet,
-                        valueRenderOption=value_render_option,
-                    )
+            )
+        else:
+            # Get all data from first sheet
+            spreadsheet = self.execute(
+                self._spreadsheets
+                .get(
+                    spreadsheetId=spreadsheet_id,
+                    fields="sheets(properties(title))",
                 )
-
-            values = result.get("values", [])
-            # Wrap cell values as JSON string for security scanning
-            output_external_content(
-                operation="sheets.read",
-                source_type="spreadsheet",
-                source_id=spreadsheet_id,
-                content_fields={
-                    "values": json.dumps(values),
-                },
-                spreadsheet_id=spreadsheet_id,
-                range=result.get("range", range_notation),
-                row_count=len(values),
             )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.read",
-                message=f"Google Sheets API error: {e.reason}",
+            first_sheet = spreadsheet["sheets"][0]["properties"]["title"]
+            result = self.execute(
+                self._values
+                .get(
+                    spreadsheetId=spreadsheet_id,
+                    range=first_sheet,
+                    valueRenderOption=value_render_option,
+                )
             )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        values = result.get("values", [])
+        # Wrap cell values as JSON string for security scanning
+        output_external_content(
+            operation="sheets.read",
+            source_type="spreadsheet",
+            source_id=spreadsheet_id,
+            content_fields={
+                "values": json.dumps(values),
+            },
+            spreadsheet_id=spreadsheet_id,
+            range=result.get("range", range_notation),
+            row_count=len(values),
+        )
+        return result
+
+    @_api_error("sheets.create")
     def create(
         self,
         title: str,
@@ -142,53 +1145,46 @@ class SheetsService(BaseService):
         folder_id: str | None = None,
     ) -> dict[str, Any]:
         """Create a new spreadsheet."""
-        try:
-            body: dict[str, Any] = {"properties": {"title": title}}
+        body: dict[str, Any] = {"properties": {"title": title}}
 
-            if sheet_titles:
-                body["sheets"] = [
-                    {"properties": {"title": sheet_title}}
-                    for sheet_title in sheet_titles
-                ]
+        if sheet_titles:
+            body["sheets"] = [
+                {"properties": {"title": sheet_title}}
+                for sheet_title in sheet_titles
+            ]
 
-            spreadsheet = self.execute(
-                self.service.spreadsheets().create(body=body)
-            )
-            spreadsheet_id = spreadsheet["spreadsheetId"]
-
-            # Move to folder if specified
-            if folder_id:
-                file = self.execute(
-                    self.drive_service.files().get(
-                        fileId=spreadsheet_id, fields="parents"
-                    )
-                )
-                previous_parents = ",".join(file.get("parents", []))
-
-                self.execute(
-                    self.drive_service.files().update(
-                        fileId=spreadsheet_id,
-                        addParents=folder_id,
-                        removeParents=previous_parents,
-                        fields="id, parents",
-                    )
-                )
+        spreadsheet = self.execute(
+            self._spreadsheets.create(body=body)
+        )
+        spreadsheet_id = spreadsheet["spreadsheetId"]
 
-            output_success(
-                operation="sheets.create",
-                spreadsheet_id=spreadsheet_id,
-                title=title,
-                web_view_link=f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit",
+        # Move to folder if specified
+        if folder_id:
+            file = self.execute(
+                self.drive_service.files().get(
+                    fileId=spreadsheet_id, fields="parents"
+                )
             )
-            return spreadsheet
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.create",
-                message=f"Google Sheets API error: {e.reason}",
+            previous_parents = ",".join(file.get("parents", []))
+
+            self.execute(
+                self.drive_service.files().update(
+                    fileId=spreadsheet_id,
+                    addParents=folder_id,
+                    removeParents=previous_parents,
+                    fields="id, parents",
+                )
             )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        output_success(
+            operation="sheets.create",
+            spreadsheet_id=spreadsheet_id,
+            title=title,
+            web_view_link=f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit",
+        )
+        return spreadsheet
+
+    @_api_error("sheets.write")
     def write(
         self,
         spreadsheet_id: str,
@@ -197,38 +1193,30 @@ class SheetsService(BaseService):
         input_option: str = "USER_ENTERED",
     ) -> dict[str, Any]:
         """Write values to a spreadsheet."""
-        try:
-            # Unescape shell-escaped characters in range
-            range_notation = self._unescape_text(range_notation)
-            body = {"values": values}
-            result = self.execute(
-                self.service.spreadsheets()
-                .values()
-                .update(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_notation,
-                    valueInputOption=input_option,
-                    body=body,
-                )
-            )
-
-            output_success(
-                operation="sheets.write",
-                spreadsheet_id=spreadsheet_id,
-                range=result.get("updatedRange"),
-                updated_rows=result.get("updatedRows", 0),
-                updated_columns=result.get("updatedColumns", 0),
-                updated_cells=result.get("updatedCells", 0),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.write",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        # Unescape shell-escaped characters in range
+        range_notation = self._unescape_text(range_notation)
+        body = {"values": values}
+        result = self.execute(
+            self._values
+            .update(
+                spreadsheetId=spreadsheet_id,
+                range=range_notation,
+                valueInputOption=input_option,
+                body=body,
+            )
+        )
+
+        output_success(
+            operation="sheets.write",
+            spreadsheet_id=spreadsheet_id,
+            range=result.get("updatedRange"),
+            updated_rows=result.get("updatedRows", 0),
+            updated_columns=result.get("updatedColumns", 0),
+            updated_cells=result.get("updatedCells", 0),
+        )
+        return result
+
+    @_api_error("sheets.append")
     def append(
         self,
         spreadsheet_id: str,
@@ -237,92 +1225,70 @@ class SheetsService(BaseService):
         input_option: str = "USER_ENTERED",
     ) -> dict[str, Any]:
         """Append values to a spreadsheet."""
-        try:
-            # Unescape shell-escaped characters in range
-            range_notation = self._unescape_text(range_notation)
-            body = {"values": values}
-            result = self.execute(
-                self.service.spreadsheets()
-                .values()
-                .append(
-                    spreadsheetId=spreadsheet_id,
-                    range=range_notation,
-                    valueInputOption=input_option,
-                    insertDataOption="INSERT_ROWS",
-                    body=body,
-                )
-            )
-
-            updates = result.get("updates", {})
-            output_success(
-                operation="sheets.append",
-                spreadsheet_id=spreadsheet_id,
-                range=updates.get("updatedRange"),
-                updated_rows=updates.get("updatedRows", 0),
-                updated_cells=updates.get("updatedCells", 0),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.append",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        # Unescape shell-escaped characters in range
+        range_notation = self._unescape_text(range_notation)
+        body = {"values": values}
+        result = self.execute(
+            self._values
+            .append(
+                spreadsheetId=spreadsheet_id,
+                range=range_notation,
+                valueInputOption=input_option,
+                insertDataOption="INSERT_ROWS",
+                body=body,
+            )
+        )
+
+        updates = result.get("updates", {})
+        output_success(
+            operation="sheets.append",
+            spreadsheet_id=spreadsheet_id,
+            range=updates.get("updatedRange"),
+            updated_rows=updates.get("updatedRows", 0),
+            updated_cells=updates.get("updatedCells", 0),
+        )
+        return result
+
+    @_api_error("sheets.clear")
     def clear(
         self,
         spreadsheet_id: str,
         range_notation: str,
     ) -> dict[str, Any]:
         """Clear values from a range."""
-        try:
-            # Unescape shell-escaped characters in range
-            range_notation = self._unescape_text(range_notation)
-            result = self.execute(
-                self.service.spreadsheets()
-                .values()
-                .clear(spreadsheetId=spreadsheet_id, range=range_notation, body={})
-            )
-
-            output_success(
-                operation="sheets.clear",
-                spreadsheet_id=spreadsheet_id,
-                cleared_range=result.get("clearedRange"),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.clear",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        # Unescape shell-escaped characters in range
+        range_notation = self._unescape_text(range_notation)
+        result = self.execute(
+            self._values
+            .clear(spreadsheetId=spreadsheet_id, range=range_notation, body={})
+        )
+
+        output_success(
+            operation="sheets.clear",
+            spreadsheet_id=spreadsheet_id,
+            cleared_range=result.get("clearedRange"),
+        )
+        return result
+
+    @_api_error("sheets.add_sheet")
     def add_sheet(
         self,
         spreadsheet_id: str,
         title: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Add a new sheet to the spreadsheet."""
-        try:
-            requests = [
-                {
-                    "addSheet": {
-                        "properties": {
-                            "title": title,
-                        }
+        requests = [
+            {
+                "addSheet": {
+                    "properties": {
+                        "title": title,
                     }
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
-            reply = result.get("replies", [{}])[0]
-            sheet_id = reply.get("addSheet", {}).get("properties", {}).get("sheetId")
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            sheet_id = _first_reply(result, "addSheet", "properties", "sheetId")
 
             output_success(
                 operation="sheets.add_sheet",
@@ -331,82 +1297,54 @@ class SheetsService(BaseService):
                 sheet_id=sheet_id,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.add_sheet",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.delete_sheet")
     def delete_sheet(
         self,
         spreadsheet_id: str,
         sheet_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a sheet from the spreadsheet."""
-        try:
-            requests = [{"deleteSheet": {"sheetId": sheet_id}}]
+        requests = [{"deleteSheet": {"sheetId": sheet_id}}]
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.delete_sheet",
-                spreadsheet_id=spreadsheet_id,
-                deleted_sheet_id=sheet_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_sheet",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_sheet",
+            deleted_sheet_id=sheet_id,
+        )
 
+    @_api_error("sheets.rename_sheet")
     def rename_sheet(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         new_title: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Rename a sheet."""
-        try:
-            requests = [
-                {
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id,
-                            "title": new_title,
-                        },
-                        "fields": "title",
-                    }
+        requests = [
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheet_id,
+                        "title": new_title,
+                    },
+                    "fields": "title",
                 }
-            ]
+            }
+        ]
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.rename_sheet",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                new_title=new_title,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.rename_sheet",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.rename_sheet",
+            sheet_id=sheet_id,
+            new_title=new_title,
+        )
 
+    @_api_error("sheets.format")
     def format_cells(
         self,
         spreadsheet_id: str,
@@ -420,122 +1358,94 @@ class SheetsService(BaseService):
         font_size: int | None = None,
         background_color: str | None = None,
         foreground_color: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Apply formatting to a cell range."""
-        try:
-            cell_format: dict[str, Any] = {}
-            fields = []
-
-            if bold is not None or italic is not None or font_size is not None:
-                text_format: dict[str, Any] = {}
-                if bold is not None:
-                    text_format["bold"] = bold
-                    fields.append("userEnteredFormat.textFormat.bold")
-                if italic is not None:
-                    text_format["italic"] = italic
-                    fields.append("userEnteredFormat.textFormat.italic")
-                if font_size is not None:
-                    text_format["fontSize"] = font_size
-                    fields.append("userEnteredFormat.textFormat.fontSize")
-                cell_format["textFormat"] = text_format
-
-            if background_color is not None:
-                rgb = parse_hex_color(background_color)
-                cell_format["backgroundColor"] = rgb
-                fields.append("userEnteredFormat.backgroundColor")
-
-            if foreground_color is not None:
-                rgb = parse_hex_color(foreground_color)
-                if "textFormat" not in cell_format:
-                    cell_format["textFormat"] = {}
-                cell_format["textFormat"]["foregroundColor"] = rgb
-                fields.append("userEnteredFormat.textFormat.foregroundColor")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.format",
-                    message="At least one formatting option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        cell_format: dict[str, Any] = {}
+        fields = []
 
-            requests = [
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "cell": {"userEnteredFormat": cell_format},
-                        "fields": ",".join(fields),
-                    }
-                }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.format",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-                formatting=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
+        if bold is not None or italic is not None or font_size is not None:
+            text_format: dict[str, Any] = {}
+            if bold is not None:
+                text_format["bold"] = bold
+                fields.append("userEnteredFormat.textFormat.bold")
+            if italic is not None:
+                text_format["italic"] = italic
+                fields.append("userEnteredFormat.textFormat.italic")
+            if font_size is not None:
+                text_format["fontSize"] = font_size
+                fields.append("userEnteredFormat.textFormat.fontSize")
+            cell_format["textFormat"] = text_format
+
+        if background_color is not None:
+            rgb = parse_color_arg(background_color)
+            cell_format["backgroundColor"] = rgb
+            fields.append("userEnteredFormat.backgroundColor")
+
+        if foreground_color is not None:
+            rgb = parse_color_arg(foreground_color)
+            if "textFormat" not in cell_format:
+                cell_format["textFormat"] = {}
+            cell_format["textFormat"]["foregroundColor"] = rgb
+            fields.append("userEnteredFormat.textFormat.foregroundColor")
+
+        if not fields:
+            raise InvalidArgsError(
+                "At least one formatting option required",
                 operation="sheets.format",
-                message=f"Google Sheets API error: {e.reason}",
             )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        requests = [
+            {
+                "repeatCell": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    "cell": {"userEnteredFormat": cell_format},
+                    "fields": ",".join(fields),
+                }
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.format",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+            formatting=fields,
+        )
+
+    @_api_error("sheets.batch_get")
     def batch_get(
         self,
         spreadsheet_id: str,
         ranges: list[str],
     ) -> dict[str, Any]:
         """Read multiple ranges at once."""
-        try:
-            # Unescape shell-escaped characters in all ranges
-            ranges = [self._unescape_text(r) for r in ranges]
-            result = self.execute(
-                self.service.spreadsheets()
-                .values()
-                .batchGet(spreadsheetId=spreadsheet_id, ranges=ranges)
-            )
-
-            value_ranges = result.get("valueRanges", [])
-            output_data = [
-                {
-                    "range": vr.get("range"),
-                    "values": vr.get("values", []),
-                }
-                for vr in value_ranges
-            ]
-
-            output_success(
-                operation="sheets.batch_get",
-                spreadsheet_id=spreadsheet_id,
-                ranges_requested=len(ranges),
-                ranges_returned=len(value_ranges),
-                data=output_data,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.batch_get",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        # Unescape shell-escaped characters in all ranges
+        ranges = [self._unescape_text(r) for r in ranges]
+        result = self.execute(
+            self._values
+            .batchGet(spreadsheetId=spreadsheet_id, ranges=ranges)
+        )
+
+        value_ranges = result.get("valueRanges", [])
+        output_data = [
+            {
+                "range": vr.get("range"),
+                "values": vr.get("values", []),
+            }
+            for vr in value_ranges
+        ]
+
+        output_success(
+            operation="sheets.batch_get",
+            spreadsheet_id=spreadsheet_id,
+            ranges_requested=len(ranges),
+            ranges_returned=len(value_ranges),
+            data=output_data,
+        )
+        return result
+
+    @_api_error("sheets.format_extended")
     def format_cells_extended(
         self,
         spreadsheet_id: str,
@@ -556,7 +1466,7 @@ class SheetsService(BaseService):
         vertical_alignment: str | None = None,
         text_wrap: str | None = None,
         number_format: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Apply extended formatting to a cell range.
 
         Args:
@@ -579,134 +1489,111 @@ class SheetsService(BaseService):
             text_wrap: Wrap strategy (OVERFLOW_CELL, CLIP, WRAP).
             number_format: Number format pattern (e.g., "#,##0.00", "0%").
         """
-        try:
-            cell_format: dict[str, Any] = {}
-            fields = []
-
-            # Text formatting
-            text_format: dict[str, Any] = {}
-            if bold is not None:
-                text_format["bold"] = bold
-                fields.append("userEnteredFormat.textFormat.bold")
-            if italic is not None:
-                text_format["italic"] = italic
-                fields.append("userEnteredFormat.textFormat.italic")
-            if underline is not None:
-                text_format["underline"] = underline
-                fields.append("userEnteredFormat.textFormat.underline")
-            if strikethrough is not None:
-                text_format["strikethrough"] = strikethrough
-                fields.append("userEnteredFormat.textFormat.strikethrough")
-            if font_family is not None:
-                text_format["fontFamily"] = font_family
-                fields.append("userEnteredFormat.textFormat.fontFamily")
-            if font_size is not None:
-                text_format["fontSize"] = font_size
-                fields.append("userEnteredFormat.textFormat.fontSize")
-            if foreground_color is not None:
-                rgb = parse_hex_color(foreground_color)
-                text_format["foregroundColor"] = rgb
-                fields.append("userEnteredFormat.textFormat.foregroundColor")
-            if text_format:
-                cell_format["textFormat"] = text_format
-
-            # Background color
-            if background_color is not None:
-                rgb = parse_hex_color(background_color)
-                cell_format["backgroundColor"] = rgb
-                fields.append("userEnteredFormat.backgroundColor")
-
-            # Alignment
-            if horizontal_alignment is not None:
-                valid = {"LEFT", "CENTER", "RIGHT"}
-                if horizontal_alignment.upper() not in valid:
-                    output_error(
-                        error_code="INVALID_ARGS",
-                        operation="sheets.format_extended",
-                        message=f"horizontal_alignment must be one of: {valid}",
-                    )
-                    raise SystemExit(ExitCode.INVALID_ARGS)
-                cell_format["horizontalAlignment"] = horizontal_alignment.upper()
-                fields.append("userEnteredFormat.horizontalAlignment")
-
-            if vertical_alignment is not None:
-                valid = {"TOP", "MIDDLE", "BOTTOM"}
-                if vertical_alignment.upper() not in valid:
-                    output_error(
-                        error_code="INVALID_ARGS",
-                        operation="sheets.format_extended",
-                        message=f"vertical_alignment must be one of: {valid}",
-                    )
-                    raise SystemExit(ExitCode.INVALID_ARGS)
-                cell_format["verticalAlignment"] = vertical_alignment.upper()
-                fields.append("userEnteredFormat.verticalAlignment")
-
-            # Text wrap
-            if text_wrap is not None:
-                valid = {"OVERFLOW_CELL", "CLIP", "WRAP"}
-                if text_wrap.upper() not in valid:
-                    output_error(
-                        error_code="INVALID_ARGS",
-                        operation="sheets.format_extended",
-                        message=f"text_wrap must be one of: {valid}",
-                    )
-                    raise SystemExit(ExitCode.INVALID_ARGS)
-                cell_format["wrapStrategy"] = text_wrap.upper()
-                fields.append("userEnteredFormat.wrapStrategy")
-
-            # Number format
-            if number_format is not None:
-                cell_format["numberFormat"] = {
-                    "type": "NUMBER",
-                    "pattern": number_format,
-                }
-                fields.append("userEnteredFormat.numberFormat")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
+        cell_format: dict[str, Any] = {}
+        fields = []
+
+        # Text formatting
+        text_format: dict[str, Any] = {}
+        if bold is not None:
+            text_format["bold"] = bold
+            fields.append("userEnteredFormat.textFormat.bold")
+        if italic is not None:
+            text_format["italic"] = italic
+            fields.append("userEnteredFormat.textFormat.italic")
+        if underline is not None:
+            text_format["underline"] = underline
+            fields.append("userEnteredFormat.textFormat.underline")
+        if strikethrough is not None:
+            text_format["strikethrough"] = strikethrough
+            fields.append("userEnteredFormat.textFormat.strikethrough")
+        if font_family is not None:
+            text_format["fontFamily"] = font_family
+            fields.append("userEnteredFormat.textFormat.fontFamily")
+        if font_size is not None:
+            text_format["fontSize"] = font_size
+            fields.append("userEnteredFormat.textFormat.fontSize")
+        if foreground_color is not None:
+            rgb = parse_color_arg(foreground_color)
+            text_format["foregroundColor"] = rgb
+            fields.append("userEnteredFormat.textFormat.foregroundColor")
+        if text_format:
+            cell_format["textFormat"] = text_format
+
+        # Background color
+        if background_color is not None:
+            rgb = parse_color_arg(background_color)
+            cell_format["backgroundColor"] = rgb
+            fields.append("userEnteredFormat.backgroundColor")
+
+        # Alignment
+        if horizontal_alignment is not None:
+            valid = {"LEFT", "CENTER", "RIGHT"}
+            horizontal_alignment = horizontal_alignment.upper()
+            if horizontal_alignment not in valid:
+                raise InvalidArgsError(
+                    f"horizontal_alignment must be one of: {valid}",
                     operation="sheets.format_extended",
-                    message="At least one formatting option required",
                 )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            requests = [
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "cell": {"userEnteredFormat": cell_format},
-                        "fields": ",".join(fields),
-                    }
-                }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            cell_format["horizontalAlignment"] = horizontal_alignment
+            fields.append("userEnteredFormat.horizontalAlignment")
+
+        if vertical_alignment is not None:
+            valid = {"TOP", "MIDDLE", "BOTTOM"}
+            vertical_alignment = vertical_alignment.upper()
+            if vertical_alignment not in valid:
+                raise InvalidArgsError(
+                    f"vertical_alignment must be one of: {valid}",
+                    operation="sheets.format_extended",
+                )
+            cell_format["verticalAlignment"] = vertical_alignment
+            fields.append("userEnteredFormat.verticalAlignment")
+
+        # Text wrap
+        if text_wrap is not None:
+            valid = {"OVERFLOW_CELL", "CLIP", "WRAP"}
+            text_wrap = text_wrap.upper()
+            if text_wrap not in valid:
+                raise InvalidArgsError(
+                    f"text_wrap must be one of: {valid}",
+                    operation="sheets.format_extended",
+                )
+            cell_format["wrapStrategy"] = text_wrap
+            fields.append("userEnteredFormat.wrapStrategy")
+
+        # Number format
+        if number_format is not None:
+            cell_format["numberFormat"] = {
+                "type": "NUMBER",
+                "pattern": number_format,
+            }
+            fields.append("userEnteredFormat.numberFormat")
 
-            output_success(
+        if not fields:
+            raise InvalidArgsError(
+                "At least one formatting option required",
                 operation="sheets.format_extended",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-                formatting=fields,
             )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.format_extended",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        requests = [
+            {
+                "repeatCell": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    "cell": {"userEnteredFormat": cell_format},
+                    "fields": ",".join(fields),
+                }
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.format_extended",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+            formatting=fields,
+        )
+
+    @_api_error("sheets.set_borders")
     def set_borders(
         self,
         spreadsheet_id: str,
@@ -724,7 +1611,7 @@ class SheetsService(BaseService):
         color: str = "#000000",
         style: str = "SOLID",
         width: int = 1,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set borders on a cell range.
 
         Args:
@@ -744,83 +1631,62 @@ class SheetsService(BaseService):
             style: Border style (SOLID, DOTTED, DASHED, SOLID_MEDIUM, SOLID_THICK, DOUBLE).
             width: Border width (1, 2, or 3).
         """
-        try:
-            valid_styles = {
-                "SOLID",
-                "DOTTED",
-                "DASHED",
-                "SOLID_MEDIUM",
-                "SOLID_THICK",
-                "DOUBLE",
-            }
-            if style.upper() not in valid_styles:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.set_borders",
-                    message=f"style must be one of: {valid_styles}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            rgb = parse_hex_color(color)
-            border_style = {
-                "style": style.upper(),
-                "width": width,
-                "color": rgb,
-            }
-
-            update_borders: dict[str, Any] = {
-                "range": {
-                    "sheetId": sheet_id,
-                    "startRowIndex": start_row,
-                    "endRowIndex": end_row,
-                    "startColumnIndex": start_col,
-                    "endColumnIndex": end_col,
-                },
-            }
-
-            if top:
-                update_borders["top"] = border_style
-            if bottom:
-                update_borders["bottom"] = border_style
-            if left:
-                update_borders["left"] = border_style
-            if right:
-                update_borders["right"] = border_style
-            if inner_horizontal:
-                update_borders["innerHorizontal"] = border_style
-            if inner_vertical:
-                update_borders["innerVertical"] = border_style
-
-            if not any([top, bottom, left, right, inner_horizontal, inner_vertical]):
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.set_borders",
-                    message="At least one border side required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            requests = [{"updateBorders": update_borders}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
+        valid_styles = {
+            "SOLID",
+            "DOTTED",
+            "DASHED",
+            "SOLID_MEDIUM",
+            "SOLID_THICK",
+            "DOUBLE",
+        }
+        style = style.upper()
+        if style not in valid_styles:
+            raise InvalidArgsError(
+                f"style must be one of: {valid_styles}",
                 operation="sheets.set_borders",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
             )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
+
+        rgb = parse_color_arg(color)
+        border_style = {
+            "style": style,
+            "width": width,
+            "color": rgb,
+        }
+
+        update_borders: dict[str, Any] = {
+            "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+        }
+
+        if top:
+            update_borders["top"] = border_style
+        if bottom:
+            update_borders["bottom"] = border_style
+        if left:
+            update_borders["left"] = border_style
+        if right:
+            update_borders["right"] = border_style
+        if inner_horizontal:
+            update_borders["innerHorizontal"] = border_style
+        if inner_vertical:
+            update_borders["innerVertical"] = border_style
+
+        if not any([top, bottom, left, right, inner_horizontal, inner_vertical]):
+            raise InvalidArgsError(
+                "At least one border side required",
                 operation="sheets.set_borders",
-                message=f"Google Sheets API error: {e.reason}",
             )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        requests = [{"updateBorders": update_borders}]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.set_borders",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+        )
+
+    @_api_error("sheets.merge_cells")
     def merge_cells(
         self,
         spreadsheet_id: str,
@@ -830,7 +1696,7 @@ class SheetsService(BaseService):
         start_col: int,
         end_col: int,
         merge_type: str = "MERGE_ALL",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Merge cells in a range.
 
         Args:
@@ -842,52 +1708,32 @@ class SheetsService(BaseService):
             end_col: End column index (exclusive).
             merge_type: Type of merge (MERGE_ALL, MERGE_COLUMNS, MERGE_ROWS).
         """
-        try:
-            valid_types = {"MERGE_ALL", "MERGE_COLUMNS", "MERGE_ROWS"}
-            if merge_type.upper() not in valid_types:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.merge_cells",
-                    message=f"merge_type must be one of: {valid_types}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            requests = [
-                {
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "mergeType": merge_type.upper(),
-                    }
-                }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.merge_cells",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-                merge_type=merge_type.upper(),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
+        mt = _MERGE_CANON.get(merge_type.lower())
+        if mt is None:
+            raise InvalidArgsError(
+                f"merge_type must be one of: {sorted(_MERGE_TYPES)}",
                 operation="sheets.merge_cells",
-                message=f"Google Sheets API error: {e.reason}",
             )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        requests = [
+            {
+                "mergeCells": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    "mergeType": mt,
+                }
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.merge_cells",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+            merge_type=mt,
+        )
+
+    @_api_error("sheets.unmerge_cells")
     def unmerge_cells(
         self,
         spreadsheet_id: str,
@@ -896,7 +1742,7 @@ class SheetsService(BaseService):
         end_row: int,
         start_col: int,
         end_col: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Unmerge cells in a range.
 
         Args:
@@ -907,41 +1753,23 @@ class SheetsService(BaseService):
             start_col: Start column index (0-based).
             end_col: End column index (exclusive).
         """
-        try:
-            requests = [
-                {
-                    "unmergeCells": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                    }
+        requests = [
+            {
+                "unmergeCells": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
                 }
-            ]
+            }
+        ]
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.unmerge_cells",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.unmerge_cells",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.unmerge_cells",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+        )
 
+    @_api_error("sheets.set_column_width")
     def set_column_width(
         self,
         spreadsheet_id: str,
@@ -949,53 +1777,36 @@ class SheetsService(BaseService):
         start_column: int,
         end_column: int,
         width: int,
-    ) -> dict[str, Any]:
-        """Set column width.
-
-        Args:
-            spreadsheet_id: The spreadsheet ID.
-            sheet_id: The sheet ID (numeric).
-            start_column: Start column index (0-based).
-            end_column: End column index (exclusive).
-            width: Width in pixels.
-        """
-        try:
-            requests = [
-                {
-                    "updateDimensionProperties": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_column,
-                            "endIndex": end_column,
-                        },
-                        "properties": {"pixelSize": width},
-                        "fields": "pixelSize",
-                    }
-                }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.set_column_width",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                columns=f"{start_column}-{end_column}",
-                width=width,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.set_column_width",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+    ) -> dict[str, Any] | None:
+        """Set column width.
 
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            sheet_id: The sheet ID (numeric).
+            start_column: Start column index (0-based).
+            end_column: End column index (exclusive).
+            width: Width in pixels.
+        """
+        requests = [
+            {
+                "updateDimensionProperties": {
+                    "range": _dimension_range(sheet_id, "COLUMNS", start_column, end_column),
+                    "properties": {"pixelSize": width},
+                    "fields": "pixelSize",
+                }
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.set_column_width",
+            sheet_id=sheet_id,
+            columns=f"{start_column}-{end_column}",
+            width=width,
+        )
+
+    @_api_error("sheets.set_row_height")
     def set_row_height(
         self,
         spreadsheet_id: str,
@@ -1003,7 +1814,7 @@ class SheetsService(BaseService):
         start_row: int,
         end_row: int,
         height: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set row height.
 
         Args:
@@ -1013,50 +1824,33 @@ class SheetsService(BaseService):
             end_row: End row index (exclusive).
             height: Height in pixels.
         """
-        try:
-            requests = [
-                {
-                    "updateDimensionProperties": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "ROWS",
-                            "startIndex": start_row,
-                            "endIndex": end_row,
-                        },
-                        "properties": {"pixelSize": height},
-                        "fields": "pixelSize",
-                    }
+        requests = [
+            {
+                "updateDimensionProperties": {
+                    "range": _dimension_range(sheet_id, "ROWS", start_row, end_row),
+                    "properties": {"pixelSize": height},
+                    "fields": "pixelSize",
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.set_row_height",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                rows=f"{start_row}-{end_row}",
-                height=height,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.set_row_height",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.set_row_height",
+            sheet_id=sheet_id,
+            rows=f"{start_row}-{end_row}",
+            height=height,
+        )
+
+    @_api_error("sheets.auto_resize_columns")
     def auto_resize_columns(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         start_column: int,
         end_column: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Auto-resize columns to fit content.
 
         Args:
@@ -1065,46 +1859,29 @@ class SheetsService(BaseService):
             start_column: Start column index (0-based).
             end_column: End column index (exclusive).
         """
-        try:
-            requests = [
-                {
-                    "autoResizeDimensions": {
-                        "dimensions": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_column,
-                            "endIndex": end_column,
-                        },
-                    }
+        requests = [
+            {
+                "autoResizeDimensions": {
+                    "dimensions": _dimension_range(sheet_id, "COLUMNS", start_column, end_column),
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
-            output_success(
-                operation="sheets.auto_resize_columns",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                columns=f"{start_column}-{end_column}",
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.auto_resize_columns",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.auto_resize_columns",
+            sheet_id=sheet_id,
+            columns=f"{start_column}-{end_column}",
+        )
 
+    @_api_error("sheets.freeze_rows")
     def freeze_rows(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         num_rows: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Freeze rows at the top of the sheet.
 
         Args:
@@ -1112,45 +1889,33 @@ class SheetsService(BaseService):
             sheet_id: The sheet ID (numeric).
             num_rows: Number of rows to freeze (0 to unfreeze).
         """
-        try:
-            requests = [
-                {
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id,
-                            "gridProperties": {"frozenRowCount": num_rows},
-                        },
-                        "fields": "gridProperties.frozenRowCount",
-                    }
+        requests = [
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheet_id,
+                        "gridProperties": {"frozenRowCount": num_rows},
+                    },
+                    "fields": "gridProperties.frozenRowCount",
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
-            output_success(
-                operation="sheets.freeze_rows",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                frozen_rows=num_rows,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.freeze_rows",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.freeze_rows",
+            sheet_id=sheet_id,
+            frozen_rows=num_rows,
+        )
 
+    @_api_error("sheets.freeze_columns")
     def freeze_columns(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         num_columns: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Freeze columns at the left of the sheet.
 
         Args:
@@ -1158,39 +1923,27 @@ class SheetsService(BaseService):
             sheet_id: The sheet ID (numeric).
             num_columns: Number of columns to freeze (0 to unfreeze).
         """
-        try:
-            requests = [
-                {
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id,
-                            "gridProperties": {"frozenColumnCount": num_columns},
-                        },
-                        "fields": "gridProperties.frozenColumnCount",
-                    }
+        requests = [
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheet_id,
+                        "gridProperties": {"frozenColumnCount": num_columns},
+                    },
+                    "fields": "gridProperties.frozenColumnCount",
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
-            output_success(
-                operation="sheets.freeze_columns",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                frozen_columns=num_columns,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.freeze_columns",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.freeze_columns",
+            sheet_id=sheet_id,
+            frozen_columns=num_columns,
+        )
 
+    @_api_error("sheets.add_conditional_format")
     def add_conditional_format(
         self,
         spreadsheet_id: str,
@@ -1204,7 +1957,7 @@ class SheetsService(BaseService):
         background_color: str | None = None,
         foreground_color: str | None = None,
         bold: bool | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Add a conditional formatting rule.
 
         Args:
@@ -1221,108 +1974,64 @@ class SheetsService(BaseService):
             foreground_color: Text color when condition is met (hex).
             bold: Bold text when condition is met.
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            valid_types = {
-                "NUMBER_GREATER",
-                "NUMBER_GREATER_THAN_EQ",
-                "NUMBER_LESS",
-                "NUMBER_LESS_THAN_EQ",
-                "NUMBER_EQ",
-                "NUMBER_NOT_EQ",
-                "NUMBER_BETWEEN",
-                "NUMBER_NOT_BETWEEN",
-                "TEXT_CONTAINS",
-                "TEXT_NOT_CONTAINS",
-                "TEXT_STARTS_WITH",
-                "TEXT_ENDS_WITH",
-                "TEXT_EQ",
-                "BLANK",
-                "NOT_BLANK",
-                "CUSTOM_FORMULA",
-            }
-            if condition_type.upper() not in valid_types:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.add_conditional_format",
-                    message=f"condition_type must be one of: {valid_types}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            # Build format
-            cell_format: dict[str, Any] = {}
-            if background_color is not None:
-                rgb = parse_hex_color(background_color)
-                cell_format["backgroundColor"] = rgb
-            if foreground_color is not None or bold is not None:
-                text_format: dict[str, Any] = {}
-                if foreground_color is not None:
-                    rgb = parse_hex_color(foreground_color)
-                    text_format["foregroundColor"] = rgb
-                if bold is not None:
-                    text_format["bold"] = bold
-                cell_format["textFormat"] = text_format
-
-            if not cell_format:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.add_conditional_format",
-                    message="At least one format option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        ct = _CONDITION_CANON.get(condition_type.lower())
+        if ct is None:
+            raise InvalidArgsError(
+                f"condition_type must be one of: {sorted(_CONDITION_TYPES)}",
+                operation="sheets.add_conditional_format",
+            )
 
-            # Build condition values
-            condition_value_objs = [
-                {"userEnteredValue": v} for v in condition_values
-            ]
+        # Build format
+        cell_format: dict[str, Any] = {}
+        if background_color is not None:
+            rgb = parse_color_arg(background_color)
+            cell_format["backgroundColor"] = rgb
+        if foreground_color is not None or bold is not None:
+            text_format: dict[str, Any] = {}
+            if foreground_color is not None:
+                rgb = parse_color_arg(foreground_color)
+                text_format["foregroundColor"] = rgb
+            if bold is not None:
+                text_format["bold"] = bold
+            cell_format["textFormat"] = text_format
 
-            requests = [
-                {
-                    "addConditionalFormatRule": {
-                        "rule": {
-                            "ranges": [
-                                {
-                                    "sheetId": sheet_id,
-                                    "startRowIndex": start_row,
-                                    "endRowIndex": end_row,
-                                    "startColumnIndex": start_col,
-                                    "endColumnIndex": end_col,
-                                }
-                            ],
-                            "booleanRule": {
-                                "condition": {
-                                    "type": condition_type.upper(),
-                                    "values": condition_value_objs,
-                                },
-                                "format": cell_format,
+        if not cell_format:
+            raise InvalidArgsError(
+                "At least one format option required",
+                operation="sheets.add_conditional_format",
+            )
+
+        requests = [
+            {
+                "addConditionalFormatRule": {
+                    "rule": {
+                        "ranges": [
+                            _grid_range(sheet_id, start_row, end_row, start_col, end_col)
+                        ],
+                        "booleanRule": {
+                            "condition": {
+                                "type": ct,
+                                "values": [
+                                    {"userEnteredValue": v} for v in condition_values
+                                ],
                             },
+                            "format": cell_format,
                         },
-                        "index": 0,
-                    }
+                    },
+                    "index": 0,
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
-            output_success(
-                operation="sheets.add_conditional_format",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                condition_type=condition_type.upper(),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.add_conditional_format",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.add_conditional_format",
+            sheet_id=sheet_id,
+            condition_type=ct,
+        )
 
+    @_api_error("sheets.add_color_scale")
     def add_color_scale(
         self,
         spreadsheet_id: str,
@@ -1334,7 +2043,7 @@ class SheetsService(BaseService):
         min_color: str,
         max_color: str,
         mid_color: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Add a color scale conditional formatting rule.
 
         Args:
@@ -1348,143 +2057,103 @@ class SheetsService(BaseService):
             max_color: Color for maximum values (hex).
             mid_color: Color for midpoint values (hex, optional).
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            gradient_rule: dict[str, Any] = {
-                "minpoint": {
-                    "type": "MIN",
-                    "color": parse_hex_color(min_color),
-                },
-                "maxpoint": {
-                    "type": "MAX",
-                    "color": parse_hex_color(max_color),
-                },
+        gradient_rule: dict[str, Any] = {
+            "minpoint": {
+                "type": "MIN",
+                "color": parse_color_arg(min_color),
+            },
+            "maxpoint": {
+                "type": "MAX",
+                "color": parse_color_arg(max_color),
+            },
+        }
+
+        if mid_color is not None:
+            gradient_rule["midpoint"] = {
+                "type": "PERCENTILE",
+                "value": "50",
+                "color": parse_color_arg(mid_color),
             }
 
-            if mid_color is not None:
-                gradient_rule["midpoint"] = {
-                    "type": "PERCENTILE",
-                    "value": "50",
-                    "color": parse_hex_color(mid_color),
-                }
-
-            requests = [
-                {
-                    "addConditionalFormatRule": {
-                        "rule": {
-                            "ranges": [
-                                {
-                                    "sheetId": sheet_id,
-                                    "startRowIndex": start_row,
-                                    "endRowIndex": end_row,
-                                    "startColumnIndex": start_col,
-                                    "endColumnIndex": end_col,
-                                }
-                            ],
-                            "gradientRule": gradient_rule,
-                        },
-                        "index": 0,
-                    }
+        requests = [
+            {
+                "addConditionalFormatRule": {
+                    "rule": {
+                        "ranges": [
+                            _grid_range(sheet_id, start_row, end_row, start_col, end_col)
+                        ],
+                        "gradientRule": gradient_rule,
+                    },
+                    "index": 0,
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.add_color_scale",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                min_color=min_color,
-                max_color=max_color,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.add_color_scale",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.add_color_scale",
+            sheet_id=sheet_id,
+            min_color=min_color,
+            max_color=max_color,
+        )
+
+    @_api_error("sheets.clear_conditional_formats")
     def clear_conditional_formats(
         self,
         spreadsheet_id: str,
         sheet_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Clear all conditional formatting rules from a sheet.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             sheet_id: The sheet ID (numeric).
         """
-        try:
-            # First, get the spreadsheet to find all conditional format rules
-            spreadsheet = self.execute(
-                self.service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
-            )
-
-            # Find the sheet
-            sheet = None
-            for s in spreadsheet.get("sheets", []):
-                if s["properties"]["sheetId"] == sheet_id:
-                    sheet = s
-                    break
-
-            if sheet is None:
-                output_error(
-                    error_code="NOT_FOUND",
-                    operation="sheets.clear_conditional_formats",
-                    message=f"Sheet with ID {sheet_id} not found",
-                )
-                raise SystemExit(ExitCode.NOT_FOUND)
-
-            conditional_formats = sheet.get("conditionalFormats", [])
-            if not conditional_formats:
-                output_success(
-                    operation="sheets.clear_conditional_formats",
-                    spreadsheet_id=spreadsheet_id,
-                    sheet_id=sheet_id,
-                    rules_cleared=0,
-                )
-                return {"cleared": 0}
-
-            # Delete rules from highest index to lowest
-            requests = []
-            for i in range(len(conditional_formats) - 1, -1, -1):
-                requests.append(
-                    {
-                        "deleteConditionalFormatRule": {
-                            "sheetId": sheet_id,
-                            "index": i,
-                        }
-                    }
-                )
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
+        # First, get the spreadsheet to find all conditional format rules
+        spreadsheet = self._get_spreadsheet(
+            spreadsheet_id,
+            fields="sheets(properties(sheetId),conditionalFormats)",
+        )
+
+        # Find the sheet
+        sheet = None
+        for s in spreadsheet.get("sheets", []):
+            if s["properties"]["sheetId"] == sheet_id:
+                sheet = s
+                break
+
+        if sheet is None:
+            raise NotFoundError(
+                f"Sheet with ID {sheet_id} not found",
+                operation="sheets.clear_conditional_formats",
             )
 
+        conditional_formats = sheet.get("conditionalFormats", [])
+        if not conditional_formats:
             output_success(
                 operation="sheets.clear_conditional_formats",
                 spreadsheet_id=spreadsheet_id,
                 sheet_id=sheet_id,
-                rules_cleared=len(conditional_formats),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.clear_conditional_formats",
-                message=f"Google Sheets API error: {e.reason}",
+                rules_cleared=0,
             )
-            raise SystemExit(ExitCode.API_ERROR)
+            return {"cleared": 0}
 
+        # Delete rules from highest index to lowest
+        requests = [
+            {"deleteConditionalFormatRule": {"sheetId": sheet_id, "index": i}}
+            for i in range(len(conditional_formats) - 1, -1, -1)
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.clear_conditional_formats",
+            sheet_id=sheet_id,
+            rules_cleared=len(conditional_formats),
+        )
+
+    @_api_error("sheets.insert_rows")
     def insert_rows(
         self,
         spreadsheet_id: str,
@@ -1492,7 +2161,7 @@ class SheetsService(BaseService):
         start_index: int,
         count: int,
         inherit_from_before: bool = True,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Insert rows at a specific index.
 
         Args:
@@ -1502,42 +2171,25 @@ class SheetsService(BaseService):
             count: Number of rows to insert.
             inherit_from_before: If True, new rows inherit formatting from row above.
         """
-        try:
-            requests = [
-                {
-                    "insertDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "ROWS",
-                            "startIndex": start_index,
-                            "endIndex": start_index + count,
-                        },
-                        "inheritFromBefore": inherit_from_before,
-                    }
+        requests = [
+            {
+                "insertDimension": {
+                    "range": _dimension_range(sheet_id, "ROWS", start_index, start_index + count),
+                    "inheritFromBefore": inherit_from_before,
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.insert_rows",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                start_index=start_index,
-                count=count,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.insert_rows",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.insert_rows",
+            sheet_id=sheet_id,
+            start_index=start_index,
+            count=count,
+        )
+
+    @_api_error("sheets.insert_columns")
     def insert_columns(
         self,
         spreadsheet_id: str,
@@ -1545,7 +2197,7 @@ class SheetsService(BaseService):
         start_index: int,
         count: int,
         inherit_from_before: bool = True,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Insert columns at a specific index.
 
         Args:
@@ -1555,49 +2207,32 @@ class SheetsService(BaseService):
             count: Number of columns to insert.
             inherit_from_before: If True, new columns inherit formatting from column to the left.
         """
-        try:
-            requests = [
-                {
-                    "insertDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_index,
-                            "endIndex": start_index + count,
-                        },
-                        "inheritFromBefore": inherit_from_before,
-                    }
+        requests = [
+            {
+                "insertDimension": {
+                    "range": _dimension_range(sheet_id, "COLUMNS", start_index, start_index + count),
+                    "inheritFromBefore": inherit_from_before,
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.insert_columns",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                start_index=start_index,
-                count=count,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.insert_columns",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.insert_columns",
+            sheet_id=sheet_id,
+            start_index=start_index,
+            count=count,
+        )
+
+    @_api_error("sheets.delete_rows")
     def delete_rows(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         start_index: int,
         end_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete rows in a range.
 
         Args:
@@ -1606,49 +2241,32 @@ class SheetsService(BaseService):
             start_index: Start row index (0-based).
             end_index: End row index (exclusive).
         """
-        try:
-            requests = [
-                {
-                    "deleteDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "ROWS",
-                            "startIndex": start_index,
-                            "endIndex": end_index,
-                        },
-                    }
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": _dimension_range(sheet_id, "ROWS", start_index, end_index),
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.delete_rows",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                start_index=start_index,
-                end_index=end_index,
-                deleted_count=end_index - start_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_rows",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_rows",
+            sheet_id=sheet_id,
+            start_index=start_index,
+            end_index=end_index,
+            deleted_count=end_index - start_index,
+        )
+
+    @_api_error("sheets.delete_columns")
     def delete_columns(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         start_index: int,
         end_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete columns in a range.
 
         Args:
@@ -1657,42 +2275,25 @@ class SheetsService(BaseService):
             start_index: Start column index (0-based).
             end_index: End column index (exclusive).
         """
-        try:
-            requests = [
-                {
-                    "deleteDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_index,
-                            "endIndex": end_index,
-                        },
-                    }
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": _dimension_range(sheet_id, "COLUMNS", start_index, end_index),
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.delete_columns",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                start_index=start_index,
-                end_index=end_index,
-                deleted_count=end_index - start_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_columns",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_columns",
+            sheet_id=sheet_id,
+            start_index=start_index,
+            end_index=end_index,
+            deleted_count=end_index - start_index,
+        )
+
+    @_api_error("sheets.sort_range")
     def sort_range(
         self,
         spreadsheet_id: str,
@@ -1703,7 +2304,7 @@ class SheetsService(BaseService):
         end_col: int,
         sort_column: int,
         ascending: bool = True,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Sort a range by a column.
 
         Args:
@@ -1711,54 +2312,36 @@ class SheetsService(BaseService):
             sheet_id: The sheet ID (numeric).
             start_row: Start row index (0-based).
             end_row: End row index (exclusive).
-            start_col: Start column index (0-based).
-            end_col: End column index (exclusive).
-            sort_column: Column index to sort by (0-based).
-            ascending: Sort ascending if True, descending if False.
-        """
-        try:
-            requests = [
-                {
-                    "sortRange": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "sortSpecs": [
-                            {
-                                "dimensionIndex": sort_column,
-                                "sortOrder": "ASCENDING" if ascending else "DESCENDING",
-                            }
-                        ],
-                    }
-                }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.sort_range",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-                sort_column=sort_column,
-                ascending=ascending,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.sort_range",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            start_col: Start column index (0-based).
+            end_col: End column index (exclusive).
+            sort_column: Column index to sort by (0-based).
+            ascending: Sort ascending if True, descending if False.
+        """
+        requests = [
+            {
+                "sortRange": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    "sortSpecs": [
+                        {
+                            "dimensionIndex": sort_column,
+                            "sortOrder": "ASCENDING" if ascending else "DESCENDING",
+                        }
+                    ],
+                }
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.sort_range",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+            sort_column=sort_column,
+            ascending=ascending,
+        )
+
+    @_api_error("sheets.find_replace")
     def find_replace(
         self,
         spreadsheet_id: str,
@@ -1769,7 +2352,7 @@ class SheetsService(BaseService):
         match_case: bool = False,
         match_entire_cell: bool = False,
         use_regex: bool = False,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Find and replace text in a spreadsheet.
 
         Args:
@@ -1782,32 +2365,26 @@ class SheetsService(BaseService):
             match_entire_cell: Match entire cell content only.
             use_regex: Treat find as a regular expression.
         """
-        try:
-            find_replace_request: dict[str, Any] = {
-                "find": find,
-                "replacement": replace,
-                "matchCase": match_case,
-                "matchEntireCell": match_entire_cell,
-                "searchByRegex": use_regex,
-            }
-
-            if all_sheets:
-                find_replace_request["allSheets"] = True
-            elif sheet_id is not None:
-                find_replace_request["sheetId"] = sheet_id
-            else:
-                find_replace_request["allSheets"] = True
-
-            requests = [{"findReplace": find_replace_request}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
+        find_replace_request: dict[str, Any] = {
+            "find": find,
+            "replacement": replace,
+            "matchCase": match_case,
+            "matchEntireCell": match_entire_cell,
+            "searchByRegex": use_regex,
+        }
+
+        if all_sheets:
+            find_replace_request["allSheets"] = True
+        elif sheet_id is not None:
+            find_replace_request["sheetId"] = sheet_id
+        else:
+            find_replace_request["allSheets"] = True
+
+        requests = [{"findReplace": find_replace_request}]
+
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
             # Extract replacement count from response
-            replies = result.get("replies", [{}])
-            find_replace_response = replies[0].get("findReplace", {})
+            find_replace_response = _first_reply(result, "findReplace") or {}
             occurrences_changed = find_replace_response.get("occurrencesChanged", 0)
             values_changed = find_replace_response.get("valuesChanged", 0)
             sheets_changed = find_replace_response.get("sheetsChanged", 0)
@@ -1822,21 +2399,17 @@ class SheetsService(BaseService):
                 sheets_changed=sheets_changed,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.find_replace",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.duplicate_sheet")
     def duplicate_sheet(
         self,
         spreadsheet_id: str,
         sheet_id: int,
         new_name: str | None = None,
         insert_index: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Duplicate a sheet within the spreadsheet.
 
         Args:
@@ -1845,26 +2418,20 @@ class SheetsService(BaseService):
             new_name: Name for the new sheet (optional).
             insert_index: Position to insert the new sheet (optional).
         """
-        try:
-            duplicate_request: dict[str, Any] = {
-                "sourceSheetId": sheet_id,
-            }
-
-            if new_name is not None:
-                duplicate_request["newSheetName"] = new_name
-            if insert_index is not None:
-                duplicate_request["insertSheetIndex"] = insert_index
+        duplicate_request: dict[str, Any] = {
+            "sourceSheetId": sheet_id,
+        }
 
-            requests = [{"duplicateSheet": duplicate_request}]
+        if new_name is not None:
+            duplicate_request["newSheetName"] = new_name
+        if insert_index is not None:
+            duplicate_request["insertSheetIndex"] = insert_index
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"duplicateSheet": duplicate_request}]
 
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
             # Extract new sheet info from response
-            replies = result.get("replies", [{}])
-            duplicate_response = replies[0].get("duplicateSheet", {}).get("properties", {})
+            duplicate_response = _first_reply(result, "duplicateSheet", "properties") or {}
             new_sheet_id = duplicate_response.get("sheetId")
             new_sheet_title = duplicate_response.get("title")
 
@@ -1876,14 +2443,10 @@ class SheetsService(BaseService):
                 new_sheet_title=new_sheet_title,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.duplicate_sheet",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.set_data_validation")
     def set_data_validation(
         self,
         spreadsheet_id: str,
@@ -1897,7 +2460,7 @@ class SheetsService(BaseService):
         formula: str | None = None,
         strict: bool = True,
         show_dropdown: bool = True,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set data validation on a range.
 
         Args:
@@ -1914,97 +2477,48 @@ class SheetsService(BaseService):
             strict: If True, reject invalid input; if False, show warning.
             show_dropdown: Show dropdown for list validation.
         """
-        try:
-            valid_types = {
-                "ONE_OF_LIST",
-                "NUMBER_GREATER",
-                "NUMBER_LESS",
-                "NUMBER_EQUAL",
-                "NUMBER_NOT_EQUAL",
-                "NUMBER_GREATER_THAN_EQ",
-                "NUMBER_LESS_THAN_EQ",
-                "NUMBER_BETWEEN",
-                "NUMBER_NOT_BETWEEN",
-                "TEXT_CONTAINS",
-                "TEXT_NOT_CONTAINS",
-                "TEXT_STARTS_WITH",
-                "TEXT_ENDS_WITH",
-                "TEXT_EQ",
-                "TEXT_IS_EMAIL",
-                "TEXT_IS_URL",
-                "DATE_EQ",
-                "DATE_BEFORE",
-                "DATE_AFTER",
-                "DATE_ON_OR_BEFORE",
-                "DATE_ON_OR_AFTER",
-                "DATE_BETWEEN",
-                "DATE_NOT_BETWEEN",
-                "DATE_IS_VALID",
-                "CUSTOM_FORMULA",
-                "BOOLEAN",
-            }
-            if validation_type.upper() not in valid_types:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.set_data_validation",
-                    message=f"validation_type must be one of: {sorted(valid_types)}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            # Build condition based on type
-            condition: dict[str, Any] = {"type": validation_type.upper()}
+        validation_type = validation_type.upper()
+        if validation_type not in _VALIDATION_TYPES:
+            raise InvalidArgsError(
+                f"validation_type must be one of: {list(_VALIDATION_TYPES_SORTED)}",
+                operation="sheets.set_data_validation",
+            )
 
-            if validation_type.upper() == "ONE_OF_LIST" and values:
-                condition["values"] = [{"userEnteredValue": v} for v in values]
-            elif validation_type.upper() == "CUSTOM_FORMULA" and formula:
-                condition["values"] = [{"userEnteredValue": formula}]
-            elif values:
-                condition["values"] = [{"userEnteredValue": v} for v in values]
+        # Only CUSTOM_FORMULA takes its value from `formula`; every other type
+        # (ONE_OF_LIST included) passes `values` through unchanged.
+        if validation_type == "CUSTOM_FORMULA" and formula:
+            values = [formula]
+        condition: dict[str, Any] = {"type": validation_type}
+        if values:
+            condition["values"] = [{"userEnteredValue": v} for v in values]
 
-            validation_rule: dict[str, Any] = {
-                "condition": condition,
-                "strict": strict,
-            }
+        validation_rule: dict[str, Any] = {
+            "condition": condition,
+            "strict": strict,
+        }
 
-            if validation_type.upper() == "ONE_OF_LIST":
-                validation_rule["showCustomUi"] = show_dropdown
+        if validation_type == "ONE_OF_LIST":
+            validation_rule["showCustomUi"] = show_dropdown
 
-            requests = [
-                {
-                    "setDataValidation": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "rule": validation_rule,
-                    }
+        requests = [
+            {
+                "setDataValidation": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    "rule": validation_rule,
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.set_data_validation",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-                validation_type=validation_type.upper(),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.set_data_validation",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+            }
+        ]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.set_data_validation",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+            validation_type=validation_type,
+        )
+
+    @_api_error("sheets.clear_data_validation")
     def clear_data_validation(
         self,
         spreadsheet_id: str,
@@ -2013,7 +2527,7 @@ class SheetsService(BaseService):
         end_row: int,
         start_col: int,
         end_col: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Clear data validation from a range.
 
         Args:
@@ -2024,42 +2538,24 @@ class SheetsService(BaseService):
             start_col: Start column index (0-based).
             end_col: End column index (exclusive).
         """
-        try:
-            requests = [
-                {
-                    "setDataValidation": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        # Omitting 'rule' clears validation
-                    }
+        requests = [
+            {
+                "setDataValidation": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                    # Omitting 'rule' clears validation
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
-            output_success(
-                operation="sheets.clear_data_validation",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.clear_data_validation",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.clear_data_validation",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+        )
 
+    @_api_error("sheets.add_chart")
     def add_chart(
         self,
         spreadsheet_id: str,
@@ -2073,7 +2569,7 @@ class SheetsService(BaseService):
         anchor_col: int,
         title: str | None = None,
         legend_position: str = "BOTTOM_LEGEND",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Add a chart to a sheet.
 
         Args:
@@ -2090,115 +2586,91 @@ class SheetsService(BaseService):
             legend_position: Legend position (BOTTOM_LEGEND, LEFT_LEGEND,
                 RIGHT_LEGEND, TOP_LEGEND, NO_LEGEND).
         """
-        try:
-            valid_types = {"LINE", "COLUMN", "BAR", "PIE", "SCATTER", "AREA"}
-            if chart_type.upper() not in valid_types:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="sheets.add_chart",
-                    message=f"chart_type must be one of: {valid_types}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            # Build data range
-            data_range = {
-                "sheetId": sheet_id,
-                "startRowIndex": data_range_start_row,
-                "endRowIndex": data_range_end_row,
-                "startColumnIndex": data_range_start_col,
-                "endColumnIndex": data_range_end_col,
-            }
-
-            # Build chart spec based on type
-            chart_spec: dict[str, Any] = {
-                "title": title or "",
-                "basicChart": {
-                    "chartType": chart_type.upper(),
-                    "legendPosition": legend_position.upper(),
-                    "domains": [{"domain": {"sourceRange": {"sources": [data_range]}}}],
-                    "series": [{"series": {"sourceRange": {"sources": [data_range]}}}],
-                },
-            }
+        chart_type = chart_type.upper()
+        if chart_type not in _CHART_TYPES:
+            raise InvalidArgsError(
+                f"chart_type must be one of: {list(_CHART_TYPES_SORTED)}",
+                operation="sheets.add_chart",
+            )
 
-            requests = [
-                {
-                    "addChart": {
-                        "chart": {
-                            "spec": chart_spec,
-                            "position": {
-                                "overlayPosition": {
-                                    "anchorCell": {
-                                        "sheetId": sheet_id,
-                                        "rowIndex": anchor_row,
-                                        "columnIndex": anchor_col,
-                                    },
-                                    "widthPixels": 600,
-                                    "heightPixels": 400,
-                                }
-                            },
-                        }
+        # Build data range
+        data_range = _grid_range(
+            sheet_id,
+            data_range_start_row,
+            data_range_end_row,
+            data_range_start_col,
+            data_range_end_col,
+        )
+
+        # Build chart spec based on type
+        chart_spec: dict[str, Any] = {
+            "title": title or "",
+            "basicChart": {
+                "chartType": chart_type,
+                "legendPosition": legend_position.upper(),
+                "domains": [{"domain": {"sourceRange": {"sources": [data_range]}}}],
+                "series": [{"series": {"sourceRange": {"sources": [data_range]}}}],
+            },
+        }
+
+        requests = [
+            {
+                "addChart": {
+                    "chart": {
+                        "spec": chart_spec,
+                        "position": {
+                            "overlayPosition": {
+                                "anchorCell": {
+                                    "sheetId": sheet_id,
+                                    "rowIndex": anchor_row,
+                                    "columnIndex": anchor_col,
+                                },
+                                "widthPixels": 600,
+                                "heightPixels": 400,
+                            }
+                        },
                     }
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
             # Extract chart ID from response
-            replies = result.get("replies", [{}])
-            chart_id = replies[0].get("addChart", {}).get("chart", {}).get("chartId")
+            chart_id = _first_reply(result, "addChart", "chart", "chartId")
 
             output_success(
                 operation="sheets.add_chart",
                 spreadsheet_id=spreadsheet_id,
                 sheet_id=sheet_id,
                 chart_id=chart_id,
-                chart_type=chart_type.upper(),
+                chart_type=chart_type,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.add_chart",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.delete_chart")
     def delete_chart(
         self,
         spreadsheet_id: str,
         chart_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a chart from a spreadsheet.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             chart_id: The chart ID to delete.
         """
-        try:
-            requests = [{"deleteEmbeddedObject": {"objectId": chart_id}}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"deleteEmbeddedObject": {"objectId": chart_id}}]
 
-            output_success(
-                operation="sheets.delete_chart",
-                spreadsheet_id=spreadsheet_id,
-                chart_id=chart_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_chart",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_chart",
+            chart_id=chart_id,
+        )
 
+    @_api_error("sheets.add_banding")
     def add_banding(
         self,
         spreadsheet_id: str,
@@ -2210,7 +2682,7 @@ class SheetsService(BaseService):
         header_color: str | None = None,
         first_color: str | None = None,
         second_color: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Add alternating row colors (banding) to a range.
 
         Args:
@@ -2224,51 +2696,36 @@ class SheetsService(BaseService):
             first_color: First alternating color (hex, e.g., '#FFFFFF').
             second_color: Second alternating color (hex, e.g., '#F3F3F3').
         """
-        try:
-            row_properties: dict[str, Any] = {}
-
-            if header_color:
-                row_properties["headerColor"] = parse_hex_color(header_color)
-            if first_color:
-                row_properties["firstBandColor"] = parse_hex_color(first_color)
-            if second_color:
-                row_properties["secondBandColor"] = parse_hex_color(second_color)
-
-            # Use defaults if no colors provided
-            if not row_properties:
-                row_properties = {
-                    "headerColor": {"red": 0.26, "green": 0.52, "blue": 0.96},
-                    "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                    "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
-                }
+        colors = {
+            "headerColor": header_color,
+            "firstBandColor": first_color,
+            "secondBandColor": second_color,
+        }
+        row_properties: dict[str, Any] = {
+            key: parse_color_arg(value) for key, value in colors.items() if value
+        }
+
+        # Use defaults if no colors provided
+        if not row_properties:
+            row_properties = {
+                key: {"red": red, "green": green, "blue": blue}
+                for key, (red, green, blue) in _DEFAULT_BANDING_COLORS.items()
+            }
 
-            requests = [
-                {
-                    "addBanding": {
-                        "bandedRange": {
-                            "range": {
-                                "sheetId": sheet_id,
-                                "startRowIndex": start_row,
-                                "endRowIndex": end_row,
-                                "startColumnIndex": start_col,
-                                "endColumnIndex": end_col,
-                            },
-                            "rowProperties": row_properties,
-                        }
+        requests = [
+            {
+                "addBanding": {
+                    "bandedRange": {
+                        "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                        "rowProperties": row_properties,
                     }
                 }
-            ]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        ]
 
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
             # Extract banded range ID from response
-            replies = result.get("replies", [{}])
-            banded_range_id = (
-                replies[0].get("addBanding", {}).get("bandedRange", {}).get("bandedRangeId")
-            )
+            banded_range_id = _first_reply(result, "addBanding", "bandedRange", "bandedRangeId")
 
             output_success(
                 operation="sheets.add_banding",
@@ -2278,51 +2735,35 @@ class SheetsService(BaseService):
                 banded_range_id=banded_range_id,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.add_banding",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.delete_banding")
     def delete_banding(
         self,
         spreadsheet_id: str,
         banded_range_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a banded range (alternating colors) from a spreadsheet.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             banded_range_id: The banded range ID to delete.
         """
-        try:
-            requests = [{"deleteBanding": {"bandedRangeId": banded_range_id}}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"deleteBanding": {"bandedRangeId": banded_range_id}}]
 
-            output_success(
-                operation="sheets.delete_banding",
-                spreadsheet_id=spreadsheet_id,
-                banded_range_id=banded_range_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_banding",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_banding",
+            banded_range_id=banded_range_id,
+        )
 
     # =========================================================================
     # FILTER OPERATIONS
     # =========================================================================
 
+    @_api_error("sheets.set_basic_filter")
     def set_basic_filter(
         self,
         spreadsheet_id: str,
@@ -2331,7 +2772,7 @@ class SheetsService(BaseService):
         end_row: int,
         start_col: int,
         end_col: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set a basic filter on a range.
 
         Args:
@@ -2342,74 +2783,44 @@ class SheetsService(BaseService):
             start_col: Starting column index (0-indexed).
             end_col: Ending column index (exclusive).
         """
-        try:
-            requests = [{
-                "setBasicFilter": {
-                    "filter": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        }
-                    }
+        requests = [{
+            "setBasicFilter": {
+                "filter": {
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col)
                 }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        }]
 
-            output_success(
-                operation="sheets.set_basic_filter",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.set_basic_filter",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.set_basic_filter",
+            sheet_id=sheet_id,
+            range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+        )
 
+    @_api_error("sheets.clear_basic_filter")
     def clear_basic_filter(
         self,
         spreadsheet_id: str,
         sheet_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Clear the basic filter from a sheet.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             sheet_id: The sheet ID.
         """
-        try:
-            requests = [{"clearBasicFilter": {"sheetId": sheet_id}}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"clearBasicFilter": {"sheetId": sheet_id}}]
 
-            output_success(
-                operation="sheets.clear_basic_filter",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.clear_basic_filter",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.clear_basic_filter",
+            sheet_id=sheet_id,
+        )
 
+    @_api_error("sheets.create_filter_view")
     def create_filter_view(
         self,
         spreadsheet_id: str,
@@ -2419,7 +2830,7 @@ class SheetsService(BaseService):
         end_row: int,
         start_col: int,
         end_col: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Create a named filter view.
 
         Args:
@@ -2431,33 +2842,17 @@ class SheetsService(BaseService):
             start_col: Starting column index (0-indexed).
             end_col: Ending column index (exclusive).
         """
-        try:
-            requests = [{
-                "addFilterView": {
-                    "filter": {
-                        "title": title,
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        }
-                    }
+        requests = [{
+            "addFilterView": {
+                "filter": {
+                    "title": title,
+                    "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col)
                 }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+            }
+        }]
 
-            filter_view_id = (
-                result.get("replies", [{}])[0]
-                .get("addFilterView", {})
-                .get("filter", {})
-                .get("filterViewId")
-            )
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            filter_view_id = _first_reply(result, "addFilterView", "filter", "filterViewId")
 
             output_success(
                 operation="sheets.create_filter_view",
@@ -2467,94 +2862,99 @@ class SheetsService(BaseService):
                 filter_view_id=filter_view_id,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.create_filter_view",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.iter_filter_views")
+    def iter_filter_views(
+        self,
+        spreadsheet_id: str,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the filter views in a spreadsheet without printing output.
+
+        The metadata is fetched before this returns, so API errors surface here;
+        the filter view entries are then produced lazily, sheet by sheet.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+        """
+        return self._iter_filter_views(spreadsheet_id)
+
+    def _iter_filter_views(self, spreadsheet_id: str) -> Iterator[dict[str, Any]]:
+        """Fetch filter view metadata and return a lazy iterator over its entries."""
+        spreadsheet = self._get_spreadsheet(
+            spreadsheet_id,
+            fields="sheets(properties(sheetId,title),filterViews(filterViewId,title,range))",
+        )
+        return (
+            {
+                "filter_view_id": fv.get("filterViewId"),
+                "title": fv.get("title"),
+                "sheet_id": sheet_id,
+                "sheet_title": sheet_title,
+                "range": fv.get("range"),
+            }
+            for sheet in spreadsheet.get("sheets", [])
+            for sheet_id, sheet_title in [_sheet_id_and_title(sheet["properties"])]
+            for fv in sheet.get("filterViews", [])
+        )
+
+    @_api_error("sheets.list_filter_views")
     def list_filter_views(
         self,
         spreadsheet_id: str,
+        max_results: int | None = None,
     ) -> dict[str, Any]:
         """List all filter views in a spreadsheet.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
+            max_results: Only include the first N filter views in the output.
+                `count` still reports the total; entries past the limit are
+                counted without being kept.
         """
-        try:
-            spreadsheet = self.execute(
-                self.service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
-            )
-
-            filter_views = []
-            for sheet in spreadsheet.get("sheets", []):
-                sheet_title = sheet["properties"]["title"]
-                sheet_id = sheet["properties"]["sheetId"]
-                for fv in sheet.get("filterViews", []):
-                    filter_views.append({
-                        "filter_view_id": fv.get("filterViewId"),
-                        "title": fv.get("title"),
-                        "sheet_id": sheet_id,
-                        "sheet_title": sheet_title,
-                        "range": fv.get("range"),
-                    })
-
-            output_success(
-                operation="sheets.list_filter_views",
-                spreadsheet_id=spreadsheet_id,
-                count=len(filter_views),
-                filter_views=filter_views,
-            )
-            return {"filter_views": filter_views}
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.list_filter_views",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        if max_results is not None and max_results < 0:
+            raise InvalidArgsError(
+                "max_results must be non-negative", operation="sheets.list_filter_views"
+            )
+        views = self._iter_filter_views(spreadsheet_id)
+        filter_views = list(itertools.islice(views, max_results))
+        count = len(filter_views) + sum(1 for _ in views)
+
+        output_success(
+            operation="sheets.list_filter_views",
+            spreadsheet_id=spreadsheet_id,
+            count=count,
+            filter_views=filter_views,
+        )
+        return {"filter_views": filter_views}
+
+    @_api_error("sheets.delete_filter_view")
     def delete_filter_view(
         self,
         spreadsheet_id: str,
         filter_view_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a filter view.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             filter_view_id: The filter view ID to delete.
         """
-        try:
-            requests = [{"deleteFilterView": {"filterId": filter_view_id}}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"deleteFilterView": {"filterId": filter_view_id}}]
 
-            output_success(
-                operation="sheets.delete_filter_view",
-                spreadsheet_id=spreadsheet_id,
-                filter_view_id=filter_view_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_filter_view",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_filter_view",
+            filter_view_id=filter_view_id,
+        )
 
     # =========================================================================
     # PIVOT TABLE OPERATIONS
     # =========================================================================
 
+    @_api_error("sheets.create_pivot_table")
     def create_pivot_table(
         self,
         spreadsheet_id: str,
@@ -2570,7 +2970,7 @@ class SheetsService(BaseService):
         value_source_columns: list[int],
         value_functions: list[str] | None = None,
         column_source_columns: list[int] | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Create a pivot table.
 
         Args:
@@ -2588,91 +2988,62 @@ class SheetsService(BaseService):
             value_functions: Aggregation functions (SUM, AVERAGE, COUNT, MAX, MIN, etc.).
             column_source_columns: Optional column indices for column groups.
         """
-        try:
-            if value_functions is None:
-                value_functions = ["SUM"] * len(value_source_columns)
-
-            # Build row groups
-            rows = []
-            for col_idx in row_source_columns:
-                rows.append({
-                    "sourceColumnOffset": col_idx,
-                    "showTotals": True,
-                    "sortOrder": "ASCENDING",
-                })
-
-            # Build values
-            values = []
-            for i, col_idx in enumerate(value_source_columns):
-                func = value_functions[i] if i < len(value_functions) else "SUM"
-                values.append({
-                    "sourceColumnOffset": col_idx,
-                    "summarizeFunction": func.upper(),
-                })
-
-            # Build columns (optional)
-            columns = []
-            if column_source_columns:
-                for col_idx in column_source_columns:
-                    columns.append({
-                        "sourceColumnOffset": col_idx,
-                        "showTotals": True,
-                        "sortOrder": "ASCENDING",
-                    })
+        requests = [_pivot_table_request(
+            source_sheet_id,
+            source_start_row,
+            source_end_row,
+            source_start_col,
+            source_end_col,
+            target_sheet_id,
+            target_row,
+            target_col,
+            row_source_columns,
+            value_source_columns,
+            value_functions,
+            column_source_columns,
+        )]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.create_pivot_table",
+            source_sheet_id=source_sheet_id,
+            target_sheet_id=target_sheet_id,
+            target_location=f"R{target_row}C{target_col}",
+            row_groups=len(row_source_columns),
+            values=len(value_source_columns),
+        )
+
+    @_api_error("sheets.create_pivot_tables")
+    def create_pivot_tables(
+        self,
+        spreadsheet_id: str,
+        specs: list[dict[str, Any]],
+    ) -> dict[str, Any] | None:
+        """Create several pivot tables with a single batchUpdate.
 
-            pivot_table: dict[str, Any] = {
-                "source": {
-                    "sheetId": source_sheet_id,
-                    "startRowIndex": source_start_row,
-                    "endRowIndex": source_end_row,
-                    "startColumnIndex": source_start_col,
-                    "endColumnIndex": source_end_col,
-                },
-                "rows": rows,
-                "values": values,
-            }
-            if columns:
-                pivot_table["columns"] = columns
-
-            requests = [{
-                "updateCells": {
-                    "rows": [{
-                        "values": [{
-                            "pivotTable": pivot_table
-                        }]
-                    }],
-                    "start": {
-                        "sheetId": target_sheet_id,
-                        "rowIndex": target_row,
-                        "columnIndex": target_col,
-                    },
-                    "fields": "pivotTable",
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            specs: One dict per pivot table, holding the create_pivot_table
+                keyword arguments (everything except spreadsheet_id).
+        """
+        requests = _build_requests("sheets.create_pivot_tables", _pivot_table_request, specs)
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.create_pivot_tables",
+            count=len(specs),
+            pivot_tables=[
+                {
+                    "target_sheet_id": spec["target_sheet_id"],
+                    "target_location": f"R{spec['target_row']}C{spec['target_col']}",
                 }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.create_pivot_table",
-                spreadsheet_id=spreadsheet_id,
-                source_sheet_id=source_sheet_id,
-                target_sheet_id=target_sheet_id,
-                target_location=f"R{target_row}C{target_col}",
-                row_groups=len(row_source_columns),
-                values=len(value_source_columns),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.create_pivot_table",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+                for spec in specs
+            ],
+        )
 
+    @_api_error("sheets.list_pivot_tables")
     def list_pivot_tables(
         self,
         spreadsheet_id: str,
@@ -2682,58 +3053,23 @@ class SheetsService(BaseService):
         Args:
             spreadsheet_id: The spreadsheet ID.
         """
-        try:
-            spreadsheet = self.execute(
-                self.service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id, includeGridData=False)
-            )
+        spreadsheet = self._get_spreadsheet(spreadsheet_id, fields=_PIVOT_FIELDS)
 
-            pivot_tables = []
-            for sheet in spreadsheet.get("sheets", []):
-                sheet_title = sheet["properties"]["title"]
-                sheet_id = sheet["properties"]["sheetId"]
-                for pt in sheet.get("data", [{}])[0].get("rowData", []) if sheet.get("data") else []:
-                    for cell in pt.get("values", []):
-                        if "pivotTable" in cell:
-                            pivot_tables.append({
-                                "sheet_id": sheet_id,
-                                "sheet_title": sheet_title,
-                                "source": cell["pivotTable"].get("source"),
-                            })
-
-            # Alternative: check the sheets structure for pivot tables
-            for sheet in spreadsheet.get("sheets", []):
-                sheet_title = sheet["properties"]["title"]
-                sheet_id = sheet["properties"]["sheetId"]
-                for pivot in sheet.get("pivotTables", []):
-                    pivot_tables.append({
-                        "sheet_id": sheet_id,
-                        "sheet_title": sheet_title,
-                        "source": pivot.get("source"),
-                        "rows": len(pivot.get("rows", [])),
-                        "columns": len(pivot.get("columns", [])),
-                        "values": len(pivot.get("values", [])),
-                    })
+        pivot_tables = _pivot_table_entries(spreadsheet)
 
-            output_success(
-                operation="sheets.list_pivot_tables",
-                spreadsheet_id=spreadsheet_id,
-                count=len(pivot_tables),
-                pivot_tables=pivot_tables,
-            )
-            return {"pivot_tables": pivot_tables}
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.list_pivot_tables",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        output_success(
+            operation="sheets.list_pivot_tables",
+            spreadsheet_id=spreadsheet_id,
+            count=len(pivot_tables),
+            pivot_tables=pivot_tables,
+        )
+        return {"pivot_tables": pivot_tables}
 
     # =========================================================================
     # PROTECTED RANGES
     # =========================================================================
 
+    @_api_error("sheets.protect_range")
     def protect_range(
         self,
         spreadsheet_id: str,
@@ -2745,7 +3081,7 @@ class SheetsService(BaseService):
         description: str | None = None,
         warning_only: bool = False,
         editors: list[str] | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Protect a range from editing.
 
         Args:
@@ -2759,55 +3095,63 @@ class SheetsService(BaseService):
             warning_only: If True, shows warning but allows editing.
             editors: List of email addresses that can edit.
         """
-        try:
-            protected_range: dict[str, Any] = {
-                "range": {
-                    "sheetId": sheet_id,
-                    "startRowIndex": start_row,
-                    "endRowIndex": end_row,
-                    "startColumnIndex": start_col,
-                    "endColumnIndex": end_col,
-                },
-                "warningOnly": warning_only,
-            }
+        requests = [_protected_range_request(
+            sheet_id, start_row, end_row, start_col, end_col, description, warning_only, editors
+        )]
 
-            if description:
-                protected_range["description"] = description
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            protected_range_id = _first_reply(
+                result, "addProtectedRange", "protectedRange", "protectedRangeId"
+            )
 
-            if editors:
-                protected_range["editors"] = {"users": editors}
+            output_success(
+                operation="sheets.protect_range",
+                spreadsheet_id=spreadsheet_id,
+                sheet_id=sheet_id,
+                protected_range_id=protected_range_id,
+                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
+                warning_only=warning_only,
+            )
+            return result
 
-            requests = [{"addProtectedRange": {"protectedRange": protected_range}}]
+        return self._submit(spreadsheet_id, requests, on_reply)
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+    @_api_error("sheets.protect_ranges")
+    def protect_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: list[dict[str, Any]],
+    ) -> dict[str, Any] | None:
+        """Protect several ranges with a single batchUpdate.
 
-            protected_range_id = (
-                result.get("replies", [{}])[0]
-                .get("addProtectedRange", {})
-                .get("protectedRange", {})
-                .get("protectedRangeId")
-            )
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            ranges: One dict per range, holding the protect_range keyword
+                arguments (everything except spreadsheet_id).
+        """
+        requests = _build_requests("sheets.protect_ranges", _protected_range_request, ranges)
 
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
             output_success(
-                operation="sheets.protect_range",
+                operation="sheets.protect_ranges",
                 spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                protected_range_id=protected_range_id,
-                range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
-                warning_only=warning_only,
+                count=len(ranges),
+                protected_ranges=[
+                    {
+                        "sheet_id": spec["sheet_id"],
+                        "protected_range_id": _dig(
+                            result, "replies", i,
+                            "addProtectedRange", "protectedRange", "protectedRangeId",
+                        ),
+                    }
+                    for i, spec in enumerate(ranges)
+                ],
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.protect_range",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.protect_sheet")
     def protect_sheet(
         self,
         spreadsheet_id: str,
@@ -2815,7 +3159,7 @@ class SheetsService(BaseService):
         description: str | None = None,
         warning_only: bool = False,
         editors: list[str] | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Protect an entire sheet from editing.
 
         Args:
@@ -2825,30 +3169,22 @@ class SheetsService(BaseService):
             warning_only: If True, shows warning but allows editing.
             editors: List of email addresses that can edit.
         """
-        try:
-            protected_range: dict[str, Any] = {
-                "range": {"sheetId": sheet_id},
-                "warningOnly": warning_only,
-            }
-
-            if description:
-                protected_range["description"] = description
+        protected_range: dict[str, Any] = {
+            "range": {"sheetId": sheet_id},
+            "warningOnly": warning_only,
+        }
 
-            if editors:
-                protected_range["editors"] = {"users": editors}
+        if description:
+            protected_range["description"] = description
 
-            requests = [{"addProtectedRange": {"protectedRange": protected_range}}]
+        if editors:
+            protected_range["editors"] = {"users": editors}
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"addProtectedRange": {"protectedRange": protected_range}}]
 
-            protected_range_id = (
-                result.get("replies", [{}])[0]
-                .get("addProtectedRange", {})
-                .get("protectedRange", {})
-                .get("protectedRangeId")
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            protected_range_id = _first_reply(
+                result, "addProtectedRange", "protectedRange", "protectedRangeId"
             )
 
             output_success(
@@ -2859,14 +3195,10 @@ class SheetsService(BaseService):
                 warning_only=warning_only,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.protect_sheet",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.list_protected_ranges")
     def list_protected_ranges(
         self,
         spreadsheet_id: str,
@@ -2876,79 +3208,44 @@ class SheetsService(BaseService):
         Args:
             spreadsheet_id: The spreadsheet ID.
         """
-        try:
-            spreadsheet = self.execute(
-                self.service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
-            )
+        spreadsheet = self._get_spreadsheet(spreadsheet_id, fields=_RANGES_FIELDS)
 
-            protected_ranges = []
-            for sheet in spreadsheet.get("sheets", []):
-                sheet_title = sheet["properties"]["title"]
-                sheet_id = sheet["properties"]["sheetId"]
-                for pr in sheet.get("protectedRanges", []):
-                    protected_ranges.append({
-                        "protected_range_id": pr.get("protectedRangeId"),
-                        "description": pr.get("description"),
-                        "sheet_id": sheet_id,
-                        "sheet_title": sheet_title,
-                        "range": pr.get("range"),
-                        "warning_only": pr.get("warningOnly", False),
-                        "editors": pr.get("editors", {}).get("users", []),
-                    })
+        protected_ranges = _protected_range_entries(spreadsheet)
 
-            output_success(
-                operation="sheets.list_protected_ranges",
-                spreadsheet_id=spreadsheet_id,
-                count=len(protected_ranges),
-                protected_ranges=protected_ranges,
-            )
-            return {"protected_ranges": protected_ranges}
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.list_protected_ranges",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        output_success(
+            operation="sheets.list_protected_ranges",
+            spreadsheet_id=spreadsheet_id,
+            count=len(protected_ranges),
+            protected_ranges=protected_ranges,
+        )
+        return {"protected_ranges": protected_ranges}
 
+    @_api_error("sheets.unprotect_range")
     def unprotect_range(
         self,
         spreadsheet_id: str,
         protected_range_id: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Remove protection from a range.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             protected_range_id: The protected range ID to remove.
         """
-        try:
-            requests = [{"deleteProtectedRange": {"protectedRangeId": protected_range_id}}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"deleteProtectedRange": {"protectedRangeId": protected_range_id}}]
 
-            output_success(
-                operation="sheets.unprotect_range",
-                spreadsheet_id=spreadsheet_id,
-                protected_range_id=protected_range_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.unprotect_range",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.unprotect_range",
+            protected_range_id=protected_range_id,
+        )
 
     # =========================================================================
     # NAMED RANGES
     # =========================================================================
 
+    @_api_error("sheets.create_named_range")
     def create_named_range(
         self,
         spreadsheet_id: str,
@@ -2958,7 +3255,7 @@ class SheetsService(BaseService):
         end_row: int,
         start_col: int,
         end_col: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Create a named range.
 
         Args:
@@ -2970,33 +3267,10 @@ class SheetsService(BaseService):
             start_col: Start column index (0-indexed).
             end_col: End column index (exclusive).
         """
-        try:
-            requests = [{
-                "addNamedRange": {
-                    "namedRange": {
-                        "name": name,
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        }
-                    }
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [_named_range_request(name, sheet_id, start_row, end_row, start_col, end_col)]
 
-            named_range_id = (
-                result.get("replies", [{}])[0]
-                .get("addNamedRange", {})
-                .get("namedRange", {})
-                .get("namedRangeId")
-            )
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            named_range_id = _first_reply(result, "addNamedRange", "namedRange", "namedRangeId")
 
             output_success(
                 operation="sheets.create_named_range",
@@ -3006,14 +3280,44 @@ class SheetsService(BaseService):
                 range=f"R{start_row}C{start_col}:R{end_row}C{end_col}",
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.create_named_range",
-                message=f"Google Sheets API error: {e.reason}",
+
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.create_named_ranges")
+    def create_named_ranges(
+        self,
+        spreadsheet_id: str,
+        named_ranges: list[dict[str, Any]],
+    ) -> dict[str, Any] | None:
+        """Create several named ranges with a single batchUpdate.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            named_ranges: One dict per range, holding the create_named_range
+                keyword arguments (everything except spreadsheet_id).
+        """
+        requests = _build_requests("sheets.create_named_ranges", _named_range_request, named_ranges)
+
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            output_success(
+                operation="sheets.create_named_ranges",
+                spreadsheet_id=spreadsheet_id,
+                count=len(named_ranges),
+                named_ranges=[
+                    {
+                        "name": spec["name"],
+                        "named_range_id": _dig(
+                            result, "replies", i, "addNamedRange", "namedRange", "namedRangeId"
+                        ),
+                    }
+                    for i, spec in enumerate(named_ranges)
+                ],
             )
-            raise SystemExit(ExitCode.API_ERROR)
+            return result
 
+        return self._submit(spreadsheet_id, requests, on_reply)
+
+    @_api_error("sheets.list_named_ranges")
     def list_named_ranges(
         self,
         spreadsheet_id: str,
@@ -3023,77 +3327,76 @@ class SheetsService(BaseService):
         Args:
             spreadsheet_id: The spreadsheet ID.
         """
-        try:
-            spreadsheet = self.execute(
-                self.service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
-            )
+        spreadsheet = self._get_spreadsheet(spreadsheet_id, fields=_RANGES_FIELDS)
 
-            named_ranges = []
-            for nr in spreadsheet.get("namedRanges", []):
-                range_info = nr.get("range", {})
-                named_ranges.append({
-                    "named_range_id": nr.get("namedRangeId"),
-                    "name": nr.get("name"),
-                    "sheet_id": range_info.get("sheetId"),
-                    "start_row": range_info.get("startRowIndex"),
-                    "end_row": range_info.get("endRowIndex"),
-                    "start_col": range_info.get("startColumnIndex"),
-                    "end_col": range_info.get("endColumnIndex"),
-                })
+        named_ranges = _named_range_entries(spreadsheet)
 
-            output_success(
-                operation="sheets.list_named_ranges",
-                spreadsheet_id=spreadsheet_id,
-                count=len(named_ranges),
-                named_ranges=named_ranges,
-            )
-            return {"named_ranges": named_ranges}
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.list_named_ranges",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        output_success(
+            operation="sheets.list_named_ranges",
+            spreadsheet_id=spreadsheet_id,
+            count=len(named_ranges),
+            named_ranges=named_ranges,
+        )
+        return {"named_ranges": named_ranges}
+
+    @_api_error("sheets.list_all")
+    def list_all(
+        self,
+        spreadsheet_id: str,
+    ) -> dict[str, Any]:
+        """List pivot tables, protected ranges and named ranges in one call.
+
+        Fetches the metadata all three listings need with a single GET instead
+        of one per listing.
 
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+        """
+        spreadsheet = self._get_spreadsheet(spreadsheet_id, fields=_INVENTORY_FIELDS)
+
+        pivot_tables = _pivot_table_entries(spreadsheet)
+        protected_ranges = _protected_range_entries(spreadsheet)
+        named_ranges = _named_range_entries(spreadsheet)
+
+        output_success(
+            operation="sheets.list_all",
+            spreadsheet_id=spreadsheet_id,
+            pivot_tables=pivot_tables,
+            protected_ranges=protected_ranges,
+            named_ranges=named_ranges,
+        )
+        return {
+            "pivot_tables": pivot_tables,
+            "protected_ranges": protected_ranges,
+            "named_ranges": named_ranges,
+        }
+
+    @_api_error("sheets.delete_named_range")
     def delete_named_range(
         self,
         spreadsheet_id: str,
         named_range_id: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a named range.
 
         Args:
             spreadsheet_id: The spreadsheet ID.
             named_range_id: The named range ID to delete.
         """
-        try:
-            requests = [{"deleteNamedRange": {"namedRangeId": named_range_id}}]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{"deleteNamedRange": {"namedRangeId": named_range_id}}]
 
-            output_success(
-                operation="sheets.delete_named_range",
-                spreadsheet_id=spreadsheet_id,
-                named_range_id=named_range_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.delete_named_range",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.delete_named_range",
+            named_range_id=named_range_id,
+        )
 
     # =========================================================================
     # CHART UPDATES
     # =========================================================================
 
+    @_api_error("sheets.update_chart")
     def update_chart(
         self,
         spreadsheet_id: str,
@@ -3101,7 +3404,7 @@ class SheetsService(BaseService):
         title: str | None = None,
         chart_type: str | None = None,
         legend_position: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Update a chart's specification.
 
         Args:
@@ -3111,65 +3414,53 @@ class SheetsService(BaseService):
             chart_type: Chart type (LINE, BAR, COLUMN, AREA, SCATTER, PIE, etc.).
             legend_position: Legend position (TOP, BOTTOM, LEFT, RIGHT, NONE).
         """
-        try:
-            # Build the chart spec update
-            spec: dict[str, Any] = {}
-            fields = []
-
-            if title is not None:
-                spec["title"] = title
-                fields.append("title")
-
-            if chart_type is not None:
-                # Most chart types use basicChart
-                spec["basicChart"] = {"chartType": chart_type}
-                fields.append("basicChart.chartType")
-
-            if legend_position is not None:
-                if "basicChart" not in spec:
-                    spec["basicChart"] = {}
-                spec["basicChart"]["legendPosition"] = legend_position
-                fields.append("basicChart.legendPosition")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGUMENT",
-                    operation="sheets.update_chart",
-                    message="At least one update field required (title, chart_type, legend_position)",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        if title is None and chart_type is None and legend_position is None:
+            raise InvalidArgsError(
+                "At least one update field required (title, chart_type, legend_position)",
+                operation="sheets.update_chart",
+            )
 
-            requests = [{
-                "updateChartSpec": {
-                    "chartId": chart_id,
-                    "spec": spec,
-                }
-            }]
+        # Build the chart spec update
+        spec: dict[str, Any] = {}
+        basic_chart: dict[str, Any] = {}
+        fields = []
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        if title is not None:
+            spec["title"] = title
+            fields.append("title")
 
-            output_success(
-                operation="sheets.update_chart",
-                spreadsheet_id=spreadsheet_id,
-                chart_id=chart_id,
-                updated_fields=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.update_chart",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        if chart_type is not None:
+            # Most chart types use basicChart
+            basic_chart["chartType"] = chart_type
+            fields.append("basicChart.chartType")
+
+        if legend_position is not None:
+            basic_chart["legendPosition"] = legend_position
+            fields.append("basicChart.legendPosition")
+
+        if basic_chart:
+            spec["basicChart"] = basic_chart
+
+        requests = [{
+            "updateChartSpec": {
+                "chartId": chart_id,
+                "spec": spec,
+            }
+        }]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.update_chart",
+            chart_id=chart_id,
+            updated_fields=fields,
+        )
 
     # =========================================================================
     # ROW/COLUMN MOVEMENT
     # =========================================================================
 
+    @_api_error("sheets.move_rows")
     def move_rows(
         self,
         spreadsheet_id: str,
@@ -3177,7 +3468,7 @@ class SheetsService(BaseService):
         source_start: int,
         source_end: int,
         destination_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Move rows to a new position.
 
         Args:
@@ -3187,40 +3478,20 @@ class SheetsService(BaseService):
             source_end: Ending row index (exclusive).
             destination_index: Where to move the rows (0-based).
         """
-        try:
-            requests = [{
-                "moveDimension": {
-                    "source": {
-                        "sheetId": sheet_id,
-                        "dimension": "ROWS",
-                        "startIndex": source_start,
-                        "endIndex": source_end,
-                    },
-                    "destinationIndex": destination_index,
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.move_rows",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                source_range=f"{source_start}:{source_end}",
-                destination_index=destination_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.move_rows",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        requests = [_move_dimension_request(
+            "ROWS", sheet_id, source_start, source_end, destination_index
+        )]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.move_rows",
+            sheet_id=sheet_id,
+            source_range=f"{source_start}:{source_end}",
+            destination_index=destination_index,
+        )
+
+    @_api_error("sheets.move_columns")
     def move_columns(
         self,
         spreadsheet_id: str,
@@ -3228,7 +3499,7 @@ class SheetsService(BaseService):
         source_start: int,
         source_end: int,
         destination_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Move columns to a new position.
 
         Args:
@@ -3238,44 +3509,24 @@ class SheetsService(BaseService):
             source_end: Ending column index (exclusive).
             destination_index: Where to move the columns (0-based).
         """
-        try:
-            requests = [{
-                "moveDimension": {
-                    "source": {
-                        "sheetId": sheet_id,
-                        "dimension": "COLUMNS",
-                        "startIndex": source_start,
-                        "endIndex": source_end,
-                    },
-                    "destinationIndex": destination_index,
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.move_columns",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                source_range=f"{source_start}:{source_end}",
-                destination_index=destination_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.move_columns",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        requests = [_move_dimension_request(
+            "COLUMNS", sheet_id, source_start, source_end, destination_index
+        )]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.move_columns",
+            sheet_id=sheet_id,
+            source_range=f"{source_start}:{source_end}",
+            destination_index=destination_index,
+        )
 
     # =========================================================================
     # COPY/PASTE & AUTO-FILL
     # =========================================================================
 
+    @_api_error("sheets.copy_paste")
     def copy_paste(
         self,
         spreadsheet_id: str,
@@ -3288,7 +3539,7 @@ class SheetsService(BaseService):
         dest_start_row: int,
         dest_start_col: int,
         paste_type: str = "PASTE_NORMAL",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Copy a range and paste it to another location.
 
         Args:
@@ -3305,46 +3556,26 @@ class SheetsService(BaseService):
                        PASTE_NO_BORDERS, PASTE_FORMULA, PASTE_DATA_VALIDATION,
                        PASTE_CONDITIONAL_FORMATTING).
         """
-        try:
-            requests = [{
-                "copyPaste": {
-                    "source": {
-                        "sheetId": source_sheet_id,
-                        "startRowIndex": source_start_row,
-                        "endRowIndex": source_end_row,
-                        "startColumnIndex": source_start_col,
-                        "endColumnIndex": source_end_col,
-                    },
-                    "destination": {
-                        "sheetId": dest_sheet_id,
-                        "startRowIndex": dest_start_row,
-                        "endRowIndex": dest_start_row + (source_end_row - source_start_row),
-                        "startColumnIndex": dest_start_col,
-                        "endColumnIndex": dest_start_col + (source_end_col - source_start_col),
-                    },
-                    "pasteType": paste_type,
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
-                operation="sheets.copy_paste",
-                spreadsheet_id=spreadsheet_id,
-                paste_type=paste_type,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.copy_paste",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        requests = [_copy_paste_request(
+            source_sheet_id,
+            source_start_row,
+            source_end_row,
+            source_start_col,
+            source_end_col,
+            dest_sheet_id,
+            dest_start_row,
+            dest_start_col,
+            paste_type,
+        )]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.copy_paste",
+            paste_type=paste_type,
+        )
+
+    @_api_error("sheets.auto_fill")
     def auto_fill(
         self,
         spreadsheet_id: str,
@@ -3358,7 +3589,7 @@ class SheetsService(BaseService):
         fill_start_col: int,
         fill_end_col: int,
         use_alternate_series: bool = False,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Auto-fill a range based on source data.
 
         Args:
@@ -3374,50 +3605,80 @@ class SheetsService(BaseService):
             fill_end_col: Fill range end column (exclusive).
             use_alternate_series: Use alternate series for auto-fill.
         """
-        try:
-            requests = [{
-                "autoFill": {
-                    "useAlternateSeries": use_alternate_series,
-                    "sourceAndDestination": {
-                        "source": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": source_start_row,
-                            "endRowIndex": source_end_row,
-                            "startColumnIndex": source_start_col,
-                            "endColumnIndex": source_end_col,
-                        },
-                        "dimension": "ROWS" if fill_end_row > source_end_row else "COLUMNS",
-                        "fillLength": max(
-                            fill_end_row - source_end_row,
-                            fill_end_col - source_end_col
-                        ),
-                    },
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [_auto_fill_request(
+            sheet_id,
+            source_start_row,
+            source_end_row,
+            source_start_col,
+            source_end_col,
+            fill_start_row,
+            fill_end_row,
+            fill_start_col,
+            fill_end_col,
+            use_alternate_series,
+        )]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.auto_fill",
+            sheet_id=sheet_id,
+        )
+
+    @_api_error("sheets.reorganize")
+    def reorganize(
+        self,
+        spreadsheet_id: str,
+        *,
+        move_rows: list[dict[str, Any]] | None = None,
+        move_columns: list[dict[str, Any]] | None = None,
+        copy_pastes: list[dict[str, Any]] | None = None,
+        auto_fills: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any] | None:
+        """Move, copy and fill ranges with a single batchUpdate.
+
+        Each list holds keyword-argument dicts for the matching single-operation
+        method (move_rows, move_columns, copy_paste, auto_fill), minus
+        spreadsheet_id. The API applies the requests in order, so rows are moved
+        first, then columns, then copies and fills.
 
-            output_success(
-                operation="sheets.auto_fill",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.auto_fill",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            move_rows: Row moves.
+            move_columns: Column moves.
+            copy_pastes: Range copies.
+            auto_fills: Auto-fills.
+        """
+        groups = [
+            (move_rows, functools.partial(_move_dimension_request, "ROWS")),
+            (move_columns, functools.partial(_move_dimension_request, "COLUMNS")),
+            (copy_pastes, _copy_paste_request),
+            (auto_fills, _auto_fill_request),
+        ]
+        requests = [
+            request
+            for specs, builder in groups
+            if specs
+            for request in _build_requests("sheets.reorganize", builder, specs)
+        ]
+        if not requests:
+            raise InvalidArgsError("At least one operation is required")
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.reorganize",
+            rows_moved=len(move_rows or ()),
+            columns_moved=len(move_columns or ()),
+            copies=len(copy_pastes or ()),
+            fills=len(auto_fills or ()),
+        )
 
     # =========================================================================
     # DATA CLEANUP
     # =========================================================================
 
+    @_api_error("sheets.trim_whitespace")
     def trim_whitespace(
         self,
         spreadsheet_id: str,
@@ -3426,7 +3687,7 @@ class SheetsService(BaseService):
         end_row: int | None = None,
         start_col: int = 0,
         end_col: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Trim leading and trailing whitespace from cells.
 
         Args:
@@ -3437,42 +3698,20 @@ class SheetsService(BaseService):
             start_col: Start column index (0-based).
             end_col: End column index (exclusive), None for entire sheet.
         """
-        try:
-            range_spec: dict[str, Any] = {"sheetId": sheet_id}
-            if start_row > 0:
-                range_spec["startRowIndex"] = start_row
-            if end_row is not None:
-                range_spec["endRowIndex"] = end_row
-            if start_col > 0:
-                range_spec["startColumnIndex"] = start_col
-            if end_col is not None:
-                range_spec["endColumnIndex"] = end_col
-
-            requests = [{
-                "trimWhitespace": {
-                    "range": range_spec,
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{
+            "trimWhitespace": {
+                "range": _open_grid_range(sheet_id, start_row, end_row, start_col, end_col),
+            }
+        }]
 
-            output_success(
-                operation="sheets.trim_whitespace",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.trim_whitespace",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.trim_whitespace",
+            sheet_id=sheet_id,
+        )
 
+    @_api_error("sheets.text_to_columns")
     def text_to_columns(
         self,
         spreadsheet_id: str,
@@ -3482,7 +3721,7 @@ class SheetsService(BaseService):
         source_column: int,
         delimiter_type: str = "COMMA",
         custom_delimiter: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Split text in a column into multiple columns.
 
         Args:
@@ -3494,47 +3733,47 @@ class SheetsService(BaseService):
             delimiter_type: Type of delimiter (COMMA, SEMICOLON, PERIOD, SPACE, CUSTOM, AUTODETECT).
             custom_delimiter: Custom delimiter string (required if delimiter_type is CUSTOM).
         """
-        try:
-            request: dict[str, Any] = {
-                "textToColumns": {
-                    "source": {
-                        "sheetId": sheet_id,
-                        "startRowIndex": start_row,
-                        "endRowIndex": end_row,
-                        "startColumnIndex": source_column,
-                        "endColumnIndex": source_column + 1,
-                    },
-                    "delimiterType": delimiter_type,
-                }
-            }
-
-            if delimiter_type == "CUSTOM" and custom_delimiter:
-                request["textToColumns"]["delimiter"] = custom_delimiter
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": [request]})
-            )
-
-            output_success(
+        delimiter_type = delimiter_type.upper()
+        if delimiter_type not in _DELIMITER_TYPES:
+            raise InvalidArgsError(
+                f"delimiter_type must be one of: {list(_DELIMITER_TYPES_SORTED)}",
                 operation="sheets.text_to_columns",
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                delimiter_type=delimiter_type,
             )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
+        if delimiter_type == "CUSTOM" and not custom_delimiter:
+            raise InvalidArgsError(
+                "custom_delimiter is required when delimiter_type is CUSTOM",
                 operation="sheets.text_to_columns",
-                message=f"Google Sheets API error: {e.reason}",
             )
-            raise SystemExit(ExitCode.API_ERROR)
+
+        request: dict[str, Any] = {
+            "textToColumns": {
+                "source": _grid_range(
+                    sheet_id,
+                    start_row,
+                    end_row,
+                    source_column,
+                    source_column + 1,
+                ),
+                "delimiterType": delimiter_type,
+            }
+        }
+
+        if delimiter_type == "CUSTOM":
+            request["textToColumns"]["delimiter"] = custom_delimiter
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            [request],
+            "sheets.text_to_columns",
+            sheet_id=sheet_id,
+            delimiter_type=delimiter_type,
+        )
 
     # =========================================================================
     # BANDING & FILTER VIEW UPDATES
     # =========================================================================
 
+    @_api_error("sheets.update_banding")
     def update_banding(
         self,
         spreadsheet_id: str,
@@ -3543,7 +3782,7 @@ class SheetsService(BaseService):
         first_band_color: str | None = None,
         second_band_color: str | None = None,
         footer_color: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Update banding colors on a range.
 
         Args:
@@ -3554,64 +3793,39 @@ class SheetsService(BaseService):
             second_band_color: Second alternating color (hex).
             footer_color: Footer row color (hex).
         """
-        try:
-            properties: dict[str, Any] = {"bandedRangeId": banded_range_id}
-            fields = ["bandedRangeId"]
-
-            if header_color:
-                properties["rowProperties"] = properties.get("rowProperties", {})
-                properties["rowProperties"]["headerColor"] = parse_hex_color(header_color)
-                fields.append("rowProperties.headerColor")
-
-            if first_band_color:
-                properties["rowProperties"] = properties.get("rowProperties", {})
-                properties["rowProperties"]["firstBandColor"] = parse_hex_color(first_band_color)
-                fields.append("rowProperties.firstBandColor")
-
-            if second_band_color:
-                properties["rowProperties"] = properties.get("rowProperties", {})
-                properties["rowProperties"]["secondBandColor"] = parse_hex_color(second_band_color)
-                fields.append("rowProperties.secondBandColor")
-
-            if footer_color:
-                properties["rowProperties"] = properties.get("rowProperties", {})
-                properties["rowProperties"]["footerColor"] = parse_hex_color(footer_color)
-                fields.append("rowProperties.footerColor")
-
-            if len(fields) == 1:
-                output_error(
-                    error_code="INVALID_ARGUMENT",
-                    operation="sheets.update_banding",
-                    message="At least one color parameter required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        colors = {
+            "headerColor": header_color,
+            "firstBandColor": first_band_color,
+            "secondBandColor": second_band_color,
+            "footerColor": footer_color,
+        }
+        if not any(colors.values()):
+            raise InvalidArgsError(
+                "At least one color parameter required",
+                operation="sheets.update_banding",
+            )
+        row_properties = {
+            key: parse_color_arg(value) for key, value in colors.items() if value
+        }
 
-            requests = [{
-                "updateBanding": {
-                    "bandedRange": properties,
-                    "fields": ",".join(fields),
-                }
-            }]
+        properties = {"bandedRangeId": banded_range_id, "rowProperties": row_properties}
+        fields = ["bandedRangeId"] + [f"rowProperties.{key}" for key in row_properties]
 
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
+        requests = [{
+            "updateBanding": {
+                "bandedRange": properties,
+                "fields": ",".join(fields),
+            }
+        }]
 
-            output_success(
-                operation="sheets.update_banding",
-                spreadsheet_id=spreadsheet_id,
-                banded_range_id=banded_range_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.update_banding",
-                message=f"Google Sheets API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.update_banding",
+            banded_range_id=banded_range_id,
+        )
 
+    @_api_error("sheets.update_filter_view")
     def update_filter_view(
         self,
         spreadsheet_id: str,
@@ -3621,7 +3835,7 @@ class SheetsService(BaseService):
         end_row: int | None = None,
         start_col: int | None = None,
         end_col: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Update a filter view's properties.
 
         Args:
@@ -3633,57 +3847,36 @@ class SheetsService(BaseService):
             start_col: New start column index (0-based).
             end_col: New end column index (exclusive).
         """
-        try:
-            filter_view: dict[str, Any] = {"filterViewId": filter_view_id}
-            fields = []
-
-            if title is not None:
-                filter_view["title"] = title
-                fields.append("title")
-
-            if any(x is not None for x in [start_row, end_row, start_col, end_col]):
-                filter_view["range"] = {}
-                if start_row is not None:
-                    filter_view["range"]["startRowIndex"] = start_row
-                if end_row is not None:
-                    filter_view["range"]["endRowIndex"] = end_row
-                if start_col is not None:
-                    filter_view["range"]["startColumnIndex"] = start_col
-                if end_col is not None:
-                    filter_view["range"]["endColumnIndex"] = end_col
-                fields.append("range")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGUMENT",
-                    operation="sheets.update_filter_view",
-                    message="At least one update field required (title or range bounds)",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            requests = [{
-                "updateFilterView": {
-                    "filter": filter_view,
-                    "fields": ",".join(fields),
-                }
-            }]
-
-            result = self.execute(
-                self.service.spreadsheets()
-                .batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests})
-            )
-
-            output_success(
+        bounds = {
+            "startRowIndex": start_row,
+            "endRowIndex": end_row,
+            "startColumnIndex": start_col,
+            "endColumnIndex": end_col,
+        }
+        updates = {
+            "title": title,
+            "range": {key: value for key, value in bounds.items() if value is not None} or None,
+        }
+        fields = [name for name, value in updates.items() if value is not None]
+        if not fields:
+            raise InvalidArgsError(
+                "At least one update field required (title or range bounds)",
                 operation="sheets.update_filter_view",
-                spreadsheet_id=spreadsheet_id,
-                filter_view_id=filter_view_id,
-                updated_fields=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="sheets.update_filter_view",
-                message=f"Google Sheets API error: {e.reason}",
             )
-            raise SystemExit(ExitCode.API_ERROR)
+
+        filter_view = {"filterViewId": filter_view_id, **{name: updates[name] for name in fields}}
+
+        requests = [{
+            "updateFilterView": {
+                "filter": filter_view,
+                "fields": ",".join(fields),
+            }
+        }]
+
+        return self._submit_and_report(
+            spreadsheet_id,
+            requests,
+            "sheets.update_filter_view",
+            filter_view_id=filter_view_id,
+            updated_fields=fields,
+        )
@@ -1,369 +1,779 @@
 """Google Slides service operations."""
 
-import uuid
-from typing import Any
+import functools
+import math
+import re
+import secrets
+import time
+from collections import Counter
+from typing import Any, Callable, Iterable, TypeVar
 
 from googleapiclient.errors import HttpError
 
 from gws.services.base import BaseService
 import json
-from gws.output import output_success, output_error, output_external_content
-from gws.exceptions import ExitCode
+from gws.output import output_success, output_external_content
+from gws.exceptions import APIError, GWSError, InvalidArgsError, NotFoundError
+from gws.utils.colors import parse_color_arg
+
+# The keys _get_element_type() tests for, with tables trimmed to their size.
+_ELEMENT_TYPE_FIELDS = "image,table(rows,columns),line,video"
+# Response mask for metadata(): the title plus each slide's ID and its
+# elements' IDs and types, leaving out their text.
+_METADATA_FIELDS = (
+    f"title,slides(objectId,pageElements(objectId,shape(shapeType),{_ELEMENT_TYPE_FIELDS}))"
+)
+# What _element_info() reads from a page element: shape type and text runs,
+# plus the keys _get_element_type() tests for.
+_PAGE_ELEMENT_FIELDS = (
+    "pageElements(objectId,shape(shapeType,text(textElements(textRun(content)))),"
+    f"{_ELEMENT_TYPE_FIELDS})"
+)
+_READ_FIELDS = f"title,slides(objectId,{_PAGE_ELEMENT_FIELDS})"
+# What the speaker notes methods read: each slide's notes page and the text
+# of the BODY placeholder on it.
+_NOTES_FIELDS = (
+    "slides(objectId,slideProperties(notesPage(objectId,pageElements(objectId,"
+    "shape(shapeType,placeholder(type),text(textElements(textRun(content))))))))"
+)
+
+# (pageElement key, reported type) for elements other than shapes, in the
+# order _get_element_type() checks them.
+_ELEMENT_TYPES: tuple[tuple[str, str], ...] = (
+    ("image", "IMAGE"),
+    ("table", "TABLE"),
+    ("line", "LINE"),
+    ("video", "VIDEO"),
+)
+
+
+def _element_properties(
+    page_object_id: str,
+    x: float,
+    y: float,
+    width: float | None = None,
+    height: float | None = None,
+) -> dict[str, Any]:
+    """Build elementProperties placing a new element at (x, y) on a page, in points.
+
+    The size is set only when both width and height are given; otherwise the
+    API picks one (e.g. an image's natural size).
+    """
+    properties: dict[str, Any] = {
+        "pageObjectId": page_object_id,
+        "transform": {
+            "scaleX": 1,
+            "scaleY": 1,
+            "translateX": x,
+            "translateY": y,
+            "unit": "PT",
+        },
+    }
+    if width is not None and height is not None:
+        properties["size"] = {
+            "width": {"magnitude": width, "unit": "PT"},
+            "height": {"magnitude": height, "unit": "PT"},
+        }
+    return properties
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _api_error(operation: str) -> Callable[[_F], _F]:
+    """Convert Google API HttpErrors raised by the wrapped method into APIError.
+
+    GWSErrors raised without an operation are tagged with this one on the way out.
+
+    Args:
+        operation: Operation name reported with the error (e.g. "slides.add_slide").
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except HttpError as e:
+                raise APIError(
+                    f"Google Slides API error: {e.reason}",
+                    operation=operation,
+                ) from e
+            except GWSError as e:
+                if e.operation is None:
+                    e.operation = operation
+                raise
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class SlidesBatch:
+    """Queue batchUpdate requests for one presentation and send them together.
+
+    Created with SlidesService.batch(). While the context is open, batchable
+    SlidesService methods called for the same presentation queue their
+    requests instead of sending them. Methods that create an object return the
+    new object's ID, so later calls in the block can refer to it; the others
+    return None. On a clean exit the queue is sent as a single batchUpdate and
+    each operation's reply handler runs in call order, emitting the usual
+    success output; handler return values are collected in `results`. If the
+    block raises, queued requests are dropped.
+
+    Any other API call made through the service while requests are queued
+    flushes the queue first, so requests always reach the API in call order.
+    """
+
+    __slots__ = ("_service", "presentation_id", "_requests", "_handlers", "results")
+
+    def __init__(self, service: "SlidesService", presentation_id: str):
+        self._service = service
+        self.presentation_id = presentation_id
+        self._requests: list[dict[str, Any]] = []
+        # (number of requests, reply handler) per queued operation
+        self._handlers: list[tuple[int, Callable[[dict[str, Any]], Any]]] = []
+        self.results: list[Any] = []
+
+    def __enter__(self) -> "SlidesBatch":
+        if self._service._batch is not None:
+            raise InvalidArgsError("A batch is already open", operation="slides.batch")
+        self._service._batch = self
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self._service._batch = None
+
+    @property
+    def pending(self) -> int:
+        """Number of queued requests."""
+        return len(self._requests)
+
+    def add(
+        self,
+        requests: list[dict[str, Any]],
+        on_reply: Callable[[dict[str, Any]], Any],
+    ) -> None:
+        """Queue requests with the handler that receives their replies."""
+        self._requests.extend(requests)
+        self._handlers.append((len(requests), on_reply))
+
+    def flush(self) -> list[Any]:
+        """Send queued requests as one batchUpdate and run their reply handlers.
+
+        Each handler receives a response dict whose `replies` holds only the
+        replies for its own requests.
+
+        Returns:
+            The handler return values for this flush, in call order.
+        """
+        if not self._requests:
+            return []
+        requests, handlers = self._requests, self._handlers
+        self._requests, self._handlers = [], []
+
+        try:
+            result = self._service._batch_update(self.presentation_id, requests)
+        except HttpError as e:
+            raise APIError(
+                f"Google Slides API error: {e.reason}",
+                operation="slides.batch",
+            ) from e
+
+        replies = result.get("replies", [])
+        presentation_id = result.get("presentationId", self.presentation_id)
+        flushed = []
+        offset = 0
+        for count, on_reply in handlers:
+            flushed.append(on_reply({
+                "presentationId": presentation_id,
+                "replies": replies[offset:offset + count],
+            }))
+            offset += count
+        self.results.extend(flushed)
+        return flushed
 
 
 class SlidesService(BaseService):
     """Google Slides operations."""
 
+    __slots__ = ("_metadata_cache", "_batch", "_presentations_resource", "_pages_resource")
+
     SERVICE_NAME = "slides"
     VERSION = "v1"
 
-    PREDEFINED_LAYOUTS = {
-        "BLANK": "BLANK",
-        "TITLE": "TITLE",
-        "TITLE_AND_BODY": "TITLE_AND_BODY",
-        "TITLE_AND_TWO_COLUMNS": "TITLE_AND_TWO_COLUMNS",
-        "TITLE_ONLY": "TITLE_ONLY",
-        "SECTION_HEADER": "SECTION_HEADER",
-        "ONE_COLUMN_TEXT": "ONE_COLUMN_TEXT",
-        "MAIN_POINT": "MAIN_POINT",
-        "BIG_NUMBER": "BIG_NUMBER",
-    }
+    # Seconds a cached presentation response is served without checking.
+    METADATA_CACHE_TTL: float = 5.0
+    # Presentations kept in the cache; the oldest entry is dropped first.
+    METADATA_CACHE_SIZE: int = 128
+
+    PREDEFINED_LAYOUTS: frozenset[str] = frozenset({
+        "BLANK",
+        "CAPTION_ONLY",
+        "TITLE",
+        "TITLE_AND_BODY",
+        "TITLE_AND_TWO_COLUMNS",
+        "TITLE_ONLY",
+        "SECTION_HEADER",
+        "SECTION_TITLE_AND_DESCRIPTION",
+        "ONE_COLUMN_TEXT",
+        "MAIN_POINT",
+        "BIG_NUMBER",
+    })
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # presentation_id -> fields mask ("" for the full resource) -> (fetched_at, response)
+        self._metadata_cache: dict[str, dict[str, tuple[float, dict[str, Any]]]] = {}
+        self._batch: SlidesBatch | None = None
+        self._presentations_resource: Any = None
+        self._pages_resource: Any = None
+
+    @property
+    def _presentations(self) -> Any:
+        """The presentations() collection, built once per service.
+
+        Each `Resource.presentations()` call constructs a fresh collection
+        object from the discovery document, so hot paths reuse a single instance.
+        """
+        if self._presentations_resource is None:
+            self._presentations_resource = self.service.presentations()
+        return self._presentations_resource
+
+    @property
+    def _pages(self) -> Any:
+        """The presentations().pages() collection, built once per service."""
+        if self._pages_resource is None:
+            self._pages_resource = self._presentations.pages()
+        return self._pages_resource
 
     def _generate_object_id(self) -> str:
         """Generate a unique object ID for new elements."""
-        return f"gws_{uuid.uuid4().hex[:12]}"
+        return f"gws_{secrets.token_hex(6)}"
+
+    def batch(self, presentation_id: str) -> SlidesBatch:
+        """Open a batch that sends queued requests for `presentation_id` as one batchUpdate.
+
+        Usage:
+            with service.batch(presentation_id) as batch:
+                slide_id = service.add_slide(presentation_id)
+                service.create_textbox(presentation_id, slide_id, "Hello", 50, 50, 300, 60)
+            batch.results  # one entry per queued operation
+        """
+        return SlidesBatch(self, presentation_id)
+
+    def fan_out(
+        self,
+        method: str,
+        presentation_ids: Iterable[str],
+        *args: Any,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Call one SlidesService method for several presentations concurrently.
+
+        Each call is `getattr(service, method)(presentation_id, *args, **kwargs)`.
+        Edits to a single presentation belong in batch(), which sends them in
+        one request.
+
+        Args:
+            method: Name of a public SlidesService method taking presentation_id first.
+            presentation_ids: Presentations to run the method against.
+            max_workers: Thread cap (defaults to MAX_PARALLEL_REQUESTS).
+
+        Returns:
+            One entry per presentation, in input order: the method's return
+            value, or the GWSError it raised. A failure for one presentation
+            does not stop the others.
+        """
+        if (
+            method.startswith("_")
+            or method in ("batch", "fan_out", "execute_parallel")
+            or not callable(getattr(self, method, None))
+        ):
+            raise InvalidArgsError(
+                f"Unknown Slides operation: {method}",
+                operation="slides.fan_out",
+            )
+        return self._run_parallel(
+            lambda service, presentation_id: getattr(service, method)(
+                presentation_id, *args, **kwargs
+            ),
+            presentation_ids,
+            max_workers,
+        )
+
+    def execute_parallel(
+        self,
+        jobs: Iterable[tuple[str, list[dict[str, Any]]]],
+        max_workers: int | None = None,
+    ) -> list[Any]:
+        """Send one batchUpdate per (presentation_id, requests) job concurrently.
+
+        Unlike fan_out(), each presentation gets its own request list. Nothing
+        is printed; callers get the raw responses.
+
+        Args:
+            jobs: (presentation_id, requests) pairs.
+            max_workers: Thread cap (defaults to MAX_PARALLEL_REQUESTS).
+
+        Returns:
+            One entry per job, in input order: the batchUpdate response, or the
+            GWSError it raised.
+        """
+
+        @_api_error("slides.execute_parallel")
+        def run(service: "SlidesService", job: tuple[str, list[dict[str, Any]]]) -> Any:
+            presentation_id, requests = job
+            return service._batch_update(presentation_id, requests)
 
+        return self._run_parallel(run, jobs, max_workers)
+
+    def execute(self, request: Any) -> Any:
+        """Execute a request, first sending any requests queued in an open batch."""
+        if self._batch is not None and self._batch.pending:
+            self._batch.flush()
+        return super().execute(request)
+
+    def _submit(
+        self,
+        presentation_id: str,
+        requests: list[dict[str, Any]],
+        on_reply: Callable[[dict[str, Any]], Any],
+        queued_result: Any = None,
+    ) -> Any:
+        """Send `requests` now, or queue them if a batch is open for the presentation.
+
+        `on_reply` receives the batchUpdate response and its return value is
+        returned. When the requests are queued, `queued_result` is returned
+        instead and `on_reply` runs when the batch is flushed.
+        """
+        if self._batch is not None and self._batch.presentation_id == presentation_id:
+            self._batch.add(requests, on_reply)
+            return queued_result
+        return on_reply(self._batch_update(presentation_id, requests))
+
+    def _submit_and_report(
+        self,
+        presentation_id: str,
+        requests: list[dict[str, Any]],
+        operation: str,
+        /,
+        queued_result: Any = None,
+        **fields: Any,
+    ) -> Any:
+        """_submit() for mutations whose success output needs nothing from the reply.
+
+        Reports `operation` with the presentation ID and `fields` once the
+        requests have been applied, and returns the batchUpdate response
+        (`queued_result` while queued in a batch).
+        """
+
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            output_success(operation=operation, presentation_id=presentation_id, **fields)
+            return result
+
+        return self._submit(presentation_id, requests, on_reply, queued_result)
+
+    def _get_presentation(self, presentation_id: str, fields: str | None = None) -> dict[str, Any]:
+        """Fetch a presentation, optionally restricted to `fields`, reusing recent responses.
+
+        The Slides API offers no conditional GET, so responses are served from
+        the cache for METADATA_CACHE_TTL seconds. After that, the cached
+        response is revalidated by fetching only the presentation's revisionId
+        and reused if it is unchanged. Any batchUpdate sent through
+        _batch_update() drops the presentation's entries. Requests queued in an
+        open batch are sent first, so the response reflects them.
+        """
+        if self._batch is not None and self._batch.pending:
+            self._batch.flush()
+        entries = self._metadata_cache.get(presentation_id)
+        if entries is None:
+            if len(self._metadata_cache) >= self.METADATA_CACHE_SIZE:
+                del self._metadata_cache[next(iter(self._metadata_cache))]
+            entries = self._metadata_cache[presentation_id] = {}
+        key = fields or ""
+        cached = entries.get(key)
+        now = time.monotonic()
+        if cached is not None:
+            fetched_at, presentation = cached
+            if now - fetched_at < self.METADATA_CACHE_TTL:
+                return presentation
+            revision_id = presentation.get("revisionId")
+            if revision_id is not None and revision_id == self.execute(
+                self._presentations
+                .get(presentationId=presentation_id, fields="revisionId")
+            ).get("revisionId"):
+                entries[key] = (now, presentation)
+                return presentation
+
+        # Masked responses carry the revisionId too, so they can be revalidated.
+        presentation = self.execute(
+            self._presentations
+            .get(presentationId=presentation_id, fields=fields and f"revisionId,{fields}")
+        )
+        entries[key] = (now, presentation)
+        return presentation
+
+    def _batch_update(self, presentation_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send a batchUpdate for the presentation and return the response.
+
+        Cached responses for the presentation are dropped first, since they no
+        longer describe it once the update lands.
+        """
+        self._metadata_cache.pop(presentation_id, None)
+        result: dict[str, Any] = self.execute(
+            self._presentations
+            .batchUpdate(presentationId=presentation_id, body={"requests": requests})
+        )
+        return result
+
+    @_api_error("slides.metadata")
     def metadata(self, presentation_id: str) -> dict[str, Any]:
-        """Get presentation metadata."""
-        try:
-            presentation = self.execute(
-                self.service.presentations()
-                .get(presentationId=presentation_id)
+        """Get presentation metadata.
+
+        A compact index of the slides: each slide's ID, element count and
+        element types, without their text. Use read() with a page ID, or
+        read_pages(), for the content of the slides that matter. Only those
+        fields are requested, so the returned presentation holds just them.
+        """
+        presentation = self._get_presentation(presentation_id, _METADATA_FIELDS)
+
+        slides = []
+        for i, slide in enumerate(presentation.get("slides", [])):
+            elements = slide.get("pageElements", [])
+            slides.append({
+                "object_id": slide["objectId"],
+                "index": i,
+                "element_count": len(elements),
+                "element_types": dict(Counter(map(self._get_element_type, elements))),
+            })
+
+        output_success(
+            operation="slides.metadata",
+            presentation_id=presentation_id,
+            title=presentation.get("title", ""),
+            slide_count=len(slides),
+            slides=slides,
+        )
+        return presentation
+
+    @_api_error("slides.read")
+    def read(
+        self,
+        presentation_id: str,
+        page_object_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Read presentation or page content.
+
+        Only the fields the summary uses are requested, so the returned
+        presentation or page is partial.
+        """
+        if page_object_id:
+            page = self.execute(
+                self._pages
+                .get(
+                    presentationId=presentation_id,
+                    pageObjectId=page_object_id,
+                    fields=_PAGE_ELEMENT_FIELDS,
+                )
+            )
+
+            element_info = self._element_info
+            elements = [element_info(elem) for elem in page.get("pageElements", ())]
+
+            output_external_content(
+                operation="slides.read",
+                source_type="slide",
+                source_id=presentation_id,
+                content_fields={
+                    "elements": json.dumps(elements),
+                },
+                presentation_id=presentation_id,
+                page_object_id=page_object_id,
+                element_count=len(elements),
             )
+            return page
+        else:
+            presentation = self._get_presentation(presentation_id, _READ_FIELDS)
 
-            slides = [
+            element_info = self._element_info
+            slides_info = [
                 {
                     "object_id": slide["objectId"],
                     "index": i,
-                    "element_count": len(slide.get("pageElements", [])),
+                    "elements": [
+                        element_info(elem) for elem in slide.get("pageElements", ())
+                    ],
                 }
-                for i, slide in enumerate(presentation.get("slides", []))
+                for i, slide in enumerate(presentation.get("slides", ()))
             ]
 
-            output_success(
-                operation="slides.metadata",
+            output_external_content(
+                operation="slides.read",
+                source_type="slide",
+                source_id=presentation_id,
+                content_fields={
+                    "slides": json.dumps(slides_info),
+                },
                 presentation_id=presentation_id,
                 title=presentation.get("title", ""),
-                slide_count=len(slides),
-                slides=slides,
+                slide_count=len(slides_info),
             )
             return presentation
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.metadata",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
-    def read(
+    @_api_error("slides.read_pages")
+    def read_pages(
         self,
         presentation_id: str,
-        page_object_id: str | None = None,
+        page_object_ids: list[str],
     ) -> dict[str, Any]:
-        """Read presentation or page content."""
-        try:
-            if page_object_id:
-                page = self.execute(
-                    self.service.presentations()
-                    .pages()
-                    .get(presentationId=presentation_id, pageObjectId=page_object_id)
-                )
+        """Read several pages in one HTTP round trip.
 
-                elements = []
-                for elem in page.get("pageElements", []):
-                    elem_info = {
-                        "object_id": elem["objectId"],
-                        "type": self._get_element_type(elem),
-                    }
-                    if "shape" in elem and "text" in elem["shape"]:
-                        elem_info["text"] = self._extract_text(elem["shape"]["text"])
-                    elements.append(elem_info)
-
-                output_external_content(
-                    operation="slides.read",
-                    source_type="slide",
-                    source_id=presentation_id,
-                    content_fields={
-                        "elements": json.dumps(elements),
-                    },
-                    presentation_id=presentation_id,
-                    page_object_id=page_object_id,
-                    element_count=len(elements),
-                )
-                return page
-            else:
-                presentation = self.execute(
-                    self.service.presentations()
-                    .get(presentationId=presentation_id)
-                )
+        The page GETs are sent together as a single batch request. Pages that
+        fail to load are reported in `failed_ids` instead of aborting the read.
 
-                slides_info = []
-                for i, slide in enumerate(presentation.get("slides", [])):
-                    slide_info = {
-                        "object_id": slide["objectId"],
-                        "index": i,
-                        "elements": [],
-                    }
-                    for elem in slide.get("pageElements", []):
-                        elem_info = {
-                            "object_id": elem["objectId"],
-                            "type": self._get_element_type(elem),
-                        }
-                        if "shape" in elem and "text" in elem["shape"]:
-                            elem_info["text"] = self._extract_text(elem["shape"]["text"])
-                        slide_info["elements"].append(elem_info)
-                    slides_info.append(slide_info)
-
-                output_external_content(
-                    operation="slides.read",
-                    source_type="slide",
-                    source_id=presentation_id,
-                    content_fields={
-                        "slides": json.dumps(slides_info),
-                    },
-                    presentation_id=presentation_id,
-                    title=presentation.get("title", ""),
-                    slide_count=len(slides_info),
-                )
-                return presentation
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.read",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        Returns:
+            Page responses keyed by page object ID, for the pages that loaded.
+            Like read(), only the summarized fields are requested.
+        """
+        page_object_ids = list(dict.fromkeys(page_object_ids))
+        if not page_object_ids:
+            raise InvalidArgsError("At least one page object ID is required")
+
+        # The batch bypasses execute(), so send anything queued first.
+        if self._batch is not None and self._batch.pending:
+            self._batch.flush()
+
+        pages: dict[str, Any] = {}
+        page_errors: dict[str, str] = {}
+
+        def handle_response(request_id: str, response: Any, exception: Any) -> None:
+            if exception is None:
+                pages[request_id] = response
+            else:
+                page_errors[request_id] = str(exception)
+
+        batch = self.service.new_batch_http_request(callback=handle_response)
+        for page_object_id in page_object_ids:
+            batch.add(
+                self._pages.get(
+                    presentationId=presentation_id,
+                    pageObjectId=page_object_id,
+                    fields=_PAGE_ELEMENT_FIELDS,
+                ),
+                request_id=page_object_id,
+            )
+        batch.execute()
+
+        element_info = self._element_info
+        pages_info = [
+            {
+                "object_id": page_object_id,
+                "elements": [
+                    element_info(elem) for elem in pages[page_object_id].get("pageElements", ())
+                ],
+            }
+            for page_object_id in page_object_ids
+            if page_object_id in pages
+        ]
+
+        output_kwargs: dict[str, Any] = {
+            "presentation_id": presentation_id,
+            "page_count": len(pages_info),
+        }
+        if page_errors:
+            output_kwargs["failed_ids"] = page_errors
+        output_external_content(
+            operation="slides.read_pages",
+            source_type="slide",
+            source_id=presentation_id,
+            content_fields={
+                "pages": json.dumps(pages_info),
+            },
+            **output_kwargs,
+        )
+        return pages
+
+    def _element_info(self, element: dict) -> dict[str, Any]:
+        """Summarize a page element for read(): its ID, type and any shape text."""
+        info = {
+            "object_id": element["objectId"],
+            "type": self._get_element_type(element),
+        }
+        shape = element.get("shape")
+        if shape is not None and "text" in shape:
+            info["text"] = self._extract_text(shape["text"])
+        return info
 
     def _get_element_type(self, element: dict) -> str:
         """Determine element type."""
         if "shape" in element:
             return element["shape"].get("shapeType", "SHAPE")
-        if "image" in element:
-            return "IMAGE"
-        if "table" in element:
-            return "TABLE"
-        if "line" in element:
-            return "LINE"
-        if "video" in element:
-            return "VIDEO"
+        for key, element_type in _ELEMENT_TYPES:
+            if key in element:
+                return element_type
         return "UNKNOWN"
 
     def _extract_text(self, text_content: dict) -> str:
         """Extract plain text from text content."""
-        parts = []
-        for element in text_content.get("textElements", []):
-            if "textRun" in element:
-                parts.append(element["textRun"].get("content", ""))
-        return "".join(parts).strip()
+        return "".join(
+            element["textRun"].get("content", "")
+            for element in text_content.get("textElements", ())
+            if "textRun" in element
+        ).strip()
 
+    @_api_error("slides.create")
     def create(
         self,
         title: str,
         folder_id: str | None = None,
     ) -> dict[str, Any]:
         """Create a new presentation."""
-        try:
-            presentation = self.execute(
-                self.service.presentations()
-                .create(body={"title": title})
-            )
-            presentation_id = presentation["presentationId"]
-
-            # Move to folder if specified
-            if folder_id:
-                file = self.execute(
-                    self.drive_service.files().get(
-                        fileId=presentation_id, fields="parents"
-                    )
-                )
-                previous_parents = ",".join(file.get("parents", []))
-
-                self.execute(
-                    self.drive_service.files().update(
-                        fileId=presentation_id,
-                        addParents=folder_id,
-                        removeParents=previous_parents,
-                        fields="id, parents",
-                    )
+        presentation = self.execute(
+            self._presentations
+            .create(body={"title": title})
+        )
+        presentation_id = presentation["presentationId"]
+
+        # Move to folder if specified
+        if folder_id:
+            file = self.execute(
+                self.drive_service.files().get(
+                    fileId=presentation_id, fields="parents"
                 )
-
-            output_success(
-                operation="slides.create",
-                presentation_id=presentation_id,
-                title=title,
-                web_view_link=f"https://docs.google.com/presentation/d/{presentation_id}/edit",
             )
-            return presentation
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.create",
-                message=f"Google Slides API error: {e.reason}",
+            previous_parents = ",".join(file.get("parents", []))
+
+            self.execute(
+                self.drive_service.files().update(
+                    fileId=presentation_id,
+                    addParents=folder_id,
+                    removeParents=previous_parents,
+                    fields="id, parents",
+                )
             )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        output_success(
+            operation="slides.create",
+            presentation_id=presentation_id,
+            title=title,
+            web_view_link=f"https://docs.google.com/presentation/d/{presentation_id}/edit",
+        )
+        return presentation
+
+    @_api_error("slides.add_slide")
     def add_slide(
         self,
         presentation_id: str,
         layout: str = "BLANK",
         insertion_index: int | None = None,
-    ) -> dict[str, Any]:
-        """Add a new slide to the presentation."""
-        try:
-            slide_id = self._generate_object_id()
+    ) -> dict[str, Any] | str:
+        """Add a new slide to the presentation.
 
-            request: dict[str, Any] = {
-                "createSlide": {
-                    "objectId": slide_id,
-                    "slideLayoutReference": {
-                        "predefinedLayout": self.PREDEFINED_LAYOUTS.get(layout, layout)
-                    },
-                }
-            }
+        Inside a batch, returns the new slide's object ID.
+        """
+        layout = layout.upper()
+        if layout not in self.PREDEFINED_LAYOUTS:
+            raise InvalidArgsError(
+                f"layout must be one of: {sorted(self.PREDEFINED_LAYOUTS)}"
+            )
 
-            if insertion_index is not None:
-                request["createSlide"]["insertionIndex"] = insertion_index
+        slide_id = self._generate_object_id()
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        request: dict[str, Any] = {
+            "createSlide": {
+                "objectId": slide_id,
+                "slideLayoutReference": {"predefinedLayout": layout},
+            }
+        }
 
-            output_success(
-                operation="slides.add_slide",
-                presentation_id=presentation_id,
-                slide_id=slide_id,
-                layout=layout,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.add_slide",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        if insertion_index is not None:
+            request["createSlide"]["insertionIndex"] = insertion_index
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.add_slide",
+            queued_result=slide_id,
+            slide_id=slide_id,
+            layout=layout,
+        )
 
+    @_api_error("slides.delete_slide")
     def delete_slide(
         self,
         presentation_id: str,
         slide_id: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a slide from the presentation."""
-        try:
-            request = {"deleteObject": {"objectId": slide_id}}
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        request = {"deleteObject": {"objectId": slide_id}}
 
-            output_success(
-                operation="slides.delete_slide",
-                presentation_id=presentation_id,
-                deleted_slide_id=slide_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.delete_slide",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.delete_slide",
+            deleted_slide_id=slide_id,
+        )
 
+    @_api_error("slides.duplicate_slide")
     def duplicate_slide(
         self,
         presentation_id: str,
         slide_id: str,
-    ) -> dict[str, Any]:
-        """Duplicate a slide."""
-        try:
-            new_slide_id = self._generate_object_id()
-
-            request = {
-                "duplicateObject": {
-                    "objectId": slide_id,
-                    "objectIds": {slide_id: new_slide_id},
-                }
-            }
+    ) -> dict[str, Any] | str:
+        """Duplicate a slide.
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.duplicate_slide",
-                presentation_id=presentation_id,
-                original_slide_id=slide_id,
-                new_slide_id=new_slide_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.duplicate_slide",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        Inside a batch, returns the duplicate's object ID.
+        """
+        new_slide_id = self._generate_object_id()
 
+        request = {
+            "duplicateObject": {
+                "objectId": slide_id,
+                "objectIds": {slide_id: new_slide_id},
+            }
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.duplicate_slide",
+            queued_result=new_slide_id,
+            original_slide_id=slide_id,
+            new_slide_id=new_slide_id,
+        )
+
+    @_api_error("slides.insert_text")
     def insert_text(
         self,
         presentation_id: str,
         object_id: str,
         text: str,
         insertion_index: int = 0,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Insert text into a shape."""
-        try:
-            request = {
-                "insertText": {
-                    "objectId": object_id,
-                    "insertionIndex": insertion_index,
-                    "text": text,
-                }
+        request = {
+            "insertText": {
+                "objectId": object_id,
+                "insertionIndex": insertion_index,
+                "text": text,
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_text",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                text_length=len(text),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_text",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_text",
+            object_id=object_id,
+            text_length=len(text),
+        )
 
+    @_api_error("slides.replace_text")
     def replace_text(
         self,
         presentation_id: str,
@@ -371,30 +781,23 @@ class SlidesService(BaseService):
         replace_with: str,
         match_case: bool = False,
         page_object_ids: list[str] | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Replace text throughout the presentation."""
-        try:
-            request: dict[str, Any] = {
-                "replaceAllText": {
-                    "containsText": {
-                        "text": find,
-                        "matchCase": match_case,
-                    },
-                    "replaceText": replace_with,
-                }
+        request: dict[str, Any] = {
+            "replaceAllText": {
+                "containsText": {
+                    "text": find,
+                    "matchCase": match_case,
+                },
+                "replaceText": replace_with,
             }
+        }
 
-            if page_object_ids:
-                request["replaceAllText"]["pageObjectIds"] = page_object_ids
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        if page_object_ids:
+            request["replaceAllText"]["pageObjectIds"] = page_object_ids
 
-            replies = result.get("replies", [{}])
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
+            replies = result.get("replies") or [{}]
             occurrences = replies[0].get("replaceAllText", {}).get(
                 "occurrencesChanged", 0
             )
@@ -407,14 +810,10 @@ class SlidesService(BaseService):
                 occurrences_changed=occurrences,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.replace_text",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
 
+        return self._submit(presentation_id, [request], on_reply)
+
+    @_api_error("slides.create_textbox")
     def create_textbox(
         self,
         presentation_id: str,
@@ -424,64 +823,41 @@ class SlidesService(BaseService):
         y: float,
         width: float,
         height: float,
-    ) -> dict[str, Any]:
-        """Create a text box on a slide."""
-        try:
-            textbox_id = self._generate_object_id()
-
-            requests = [
-                {
-                    "createShape": {
-                        "objectId": textbox_id,
-                        "shapeType": "TEXT_BOX",
-                        "elementProperties": {
-                            "pageObjectId": page_object_id,
-                            "size": {
-                                "width": {"magnitude": width, "unit": "PT"},
-                                "height": {"magnitude": height, "unit": "PT"},
-                            },
-                            "transform": {
-                                "scaleX": 1,
-                                "scaleY": 1,
-                                "translateX": x,
-                                "translateY": y,
-                                "unit": "PT",
-                            },
-                        },
-                    }
-                },
-                {
-                    "insertText": {
-                        "objectId": textbox_id,
-                        "insertionIndex": 0,
-                        "text": text,
-                    }
-                },
-            ]
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": requests}
-                )
-            )
+    ) -> dict[str, Any] | str:
+        """Create a text box on a slide.
 
-            output_success(
-                operation="slides.create_textbox",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                textbox_id=textbox_id,
-                position={"x": x, "y": y, "width": width, "height": height},
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.create_textbox",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        Inside a batch, returns the new text box's object ID.
+        """
+        textbox_id = self._generate_object_id()
 
+        requests = [
+            {
+                "createShape": {
+                    "objectId": textbox_id,
+                    "shapeType": "TEXT_BOX",
+                    "elementProperties": _element_properties(page_object_id, x, y, width, height),
+                }
+            },
+            {
+                "insertText": {
+                    "objectId": textbox_id,
+                    "insertionIndex": 0,
+                    "text": text,
+                }
+            },
+        ]
+
+        return self._submit_and_report(
+            presentation_id,
+            requests,
+            "slides.create_textbox",
+            queued_result=textbox_id,
+            page_object_id=page_object_id,
+            textbox_id=textbox_id,
+            position={"x": x, "y": y, "width": width, "height": height},
+        )
+
+    @_api_error("slides.insert_image")
     def insert_image(
         self,
         presentation_id: str,
@@ -491,89 +867,48 @@ class SlidesService(BaseService):
         y: float,
         width: float | None = None,
         height: float | None = None,
-    ) -> dict[str, Any]:
-        """Insert an image on a slide."""
-        try:
-            image_id = self._generate_object_id()
-
-            element_properties: dict[str, Any] = {
-                "pageObjectId": page_object_id,
-                "transform": {
-                    "scaleX": 1,
-                    "scaleY": 1,
-                    "translateX": x,
-                    "translateY": y,
-                    "unit": "PT",
-                },
-            }
+    ) -> dict[str, Any] | str:
+        """Insert an image on a slide.
 
-            if width is not None and height is not None:
-                element_properties["size"] = {
-                    "width": {"magnitude": width, "unit": "PT"},
-                    "height": {"magnitude": height, "unit": "PT"},
-                }
+        Inside a batch, returns the new image's object ID.
+        """
+        image_id = self._generate_object_id()
 
-            request = {
-                "createImage": {
-                    "objectId": image_id,
-                    "url": image_url,
-                    "elementProperties": element_properties,
-                }
+        request = {
+            "createImage": {
+                "objectId": image_id,
+                "url": image_url,
+                "elementProperties": _element_properties(page_object_id, x, y, width, height),
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_image",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                image_id=image_id,
-                image_url=image_url,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_image",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_image",
+            queued_result=image_id,
+            page_object_id=page_object_id,
+            image_id=image_id,
+            image_url=image_url,
+        )
+
+    @_api_error("slides.delete_element")
     def delete_element(
         self,
         presentation_id: str,
         object_id: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete an element from a slide."""
-        try:
-            request = {"deleteObject": {"objectId": object_id}}
+        request = {"deleteObject": {"objectId": object_id}}
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.delete_element",
-                presentation_id=presentation_id,
-                deleted_object_id=object_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.delete_element",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.delete_element",
+            deleted_object_id=object_id,
+        )
 
+    @_api_error("slides.format_text")
     def format_text(
         self,
         presentation_id: str,
@@ -583,69 +918,48 @@ class SlidesService(BaseService):
         underline: bool | None = None,
         font_size: int | None = None,
         foreground_color: str | None = None,
-    ) -> dict[str, Any]:
-        """Apply formatting to text in an element."""
-        try:
-            text_style: dict[str, Any] = {}
-            fields = []
-
-            if bold is not None:
-                text_style["bold"] = bold
-                fields.append("bold")
-            if italic is not None:
-                text_style["italic"] = italic
-                fields.append("italic")
-            if underline is not None:
-                text_style["underline"] = underline
-                fields.append("underline")
-            if font_size is not None:
-                text_style["fontSize"] = {"magnitude": font_size, "unit": "PT"}
-                fields.append("fontSize")
-            if foreground_color is not None:
-                from gws.utils.colors import parse_hex_color
-                rgb = parse_hex_color(foreground_color)
-                text_style["foregroundColor"] = {"opaqueColor": {"rgbColor": rgb}}
-                fields.append("foregroundColor")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.format_text",
-                    message="At least one formatting option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            request = {
-                "updateTextStyle": {
-                    "objectId": object_id,
-                    "style": text_style,
-                    "textRange": {"type": "ALL"},
-                    "fields": ",".join(fields),
-                }
-            }
+    ) -> dict[str, Any] | None:
+        """Apply formatting to text in an element.
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        Only the given options are changed. Style keys are the API field names,
+        so they double as the fields mask; format_text_extended() and
+        format_paragraph() build theirs the same way.
+        """
+        text_style: dict[str, Any] = {}
+
+        if bold is not None:
+            text_style["bold"] = bold
+        if italic is not None:
+            text_style["italic"] = italic
+        if underline is not None:
+            text_style["underline"] = underline
+        if font_size is not None:
+            text_style["fontSize"] = {"magnitude": font_size, "unit": "PT"}
+        if foreground_color is not None:
+            rgb = parse_color_arg(foreground_color)
+            text_style["foregroundColor"] = {"opaqueColor": {"rgbColor": rgb}}
+
+        if not text_style:
+            raise InvalidArgsError("At least one formatting option required")
+
+        request = {
+            "updateTextStyle": {
+                "objectId": object_id,
+                "style": text_style,
+                "textRange": {"type": "ALL"},
+                "fields": ",".join(text_style),
+            }
+        }
 
-            output_success(
-                operation="slides.format_text",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                formatting=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.format_text",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.format_text",
+            object_id=object_id,
+            formatting=list(text_style),
+        )
 
+    @_api_error("slides.format_text_extended")
     def format_text_extended(
         self,
         presentation_id: str,
@@ -664,7 +978,7 @@ class SlidesService(BaseService):
         background_color: str | None = None,
         baseline_offset: str | None = None,
         link_url: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Apply extended formatting to text in an element.
 
         Args:
@@ -685,118 +999,75 @@ class SlidesService(BaseService):
             baseline_offset: Baseline offset ("SUPERSCRIPT" or "SUBSCRIPT").
             link_url: URL to link the text to.
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            text_style: dict[str, Any] = {}
-            fields = []
-
-            if bold is not None:
-                text_style["bold"] = bold
-                fields.append("bold")
-            if italic is not None:
-                text_style["italic"] = italic
-                fields.append("italic")
-            if underline is not None:
-                text_style["underline"] = underline
-                fields.append("underline")
-            if strikethrough is not None:
-                text_style["strikethrough"] = strikethrough
-                fields.append("strikethrough")
-            if small_caps is not None:
-                text_style["smallCaps"] = small_caps
-                fields.append("smallCaps")
-            if font_size is not None:
-                text_style["fontSize"] = {"magnitude": font_size, "unit": "PT"}
-                fields.append("fontSize")
-            if foreground_color is not None:
-                rgb = parse_hex_color(foreground_color)
-                text_style["foregroundColor"] = {"opaqueColor": {"rgbColor": rgb}}
-                fields.append("foregroundColor")
-            if background_color is not None:
-                rgb = parse_hex_color(background_color)
-                text_style["backgroundColor"] = {"opaqueColor": {"rgbColor": rgb}}
-                fields.append("backgroundColor")
-            if baseline_offset is not None:
-                valid_offsets = {"SUPERSCRIPT", "SUBSCRIPT", "NONE"}
-                if baseline_offset.upper() not in valid_offsets:
-                    output_error(
-                        error_code="INVALID_ARGS",
-                        operation="slides.format_text_extended",
-                        message=f"baseline_offset must be one of: {valid_offsets}",
-                    )
-                    raise SystemExit(ExitCode.INVALID_ARGS)
-                text_style["baselineOffset"] = baseline_offset.upper()
-                fields.append("baselineOffset")
-            if link_url is not None:
-                text_style["link"] = {"url": link_url}
-                fields.append("link")
-            if font_family is not None or font_weight is not None:
-                weighted_font: dict[str, Any] = {}
-                if font_family is not None:
-                    weighted_font["fontFamily"] = font_family
-                if font_weight is not None:
-                    if font_weight < 100 or font_weight > 900 or font_weight % 100 != 0:
-                        output_error(
-                            error_code="INVALID_ARGS",
-                            operation="slides.format_text_extended",
-                            message="font_weight must be 100-900 in increments of 100",
-                        )
-                        raise SystemExit(ExitCode.INVALID_ARGS)
-                    weighted_font["weight"] = font_weight
-                text_style["weightedFontFamily"] = weighted_font
-                fields.append("weightedFontFamily")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.format_text_extended",
-                    message="At least one formatting option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            # Build text range
-            if start_index is not None and end_index is not None:
-                text_range = {
-                    "type": "FIXED_RANGE",
-                    "startIndex": start_index,
-                    "endIndex": end_index,
-                }
-            else:
-                text_range = {"type": "ALL"}
-
-            request = {
-                "updateTextStyle": {
-                    "objectId": object_id,
-                    "style": text_style,
-                    "textRange": text_range,
-                    "fields": ",".join(fields),
-                }
+        text_style: dict[str, Any] = {}
+
+        if bold is not None:
+            text_style["bold"] = bold
+        if italic is not None:
+            text_style["italic"] = italic
+        if underline is not None:
+            text_style["underline"] = underline
+        if strikethrough is not None:
+            text_style["strikethrough"] = strikethrough
+        if small_caps is not None:
+            text_style["smallCaps"] = small_caps
+        if font_size is not None:
+            text_style["fontSize"] = {"magnitude": font_size, "unit": "PT"}
+        if foreground_color is not None:
+            rgb = parse_color_arg(foreground_color)
+            text_style["foregroundColor"] = {"opaqueColor": {"rgbColor": rgb}}
+        if background_color is not None:
+            rgb = parse_color_arg(background_color)
+            text_style["backgroundColor"] = {"opaqueColor": {"rgbColor": rgb}}
+        if baseline_offset is not None:
+            valid_offsets = {"SUPERSCRIPT", "SUBSCRIPT", "NONE"}
+            if baseline_offset.upper() not in valid_offsets:
+                raise InvalidArgsError(f"baseline_offset must be one of: {valid_offsets}")
+            text_style["baselineOffset"] = baseline_offset.upper()
+        if link_url is not None:
+            text_style["link"] = {"url": link_url}
+        if font_family is not None or font_weight is not None:
+            weighted_font: dict[str, Any] = {}
+            if font_family is not None:
+                weighted_font["fontFamily"] = font_family
+            if font_weight is not None:
+                if font_weight < 100 or font_weight > 900 or font_weight % 100 != 0:
+                    raise InvalidArgsError("font_weight must be 100-900 in increments of 100")
+                weighted_font["weight"] = font_weight
+            text_style["weightedFontFamily"] = weighted_font
+
+        if not text_style:
+            raise InvalidArgsError("At least one formatting option required")
+
+        # Build text range
+        if start_index is not None and end_index is not None:
+            text_range = {
+                "type": "FIXED_RANGE",
+                "startIndex": start_index,
+                "endIndex": end_index,
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.format_text_extended",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                formatting=fields,
-                text_range=text_range,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.format_text_extended",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        else:
+            text_range = {"type": "ALL"}
+
+        request = {
+            "updateTextStyle": {
+                "objectId": object_id,
+                "style": text_style,
+                "textRange": text_range,
+                "fields": ",".join(text_style),
+            }
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.format_text_extended",
+            object_id=object_id,
+            formatting=list(text_style),
+            text_range=text_range,
+        )
+
+    @_api_error("slides.format_paragraph")
     def format_paragraph(
         self,
         presentation_id: str,
@@ -810,7 +1081,7 @@ class SlidesService(BaseService):
         indent_first_line: float | None = None,
         indent_start: float | None = None,
         indent_end: float | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Apply paragraph formatting to text in an element.
 
         Args:
@@ -826,96 +1097,64 @@ class SlidesService(BaseService):
             indent_start: Start (left) indent in points.
             indent_end: End (right) indent in points.
         """
-        try:
-            paragraph_style: dict[str, Any] = {}
-            fields = []
-
-            if alignment is not None:
-                valid_alignments = {"START", "CENTER", "END", "JUSTIFIED"}
-                if alignment.upper() not in valid_alignments:
-                    output_error(
-                        error_code="INVALID_ARGS",
-                        operation="slides.format_paragraph",
-                        message=f"alignment must be one of: {valid_alignments}",
-                    )
-                    raise SystemExit(ExitCode.INVALID_ARGS)
-                paragraph_style["alignment"] = alignment.upper()
-                fields.append("alignment")
-            if line_spacing is not None:
-                paragraph_style["lineSpacing"] = line_spacing
-                fields.append("lineSpacing")
-            if space_above is not None:
-                paragraph_style["spaceAbove"] = {"magnitude": space_above, "unit": "PT"}
-                fields.append("spaceAbove")
-            if space_below is not None:
-                paragraph_style["spaceBelow"] = {"magnitude": space_below, "unit": "PT"}
-                fields.append("spaceBelow")
-            if indent_first_line is not None:
-                paragraph_style["indentFirstLine"] = {
-                    "magnitude": indent_first_line,
-                    "unit": "PT",
-                }
-                fields.append("indentFirstLine")
-            if indent_start is not None:
-                paragraph_style["indentStart"] = {
-                    "magnitude": indent_start,
-                    "unit": "PT",
-                }
-                fields.append("indentStart")
-            if indent_end is not None:
-                paragraph_style["indentEnd"] = {"magnitude": indent_end, "unit": "PT"}
-                fields.append("indentEnd")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.format_paragraph",
-                    message="At least one formatting option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            # Build text range
-            if start_index is not None and end_index is not None:
-                text_range = {
-                    "type": "FIXED_RANGE",
-                    "startIndex": start_index,
-                    "endIndex": end_index,
-                }
-            else:
-                text_range = {"type": "ALL"}
-
-            request = {
-                "updateParagraphStyle": {
-                    "objectId": object_id,
-                    "style": paragraph_style,
-                    "textRange": text_range,
-                    "fields": ",".join(fields),
-                }
+        paragraph_style: dict[str, Any] = {}
+
+        if alignment is not None:
+            valid_alignments = {"START", "CENTER", "END", "JUSTIFIED"}
+            if alignment.upper() not in valid_alignments:
+                raise InvalidArgsError(f"alignment must be one of: {valid_alignments}")
+            paragraph_style["alignment"] = alignment.upper()
+        if line_spacing is not None:
+            paragraph_style["lineSpacing"] = line_spacing
+        if space_above is not None:
+            paragraph_style["spaceAbove"] = {"magnitude": space_above, "unit": "PT"}
+        if space_below is not None:
+            paragraph_style["spaceBelow"] = {"magnitude": space_below, "unit": "PT"}
+        if indent_first_line is not None:
+            paragraph_style["indentFirstLine"] = {
+                "magnitude": indent_first_line,
+                "unit": "PT",
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.format_paragraph",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                formatting=fields,
-                text_range=text_range,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.format_paragraph",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        if indent_start is not None:
+            paragraph_style["indentStart"] = {
+                "magnitude": indent_start,
+                "unit": "PT",
+            }
+        if indent_end is not None:
+            paragraph_style["indentEnd"] = {"magnitude": indent_end, "unit": "PT"}
+
+        if not paragraph_style:
+            raise InvalidArgsError("At least one formatting option required")
+
+        # Build text range
+        if start_index is not None and end_index is not None:
+            text_range = {
+                "type": "FIXED_RANGE",
+                "startIndex": start_index,
+                "endIndex": end_index,
+            }
+        else:
+            text_range = {"type": "ALL"}
+
+        request = {
+            "updateParagraphStyle": {
+                "objectId": object_id,
+                "style": paragraph_style,
+                "textRange": text_range,
+                "fields": ",".join(paragraph_style),
+            }
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.format_paragraph",
+            object_id=object_id,
+            formatting=list(paragraph_style),
+            text_range=text_range,
+        )
+
+    @_api_error("slides.create_shape")
     def create_shape(
         self,
         presentation_id: str,
@@ -925,9 +1164,11 @@ class SlidesService(BaseService):
         y: float,
         width: float,
         height: float,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | str:
         """Create a shape on a slide.
 
+        Inside a batch, returns the new shape's object ID.
+
         Args:
             presentation_id: The presentation ID.
             page_object_id: The slide/page object ID.
@@ -937,54 +1178,28 @@ class SlidesService(BaseService):
             width: Width in points.
             height: Height in points.
         """
-        try:
-            shape_id = self._generate_object_id()
+        shape_id = self._generate_object_id()
 
-            request = {
-                "createShape": {
-                    "objectId": shape_id,
-                    "shapeType": shape_type.upper(),
-                    "elementProperties": {
-                        "pageObjectId": page_object_id,
-                        "size": {
-                            "width": {"magnitude": width, "unit": "PT"},
-                            "height": {"magnitude": height, "unit": "PT"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "translateX": x,
-                            "translateY": y,
-                            "unit": "PT",
-                        },
-                    },
-                }
+        request = {
+            "createShape": {
+                "objectId": shape_id,
+                "shapeType": shape_type.upper(),
+                "elementProperties": _element_properties(page_object_id, x, y, width, height),
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.create_shape",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                shape_id=shape_id,
-                shape_type=shape_type.upper(),
-                position={"x": x, "y": y, "width": width, "height": height},
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.create_shape",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.create_shape",
+            queued_result=shape_id,
+            page_object_id=page_object_id,
+            shape_id=shape_id,
+            shape_type=shape_type.upper(),
+            position={"x": x, "y": y, "width": width, "height": height},
+        )
+
+    @_api_error("slides.format_shape")
     def format_shape(
         self,
         presentation_id: str,
@@ -993,7 +1208,7 @@ class SlidesService(BaseService):
         outline_color: str | None = None,
         outline_weight: float | None = None,
         outline_dash_style: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Format a shape's appearance.
 
         Args:
@@ -1004,81 +1219,55 @@ class SlidesService(BaseService):
             outline_weight: Outline weight in points.
             outline_dash_style: Dash style (SOLID, DOT, DASH, DASH_DOT, LONG_DASH).
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            shape_properties: dict[str, Any] = {}
-            fields = []
-
-            if fill_color is not None:
-                rgb = parse_hex_color(fill_color)
-                shape_properties["shapeBackgroundFill"] = {
-                    "solidFill": {"color": {"rgbColor": rgb}}
-                }
-                fields.append("shapeBackgroundFill")
-
-            if (
-                outline_color is not None
-                or outline_weight is not None
-                or outline_dash_style is not None
-            ):
-                outline: dict[str, Any] = {}
-                if outline_color is not None:
-                    rgb = parse_hex_color(outline_color)
-                    outline["outlineFill"] = {"solidFill": {"color": {"rgbColor": rgb}}}
-                if outline_weight is not None:
-                    outline["weight"] = {"magnitude": outline_weight, "unit": "PT"}
-                if outline_dash_style is not None:
-                    valid_styles = {"SOLID", "DOT", "DASH", "DASH_DOT", "LONG_DASH"}
-                    if outline_dash_style.upper() not in valid_styles:
-                        output_error(
-                            error_code="INVALID_ARGS",
-                            operation="slides.format_shape",
-                            message=f"outline_dash_style must be one of: {valid_styles}",
-                        )
-                        raise SystemExit(ExitCode.INVALID_ARGS)
-                    outline["dashStyle"] = outline_dash_style.upper()
-                shape_properties["outline"] = outline
-                fields.append("outline")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.format_shape",
-                    message="At least one formatting option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        shape_properties: dict[str, Any] = {}
+        fields = []
 
-            request = {
-                "updateShapeProperties": {
-                    "objectId": object_id,
-                    "shapeProperties": shape_properties,
-                    "fields": ",".join(fields),
-                }
+        if fill_color is not None:
+            rgb = parse_color_arg(fill_color)
+            shape_properties["shapeBackgroundFill"] = {
+                "solidFill": {"color": {"rgbColor": rgb}}
             }
+            fields.append("shapeBackgroundFill")
+
+        if (
+            outline_color is not None
+            or outline_weight is not None
+            or outline_dash_style is not None
+        ):
+            outline: dict[str, Any] = {}
+            if outline_color is not None:
+                rgb = parse_color_arg(outline_color)
+                outline["outlineFill"] = {"solidFill": {"color": {"rgbColor": rgb}}}
+            if outline_weight is not None:
+                outline["weight"] = {"magnitude": outline_weight, "unit": "PT"}
+            if outline_dash_style is not None:
+                valid_styles = {"SOLID", "DOT", "DASH", "DASH_DOT", "LONG_DASH"}
+                if outline_dash_style.upper() not in valid_styles:
+                    raise InvalidArgsError(f"outline_dash_style must be one of: {valid_styles}")
+                outline["dashStyle"] = outline_dash_style.upper()
+            shape_properties["outline"] = outline
+            fields.append("outline")
+
+        if not fields:
+            raise InvalidArgsError("At least one formatting option required")
+
+        request = {
+            "updateShapeProperties": {
+                "objectId": object_id,
+                "shapeProperties": shape_properties,
+                "fields": ",".join(fields),
+            }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.format_shape",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                formatting=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.format_shape",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.format_shape",
+            object_id=object_id,
+            formatting=fields,
+        )
 
+    @_api_error("slides.insert_table")
     def insert_table(
         self,
         presentation_id: str,
@@ -1089,9 +1278,11 @@ class SlidesService(BaseService):
         y: float,
         width: float,
         height: float,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | str:
         """Insert a table on a slide.
 
+        Inside a batch, returns the new table's object ID.
+
         Args:
             presentation_id: The presentation ID.
             page_object_id: The slide/page object ID.
@@ -1102,62 +1293,36 @@ class SlidesService(BaseService):
             width: Width in points.
             height: Height in points.
         """
-        try:
-            table_id = self._generate_object_id()
-
-            request = {
-                "createTable": {
-                    "objectId": table_id,
-                    "rows": rows,
-                    "columns": columns,
-                    "elementProperties": {
-                        "pageObjectId": page_object_id,
-                        "size": {
-                            "width": {"magnitude": width, "unit": "PT"},
-                            "height": {"magnitude": height, "unit": "PT"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "translateX": x,
-                            "translateY": y,
-                            "unit": "PT",
-                        },
-                    },
-                }
+        table_id = self._generate_object_id()
+
+        request = {
+            "createTable": {
+                "objectId": table_id,
+                "rows": rows,
+                "columns": columns,
+                "elementProperties": _element_properties(page_object_id, x, y, width, height),
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_table",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                table_id=table_id,
-                rows=rows,
-                columns=columns,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_table",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_table",
+            queued_result=table_id,
+            page_object_id=page_object_id,
+            table_id=table_id,
+            rows=rows,
+            columns=columns,
+        )
+
+    @_api_error("slides.insert_table_row")
     def insert_table_row(
         self,
         presentation_id: str,
         table_id: str,
         row_index: int,
         insert_below: bool = True,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Insert a row in a table.
 
         Args:
@@ -1166,46 +1331,32 @@ class SlidesService(BaseService):
             row_index: Row index to insert at.
             insert_below: Insert below (True) or above (False) the specified row.
         """
-        try:
-            request = {
-                "insertTableRows": {
-                    "tableObjectId": table_id,
-                    "cellLocation": {"rowIndex": row_index},
-                    "insertBelow": insert_below,
-                    "number": 1,
-                }
+        request = {
+            "insertTableRows": {
+                "tableObjectId": table_id,
+                "cellLocation": {"rowIndex": row_index},
+                "insertBelow": insert_below,
+                "number": 1,
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_table_row",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                row_index=row_index,
-                insert_below=insert_below,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_table_row",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_table_row",
+            table_id=table_id,
+            row_index=row_index,
+            insert_below=insert_below,
+        )
+
+    @_api_error("slides.insert_table_column")
     def insert_table_column(
         self,
         presentation_id: str,
         table_id: str,
         column_index: int,
         insert_right: bool = True,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Insert a column in a table.
 
         Args:
@@ -1214,45 +1365,31 @@ class SlidesService(BaseService):
             column_index: Column index to insert at.
             insert_right: Insert to the right (True) or left (False).
         """
-        try:
-            request = {
-                "insertTableColumns": {
-                    "tableObjectId": table_id,
-                    "cellLocation": {"columnIndex": column_index},
-                    "insertRight": insert_right,
-                    "number": 1,
-                }
+        request = {
+            "insertTableColumns": {
+                "tableObjectId": table_id,
+                "cellLocation": {"columnIndex": column_index},
+                "insertRight": insert_right,
+                "number": 1,
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_table_column",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                column_index=column_index,
-                insert_right=insert_right,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_table_column",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_table_column",
+            table_id=table_id,
+            column_index=column_index,
+            insert_right=insert_right,
+        )
+
+    @_api_error("slides.delete_table_row")
     def delete_table_row(
         self,
         presentation_id: str,
         table_id: str,
         row_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a row from a table.
 
         Args:
@@ -1260,42 +1397,28 @@ class SlidesService(BaseService):
             table_id: The table object ID.
             row_index: Row index to delete.
         """
-        try:
-            request = {
-                "deleteTableRow": {
-                    "tableObjectId": table_id,
-                    "cellLocation": {"rowIndex": row_index},
-                }
+        request = {
+            "deleteTableRow": {
+                "tableObjectId": table_id,
+                "cellLocation": {"rowIndex": row_index},
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.delete_table_row",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                row_index=row_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.delete_table_row",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.delete_table_row",
+            table_id=table_id,
+            row_index=row_index,
+        )
 
+    @_api_error("slides.delete_table_column")
     def delete_table_column(
         self,
         presentation_id: str,
         table_id: str,
         column_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Delete a column from a table.
 
         Args:
@@ -1303,36 +1426,22 @@ class SlidesService(BaseService):
             table_id: The table object ID.
             column_index: Column index to delete.
         """
-        try:
-            request = {
-                "deleteTableColumn": {
-                    "tableObjectId": table_id,
-                    "cellLocation": {"columnIndex": column_index},
-                }
+        request = {
+            "deleteTableColumn": {
+                "tableObjectId": table_id,
+                "cellLocation": {"columnIndex": column_index},
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.delete_table_column",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                column_index=column_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.delete_table_column",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.delete_table_column",
+            table_id=table_id,
+            column_index=column_index,
+        )
 
+    @_api_error("slides.style_table_cell")
     def style_table_cell(
         self,
         presentation_id: str,
@@ -1342,7 +1451,7 @@ class SlidesService(BaseService):
         background_color: str | None = None,
         end_row_index: int | None = None,
         end_column_index: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Style table cells.
 
         Args:
@@ -1354,73 +1463,52 @@ class SlidesService(BaseService):
             end_row_index: Ending row index (exclusive). If None, styles single row.
             end_column_index: Ending column index (exclusive). If None, styles single column.
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            cell_properties: dict[str, Any] = {}
-            fields = []
-
-            if background_color is not None:
-                rgb = parse_hex_color(background_color)
-                cell_properties["tableCellBackgroundFill"] = {
-                    "solidFill": {"color": {"rgbColor": rgb}}
-                }
-                fields.append("tableCellBackgroundFill")
+        cell_properties: dict[str, Any] = {}
+        fields = []
 
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.style_table_cell",
-                    message="At least one styling option required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            # Default to single cell if end indices not provided
-            if end_row_index is None:
-                end_row_index = row_index + 1
-            if end_column_index is None:
-                end_column_index = column_index + 1
-
-            request = {
-                "updateTableCellProperties": {
-                    "objectId": table_id,
-                    "tableRange": {
-                        "location": {
-                            "rowIndex": row_index,
-                            "columnIndex": column_index,
-                        },
-                        "rowSpan": end_row_index - row_index,
-                        "columnSpan": end_column_index - column_index,
+        if background_color is not None:
+            rgb = parse_color_arg(background_color)
+            cell_properties["tableCellBackgroundFill"] = {
+                "solidFill": {"color": {"rgbColor": rgb}}
+            }
+            fields.append("tableCellBackgroundFill")
+
+        if not fields:
+            raise InvalidArgsError("At least one styling option required")
+
+        # Default to single cell if end indices not provided
+        if end_row_index is None:
+            end_row_index = row_index + 1
+        if end_column_index is None:
+            end_column_index = column_index + 1
+
+        request = {
+            "updateTableCellProperties": {
+                "objectId": table_id,
+                "tableRange": {
+                    "location": {
+                        "rowIndex": row_index,
+                        "columnIndex": column_index,
                     },
-                    "tableCellProperties": cell_properties,
-                    "fields": ",".join(fields),
-                }
+                    "rowSpan": end_row_index - row_index,
+                    "columnSpan": end_column_index - column_index,
+                },
+                "tableCellProperties": cell_properties,
+                "fields": ",".join(fields),
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.style_table_cell",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                row_index=row_index,
-                column_index=column_index,
-                formatting=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.style_table_cell",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.style_table_cell",
+            table_id=table_id,
+            row_index=row_index,
+            column_index=column_index,
+            formatting=fields,
+        )
+
+    @_api_error("slides.insert_text_in_table_cell")
     def insert_text_in_table_cell(
         self,
         presentation_id: str,
@@ -1428,7 +1516,7 @@ class SlidesService(BaseService):
         row_index: int,
         column_index: int,
         text: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Insert text into a table cell.
 
         Args:
@@ -1438,52 +1526,38 @@ class SlidesService(BaseService):
             column_index: Column index of the cell.
             text: Text to insert.
         """
-        try:
-            request = {
-                "insertText": {
-                    "objectId": table_id,
-                    "cellLocation": {
-                        "rowIndex": row_index,
-                        "columnIndex": column_index,
-                    },
-                    "insertionIndex": 0,
-                    "text": text,
-                }
+        request = {
+            "insertText": {
+                "objectId": table_id,
+                "cellLocation": {
+                    "rowIndex": row_index,
+                    "columnIndex": column_index,
+                },
+                "insertionIndex": 0,
+                "text": text,
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_text_in_table_cell",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                row_index=row_index,
-                column_index=column_index,
-                text_length=len(text),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_text_in_table_cell",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_text_in_table_cell",
+            table_id=table_id,
+            row_index=row_index,
+            column_index=column_index,
+            text_length=len(text),
+        )
 
     # ===== Phase 6: Slides Enhancements =====
 
+    @_api_error("slides.set_slide_background")
     def set_slide_background(
         self,
         presentation_id: str,
         slide_id: str,
         color: str | None = None,
         image_url: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set slide background to a solid color or image.
 
         Args:
@@ -1492,61 +1566,41 @@ class SlidesService(BaseService):
             color: Background color (hex, e.g., "#FFFFFF").
             image_url: Background image URL (publicly accessible).
         """
-        try:
-            if not color and not image_url:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.set_slide_background",
-                    message="Either color or image_url must be provided",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        if not color and not image_url:
+            raise InvalidArgsError("Either color or image_url must be provided")
 
-            page_properties: dict[str, Any] = {}
-            fields = []
-
-            if color:
-                from gws.utils.colors import parse_hex_color
-                rgb = parse_hex_color(color)
-                page_properties["pageBackgroundFill"] = {
-                    "solidFill": {"color": {"rgbColor": rgb}}
-                }
-                fields.append("pageBackgroundFill")
-            elif image_url:
-                page_properties["pageBackgroundFill"] = {
-                    "stretchedPictureFill": {"contentUrl": image_url}
-                }
-                fields.append("pageBackgroundFill")
+        page_properties: dict[str, Any] = {}
+        fields = []
 
-            request = {
-                "updatePageProperties": {
-                    "objectId": slide_id,
-                    "pageProperties": page_properties,
-                    "fields": ",".join(fields),
-                }
+        if color:
+            rgb = parse_color_arg(color)
+            page_properties["pageBackgroundFill"] = {
+                "solidFill": {"color": {"rgbColor": rgb}}
             }
+            fields.append("pageBackgroundFill")
+        elif image_url:
+            page_properties["pageBackgroundFill"] = {
+                "stretchedPictureFill": {"contentUrl": image_url}
+            }
+            fields.append("pageBackgroundFill")
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        request = {
+            "updatePageProperties": {
+                "objectId": slide_id,
+                "pageProperties": page_properties,
+                "fields": ",".join(fields),
+            }
+        }
 
-            output_success(
-                operation="slides.set_slide_background",
-                presentation_id=presentation_id,
-                slide_id=slide_id,
-                background_type="color" if color else "image",
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.set_slide_background",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.set_slide_background",
+            slide_id=slide_id,
+            background_type="color" if color else "image",
+        )
 
+    @_api_error("slides.create_bullets")
     def create_bullets(
         self,
         presentation_id: str,
@@ -1554,7 +1608,7 @@ class SlidesService(BaseService):
         bullet_preset: str = "BULLET_DISC_CIRCLE_SQUARE",
         start_index: int | None = None,
         end_index: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Create bullet list formatting for text.
 
         Args:
@@ -1571,53 +1625,39 @@ class SlidesService(BaseService):
             start_index: Start character index (0-based). If None, applies to all.
             end_index: End character index (exclusive). If None, applies to all.
         """
-        try:
-            if start_index is not None and end_index is not None:
-                text_range = {
-                    "type": "FIXED_RANGE",
-                    "startIndex": start_index,
-                    "endIndex": end_index,
-                }
-            else:
-                text_range = {"type": "ALL"}
-
-            request = {
-                "createParagraphBullets": {
-                    "objectId": object_id,
-                    "textRange": text_range,
-                    "bulletPreset": bullet_preset,
-                }
+        if start_index is not None and end_index is not None:
+            text_range = {
+                "type": "FIXED_RANGE",
+                "startIndex": start_index,
+                "endIndex": end_index,
             }
+        else:
+            text_range = {"type": "ALL"}
+
+        request = {
+            "createParagraphBullets": {
+                "objectId": object_id,
+                "textRange": text_range,
+                "bulletPreset": bullet_preset,
+            }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.create_bullets",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                bullet_preset=bullet_preset,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.create_bullets",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.create_bullets",
+            object_id=object_id,
+            bullet_preset=bullet_preset,
+        )
 
+    @_api_error("slides.remove_bullets")
     def remove_bullets(
         self,
         presentation_id: str,
         object_id: str,
         start_index: int | None = None,
         end_index: int | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Remove bullet list formatting from text.
 
         Args:
@@ -1626,44 +1666,30 @@ class SlidesService(BaseService):
             start_index: Start character index (0-based). If None, applies to all.
             end_index: End character index (exclusive). If None, applies to all.
         """
-        try:
-            if start_index is not None and end_index is not None:
-                text_range = {
-                    "type": "FIXED_RANGE",
-                    "startIndex": start_index,
-                    "endIndex": end_index,
-                }
-            else:
-                text_range = {"type": "ALL"}
-
-            request = {
-                "deleteParagraphBullets": {
-                    "objectId": object_id,
-                    "textRange": text_range,
-                }
+        if start_index is not None and end_index is not None:
+            text_range = {
+                "type": "FIXED_RANGE",
+                "startIndex": start_index,
+                "endIndex": end_index,
             }
+        else:
+            text_range = {"type": "ALL"}
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        request = {
+            "deleteParagraphBullets": {
+                "objectId": object_id,
+                "textRange": text_range,
+            }
+        }
 
-            output_success(
-                operation="slides.remove_bullets",
-                presentation_id=presentation_id,
-                object_id=object_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.remove_bullets",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.remove_bullets",
+            object_id=object_id,
+        )
 
+    @_api_error("slides.style_table_borders")
     def style_table_borders(
         self,
         presentation_id: str,
@@ -1676,7 +1702,7 @@ class SlidesService(BaseService):
         weight: float = 1.0,
         dash_style: str = "SOLID",
         border_position: str = "ALL",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Style table cell borders.
 
         Args:
@@ -1692,79 +1718,53 @@ class SlidesService(BaseService):
             border_position: Which borders to style (ALL, INNER, OUTER,
                 INNER_HORIZONTAL, INNER_VERTICAL, LEFT, RIGHT, TOP, BOTTOM).
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            valid_positions = {
-                "ALL", "INNER", "OUTER", "INNER_HORIZONTAL", "INNER_VERTICAL",
-                "LEFT", "RIGHT", "TOP", "BOTTOM"
-            }
-            if border_position.upper() not in valid_positions:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.style_table_borders",
-                    message=f"border_position must be one of: {valid_positions}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            valid_styles = {"SOLID", "DOT", "DASH", "DASH_DOT", "LONG_DASH"}
-            if dash_style.upper() not in valid_styles:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.style_table_borders",
-                    message=f"dash_style must be one of: {valid_styles}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            rgb = parse_hex_color(color)
-
-            request = {
-                "updateTableBorderProperties": {
-                    "objectId": table_id,
-                    "tableRange": {
-                        "location": {
-                            "rowIndex": row_index,
-                            "columnIndex": column_index,
-                        },
-                        "rowSpan": row_span,
-                        "columnSpan": column_span,
+        valid_positions = {
+            "ALL", "INNER", "OUTER", "INNER_HORIZONTAL", "INNER_VERTICAL",
+            "LEFT", "RIGHT", "TOP", "BOTTOM"
+        }
+        if border_position.upper() not in valid_positions:
+            raise InvalidArgsError(f"border_position must be one of: {valid_positions}")
+
+        valid_styles = {"SOLID", "DOT", "DASH", "DASH_DOT", "LONG_DASH"}
+        if dash_style.upper() not in valid_styles:
+            raise InvalidArgsError(f"dash_style must be one of: {valid_styles}")
+
+        rgb = parse_color_arg(color)
+
+        request = {
+            "updateTableBorderProperties": {
+                "objectId": table_id,
+                "tableRange": {
+                    "location": {
+                        "rowIndex": row_index,
+                        "columnIndex": column_index,
                     },
-                    "borderPosition": border_position.upper(),
-                    "tableBorderProperties": {
-                        "tableBorderFill": {
-                            "solidFill": {"color": {"rgbColor": rgb}}
-                        },
-                        "weight": {"magnitude": weight, "unit": "PT"},
-                        "dashStyle": dash_style.upper(),
+                    "rowSpan": row_span,
+                    "columnSpan": column_span,
+                },
+                "borderPosition": border_position.upper(),
+                "tableBorderProperties": {
+                    "tableBorderFill": {
+                        "solidFill": {"color": {"rgbColor": rgb}}
                     },
-                    "fields": "tableBorderFill,weight,dashStyle",
-                }
+                    "weight": {"magnitude": weight, "unit": "PT"},
+                    "dashStyle": dash_style.upper(),
+                },
+                "fields": "tableBorderFill,weight,dashStyle",
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.style_table_borders",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                border_position=border_position.upper(),
-                row_index=row_index,
-                column_index=column_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.style_table_borders",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.style_table_borders",
+            table_id=table_id,
+            border_position=border_position.upper(),
+            row_index=row_index,
+            column_index=column_index,
+        )
+
+    @_api_error("slides.merge_table_cells")
     def merge_table_cells(
         self,
         presentation_id: str,
@@ -1773,7 +1773,7 @@ class SlidesService(BaseService):
         column_index: int,
         row_span: int,
         column_span: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Merge table cells.
 
         Args:
@@ -1784,46 +1784,32 @@ class SlidesService(BaseService):
             row_span: Number of rows to merge.
             column_span: Number of columns to merge.
         """
-        try:
-            request = {
-                "mergeTableCells": {
-                    "objectId": table_id,
-                    "tableRange": {
-                        "location": {
-                            "rowIndex": row_index,
-                            "columnIndex": column_index,
-                        },
-                        "rowSpan": row_span,
-                        "columnSpan": column_span,
+        request = {
+            "mergeTableCells": {
+                "objectId": table_id,
+                "tableRange": {
+                    "location": {
+                        "rowIndex": row_index,
+                        "columnIndex": column_index,
                     },
-                }
+                    "rowSpan": row_span,
+                    "columnSpan": column_span,
+                },
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.merge_table_cells",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                row_index=row_index,
-                column_index=column_index,
-                row_span=row_span,
-                column_span=column_span,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.merge_table_cells",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.merge_table_cells",
+            table_id=table_id,
+            row_index=row_index,
+            column_index=column_index,
+            row_span=row_span,
+            column_span=column_span,
+        )
+
+    @_api_error("slides.unmerge_table_cells")
     def unmerge_table_cells(
         self,
         presentation_id: str,
@@ -1832,7 +1818,7 @@ class SlidesService(BaseService):
         column_index: int,
         row_span: int,
         column_span: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Unmerge table cells.
 
         Args:
@@ -1843,44 +1829,30 @@ class SlidesService(BaseService):
             row_span: Number of rows in merged region.
             column_span: Number of columns in merged region.
         """
-        try:
-            request = {
-                "unmergeTableCells": {
-                    "objectId": table_id,
-                    "tableRange": {
-                        "location": {
-                            "rowIndex": row_index,
-                            "columnIndex": column_index,
-                        },
-                        "rowSpan": row_span,
-                        "columnSpan": column_span,
+        request = {
+            "unmergeTableCells": {
+                "objectId": table_id,
+                "tableRange": {
+                    "location": {
+                        "rowIndex": row_index,
+                        "columnIndex": column_index,
                     },
-                }
+                    "rowSpan": row_span,
+                    "columnSpan": column_span,
+                },
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.unmerge_table_cells",
-                presentation_id=presentation_id,
-                table_id=table_id,
-                row_index=row_index,
-                column_index=column_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.unmerge_table_cells",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.unmerge_table_cells",
+            table_id=table_id,
+            row_index=row_index,
+            column_index=column_index,
+        )
+
+    @_api_error("slides.create_line")
     def create_line(
         self,
         presentation_id: str,
@@ -1895,9 +1867,11 @@ class SlidesService(BaseService):
         dash_style: str = "SOLID",
         start_arrow: str | None = None,
         end_arrow: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | str:
         """Create a line or arrow on a slide.
 
+        Inside a batch, returns the new line's object ID.
+
         Args:
             presentation_id: The presentation ID.
             page_object_id: The slide/page object ID.
@@ -1914,102 +1888,82 @@ class SlidesService(BaseService):
                 OPEN_CIRCLE, OPEN_SQUARE, OPEN_DIAMOND).
             end_arrow: End arrow type (same options as start_arrow).
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            line_id = self._generate_object_id()
-
-            # Calculate width and height from start/end points
-            width = abs(end_x - start_x) or 1  # Minimum 1pt
-            height = abs(end_y - start_y) or 1
-
-            valid_categories = {"STRAIGHT", "BENT", "CURVED"}
-            if line_category.upper() not in valid_categories:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.create_line",
-                    message=f"line_category must be one of: {valid_categories}",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            request = {
-                "createLine": {
-                    "objectId": line_id,
-                    "lineCategory": line_category.upper(),
-                    "elementProperties": {
-                        "pageObjectId": page_object_id,
-                        "size": {
-                            "width": {"magnitude": width, "unit": "PT"},
-                            "height": {"magnitude": height, "unit": "PT"},
-                        },
-                        "transform": {
-                            "scaleX": 1 if end_x >= start_x else -1,
-                            "scaleY": 1 if end_y >= start_y else -1,
-                            "translateX": min(start_x, end_x),
-                            "translateY": min(start_y, end_y),
-                            "unit": "PT",
-                        },
+        line_id = self._generate_object_id()
+
+        # Calculate width and height from start/end points
+        width = abs(end_x - start_x) or 1  # Minimum 1pt
+        height = abs(end_y - start_y) or 1
+
+        valid_categories = {"STRAIGHT", "BENT", "CURVED"}
+        if line_category.upper() not in valid_categories:
+            raise InvalidArgsError(f"line_category must be one of: {valid_categories}")
+
+        request = {
+            "createLine": {
+                "objectId": line_id,
+                "lineCategory": line_category.upper(),
+                "elementProperties": {
+                    "pageObjectId": page_object_id,
+                    "size": {
+                        "width": {"magnitude": width, "unit": "PT"},
+                        "height": {"magnitude": height, "unit": "PT"},
                     },
-                }
-            }
-
-            # Create the line first
-            requests = [request]
-
-            # Then update line properties
-            rgb = parse_hex_color(color)
-            line_properties: dict[str, Any] = {
-                "lineFill": {"solidFill": {"color": {"rgbColor": rgb}}},
-                "weight": {"magnitude": weight, "unit": "PT"},
-                "dashStyle": dash_style.upper(),
+                    "transform": {
+                        "scaleX": 1 if end_x >= start_x else -1,
+                        "scaleY": 1 if end_y >= start_y else -1,
+                        "translateX": min(start_x, end_x),
+                        "translateY": min(start_y, end_y),
+                        "unit": "PT",
+                    },
+                },
             }
-            fields = ["lineFill", "weight", "dashStyle"]
-
-            if start_arrow:
-                line_properties["startArrow"] = start_arrow.upper()
-                fields.append("startArrow")
-            if end_arrow:
-                line_properties["endArrow"] = end_arrow.upper()
-                fields.append("endArrow")
-
-            update_request = {
-                "updateLineProperties": {
-                    "objectId": line_id,
-                    "lineProperties": line_properties,
-                    "fields": ",".join(fields),
-                }
+        }
+
+        # Create the line first
+        requests = [request]
+
+        # Then update line properties
+        rgb = parse_color_arg(color)
+        line_properties: dict[str, Any] = {
+            "lineFill": {"solidFill": {"color": {"rgbColor": rgb}}},
+            "weight": {"magnitude": weight, "unit": "PT"},
+            "dashStyle": dash_style.upper(),
+        }
+        fields = ["lineFill", "weight", "dashStyle"]
+
+        if start_arrow:
+            line_properties["startArrow"] = start_arrow.upper()
+            fields.append("startArrow")
+        if end_arrow:
+            line_properties["endArrow"] = end_arrow.upper()
+            fields.append("endArrow")
+
+        update_request = {
+            "updateLineProperties": {
+                "objectId": line_id,
+                "lineProperties": line_properties,
+                "fields": ",".join(fields),
             }
-            requests.append(update_request)
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": requests}
-                )
-            )
-
-            output_success(
-                operation="slides.create_line",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                line_id=line_id,
-                line_category=line_category.upper(),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.create_line",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+        requests.append(update_request)
+
+        return self._submit_and_report(
+            presentation_id,
+            requests,
+            "slides.create_line",
+            queued_result=line_id,
+            page_object_id=page_object_id,
+            line_id=line_id,
+            line_category=line_category.upper(),
+        )
+
+    @_api_error("slides.reorder_slides")
     def reorder_slides(
         self,
         presentation_id: str,
         slide_ids: list[str],
         insertion_index: int,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Move slides to a new position.
 
         Args:
@@ -2017,40 +1971,26 @@ class SlidesService(BaseService):
             slide_ids: List of slide object IDs to move.
             insertion_index: Target index where slides will be moved (0-based).
         """
-        try:
-            request = {
-                "updateSlidesPosition": {
-                    "slideObjectIds": slide_ids,
-                    "insertionIndex": insertion_index,
-                }
+        request = {
+            "updateSlidesPosition": {
+                "slideObjectIds": slide_ids,
+                "insertionIndex": insertion_index,
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.reorder_slides",
-                presentation_id=presentation_id,
-                slide_ids=slide_ids,
-                insertion_index=insertion_index,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.reorder_slides",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.reorder_slides",
+            slide_ids=slide_ids,
+            insertion_index=insertion_index,
+        )
 
     # =========================================================================
     # SPEAKER NOTES
     # =========================================================================
 
+    @_api_error("slides.get_speaker_notes")
     def get_speaker_notes(
         self,
         presentation_id: str,
@@ -2062,54 +2002,44 @@ class SlidesService(BaseService):
             presentation_id: The presentation ID.
             slide_id: The slide object ID.
         """
-        try:
-            presentation = self.execute(
-                self.service.presentations()
-                .get(presentationId=presentation_id)
-            )
-
-            notes_text = ""
-            notes_page_id = None
-
-            for slide in presentation.get("slides", []):
-                if slide.get("objectId") == slide_id:
-                    notes_page = slide.get("slideProperties", {}).get("notesPage", {})
-                    notes_page_id = notes_page.get("objectId")
-
-                    # Find the notes shape within the notes page
-                    for element in notes_page.get("pageElements", []):
-                        shape = element.get("shape", {})
-                        if shape.get("shapeType") == "TEXT_BOX":
-                            placeholder = shape.get("placeholder", {})
-                            if placeholder.get("type") == "BODY":
-                                text_content = shape.get("text", {})
-                                for text_element in text_content.get("textElements", []):
-                                    if "textRun" in text_element:
-                                        notes_text += text_element["textRun"].get("content", "")
-                    break
-
-            output_success(
-                operation="slides.get_speaker_notes",
-                presentation_id=presentation_id,
-                slide_id=slide_id,
-                notes_page_id=notes_page_id,
-                notes_text=notes_text.strip(),
-            )
-            return {"notes_text": notes_text.strip(), "notes_page_id": notes_page_id}
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.get_speaker_notes",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        presentation = self._get_presentation(presentation_id, _NOTES_FIELDS)
+
+        notes_text = ""
+        notes_page_id = None
+
+        for slide in presentation.get("slides", []):
+            if slide.get("objectId") == slide_id:
+                notes_page = slide.get("slideProperties", {}).get("notesPage", {})
+                notes_page_id = notes_page.get("objectId")
+
+                # Find the notes shape within the notes page
+                for element in notes_page.get("pageElements", []):
+                    shape = element.get("shape", {})
+                    if shape.get("shapeType") == "TEXT_BOX":
+                        placeholder = shape.get("placeholder", {})
+                        if placeholder.get("type") == "BODY":
+                            text_content = shape.get("text", {})
+                            for text_element in text_content.get("textElements", []):
+                                if "textRun" in text_element:
+                                    notes_text += text_element["textRun"].get("content", "")
+                break
+
+        output_success(
+            operation="slides.get_speaker_notes",
+            presentation_id=presentation_id,
+            slide_id=slide_id,
+            notes_page_id=notes_page_id,
+            notes_text=notes_text.strip(),
+        )
+        return {"notes_text": notes_text.strip(), "notes_page_id": notes_page_id}
+
+    @_api_error("slides.set_speaker_notes")
     def set_speaker_notes(
         self,
         presentation_id: str,
         slide_id: str,
         notes_text: str,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set speaker notes for a slide.
 
         Args:
@@ -2117,96 +2047,74 @@ class SlidesService(BaseService):
             slide_id: The slide object ID.
             notes_text: The speaker notes text content.
         """
-        try:
-            # First, get the presentation to find the notes shape ID
-            presentation = self.execute(
-                self.service.presentations()
-                .get(presentationId=presentation_id)
-            )
+        # First, get the presentation to find the notes shape ID
+        presentation = self._get_presentation(presentation_id, _NOTES_FIELDS)
 
-            notes_shape_id = None
-
-            for slide in presentation.get("slides", []):
-                if slide.get("objectId") == slide_id:
-                    notes_page = slide.get("slideProperties", {}).get("notesPage", {})
-
-                    for element in notes_page.get("pageElements", []):
-                        shape = element.get("shape", {})
-                        if shape.get("shapeType") == "TEXT_BOX":
-                            placeholder = shape.get("placeholder", {})
-                            if placeholder.get("type") == "BODY":
-                                notes_shape_id = element.get("objectId")
-                                break
-                    break
-
-            if not notes_shape_id:
-                output_error(
-                    error_code="NOT_FOUND",
-                    operation="slides.set_speaker_notes",
-                    message=f"Speaker notes shape not found for slide {slide_id}",
-                )
-                raise SystemExit(ExitCode.NOT_FOUND)
-
-            # Build requests: only delete existing text if notes are non-empty
-            requests: list[dict[str, Any]] = []
-
-            # Check if notes shape has existing text content
-            for slide in presentation.get("slides", []):
-                if slide.get("objectId") == slide_id:
-                    notes_page = slide.get("slideProperties", {}).get("notesPage", {})
-                    for element in notes_page.get("pageElements", []):
-                        if element.get("objectId") == notes_shape_id:
-                            text_content = element.get("shape", {}).get("text", {})
-                            text_elements = text_content.get("textElements", [])
-                            has_text = any(
-                                te.get("textRun", {}).get("content", "").strip()
-                                for te in text_elements
-                            )
-                            if has_text:
-                                requests.append({
-                                    "deleteText": {
-                                        "objectId": notes_shape_id,
-                                        "textRange": {"type": "ALL"},
-                                    }
-                                })
-                            break
-                    break
+        notes_shape_id = None
 
-            requests.append({
-                "insertText": {
-                    "objectId": notes_shape_id,
-                    "insertionIndex": 0,
-                    "text": notes_text,
-                }
-            })
+        for slide in presentation.get("slides", []):
+            if slide.get("objectId") == slide_id:
+                notes_page = slide.get("slideProperties", {}).get("notesPage", {})
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": requests}
-                )
-            )
+                for element in notes_page.get("pageElements", []):
+                    shape = element.get("shape", {})
+                    if shape.get("shapeType") == "TEXT_BOX":
+                        placeholder = shape.get("placeholder", {})
+                        if placeholder.get("type") == "BODY":
+                            notes_shape_id = element.get("objectId")
+                            break
+                break
+
+        if not notes_shape_id:
+            raise NotFoundError(f"Speaker notes shape not found for slide {slide_id}")
+
+        # Build requests: only delete existing text if notes are non-empty
+        requests: list[dict[str, Any]] = []
+
+        # Check if notes shape has existing text content
+        for slide in presentation.get("slides", []):
+            if slide.get("objectId") == slide_id:
+                notes_page = slide.get("slideProperties", {}).get("notesPage", {})
+                for element in notes_page.get("pageElements", []):
+                    if element.get("objectId") == notes_shape_id:
+                        text_content = element.get("shape", {}).get("text", {})
+                        text_elements = text_content.get("textElements", [])
+                        has_text = any(
+                            te.get("textRun", {}).get("content", "").strip()
+                            for te in text_elements
+                        )
+                        if has_text:
+                            requests.append({
+                                "deleteText": {
+                                    "objectId": notes_shape_id,
+                                    "textRange": {"type": "ALL"},
+                                }
+                            })
+                        break
+                break
+
+        requests.append({
+            "insertText": {
+                "objectId": notes_shape_id,
+                "insertionIndex": 0,
+                "text": notes_text,
+            }
+        })
 
-            output_success(
-                operation="slides.set_speaker_notes",
-                presentation_id=presentation_id,
-                slide_id=slide_id,
-                notes_shape_id=notes_shape_id,
-                text_length=len(notes_text),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.set_speaker_notes",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            requests,
+            "slides.set_speaker_notes",
+            slide_id=slide_id,
+            notes_shape_id=notes_shape_id,
+            text_length=len(notes_text),
+        )
 
     # =========================================================================
     # VIDEO INSERTION
     # =========================================================================
 
+    @_api_error("slides.insert_video")
     def insert_video(
         self,
         presentation_id: str,
@@ -2216,9 +2124,11 @@ class SlidesService(BaseService):
         y: float,
         width: float,
         height: float,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | str:
         """Insert a video on a slide.
 
+        Inside a batch, returns the new video's object ID.
+
         Args:
             presentation_id: The presentation ID.
             page_object_id: The slide/page object ID.
@@ -2228,76 +2138,44 @@ class SlidesService(BaseService):
             width: Width in points.
             height: Height in points.
         """
-        try:
-            import re
 
-            # Extract YouTube video ID from URL
-            video_id = None
-            patterns = [
-                r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, video_url)
-                if match:
-                    video_id = match.group(1)
-                    break
-
-            if not video_id:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.insert_video",
-                    message="Invalid YouTube URL. Please provide a valid YouTube video URL.",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            object_id = self._generate_object_id()
-
-            request = {
-                "createVideo": {
-                    "objectId": object_id,
-                    "source": "YOUTUBE",
-                    "id": video_id,
-                    "elementProperties": {
-                        "pageObjectId": page_object_id,
-                        "size": {
-                            "width": {"magnitude": width, "unit": "PT"},
-                            "height": {"magnitude": height, "unit": "PT"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "translateX": x,
-                            "translateY": y,
-                            "unit": "PT",
-                        },
-                    },
-                }
+        # Extract YouTube video ID from URL
+        video_id = None
+        patterns = [
+            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})',
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, video_url)
+            if match:
+                video_id = match.group(1)
+                break
+
+        if not video_id:
+            raise InvalidArgsError("Invalid YouTube URL. Please provide a valid YouTube video URL.")
+
+        object_id = self._generate_object_id()
+
+        request = {
+            "createVideo": {
+                "objectId": object_id,
+                "source": "YOUTUBE",
+                "id": video_id,
+                "elementProperties": _element_properties(page_object_id, x, y, width, height),
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_video",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                video_object_id=object_id,
-                video_id=video_id,
-                position={"x": x, "y": y, "width": width, "height": height},
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_video",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_video",
+            queued_result=object_id,
+            page_object_id=page_object_id,
+            video_object_id=object_id,
+            video_id=video_id,
+            position={"x": x, "y": y, "width": width, "height": height},
+        )
+
+    @_api_error("slides.update_video_properties")
     def update_video_properties(
         self,
         presentation_id: str,
@@ -2306,7 +2184,7 @@ class SlidesService(BaseService):
         start_time: int | None = None,
         end_time: int | None = None,
         mute: bool | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Update video playback properties.
 
         Args:
@@ -2317,68 +2195,49 @@ class SlidesService(BaseService):
             end_time: End time in seconds.
             mute: Whether the video is muted.
         """
-        try:
-            video_properties: dict[str, Any] = {}
-            fields = []
-
-            if autoplay is not None:
-                video_properties["autoPlay"] = autoplay
-                fields.append("autoPlay")
-
-            if start_time is not None:
-                video_properties["start"] = start_time
-                fields.append("start")
-
-            if end_time is not None:
-                video_properties["end"] = end_time
-                fields.append("end")
-
-            if mute is not None:
-                video_properties["mute"] = mute
-                fields.append("mute")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGS",
-                    operation="slides.update_video_properties",
-                    message="At least one video property required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
+        video_properties: dict[str, Any] = {}
+        fields = []
 
-            request = {
-                "updateVideoProperties": {
-                    "objectId": video_object_id,
-                    "videoProperties": video_properties,
-                    "fields": ",".join(fields),
-                }
-            }
+        if autoplay is not None:
+            video_properties["autoPlay"] = autoplay
+            fields.append("autoPlay")
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        if start_time is not None:
+            video_properties["start"] = start_time
+            fields.append("start")
 
-            output_success(
-                operation="slides.update_video_properties",
-                presentation_id=presentation_id,
-                video_object_id=video_object_id,
-                properties_updated=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.update_video_properties",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        if end_time is not None:
+            video_properties["end"] = end_time
+            fields.append("end")
+
+        if mute is not None:
+            video_properties["mute"] = mute
+            fields.append("mute")
+
+        if not fields:
+            raise InvalidArgsError("At least one video property required")
+
+        request = {
+            "updateVideoProperties": {
+                "objectId": video_object_id,
+                "videoProperties": video_properties,
+                "fields": ",".join(fields),
+            }
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.update_video_properties",
+            video_object_id=video_object_id,
+            properties_updated=fields,
+        )
 
     # =========================================================================
     # ELEMENT TRANSFORMS
     # =========================================================================
 
+    @_api_error("slides.transform_element")
     def transform_element(
         self,
         presentation_id: str,
@@ -2389,7 +2248,7 @@ class SlidesService(BaseService):
         translate_y: float | None = None,
         rotate: float | None = None,
         apply_mode: str = "RELATIVE",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Transform a page element (scale, translate, rotate).
 
         Args:
@@ -2402,73 +2261,53 @@ class SlidesService(BaseService):
             rotate: Rotation angle in degrees.
             apply_mode: 'RELATIVE' (add to current) or 'ABSOLUTE' (replace).
         """
-        try:
-            # Build transform matrix — always set scaleX/scaleY to ensure
-            # the matrix is invertible (determinant != 0)
-            transform: dict[str, Any] = {
-                "unit": "EMU",
-                "scaleX": scale_x if scale_x is not None else 1.0,
-                "scaleY": scale_y if scale_y is not None else 1.0,
-            }
-            if translate_x is not None:
-                transform["translateX"] = translate_x
-            if translate_y is not None:
-                transform["translateY"] = translate_y
-
-            # Rotation requires converting degrees to affine transform
-            # For simplicity, we handle rotation as shearX/shearY if provided
-            if rotate is not None:
-                import math
-                rad = math.radians(rotate)
-                cos_r = math.cos(rad)
-                sin_r = math.sin(rad)
-                transform["scaleX"] = transform.get("scaleX", 1.0) * cos_r
-                transform["scaleY"] = transform.get("scaleY", 1.0) * cos_r
-                transform["shearX"] = -sin_r
-                transform["shearY"] = sin_r
-
-            if len(transform) == 1:  # Only 'unit'
-                output_error(
-                    error_code="INVALID_ARGUMENT",
-                    operation="slides.transform_element",
-                    message="At least one transform parameter required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            request = {
-                "updatePageElementTransform": {
-                    "objectId": object_id,
-                    "transform": transform,
-                    "applyMode": apply_mode,
-                }
+        # Build transform matrix — always set scaleX/scaleY to ensure
+        # the matrix is invertible (determinant != 0)
+        transform: dict[str, Any] = {
+            "unit": "EMU",
+            "scaleX": scale_x if scale_x is not None else 1.0,
+            "scaleY": scale_y if scale_y is not None else 1.0,
+        }
+        if translate_x is not None:
+            transform["translateX"] = translate_x
+        if translate_y is not None:
+            transform["translateY"] = translate_y
+
+        # Rotation requires converting degrees to affine transform
+        # For simplicity, we handle rotation as shearX/shearY if provided
+        if rotate is not None:
+            rad = math.radians(rotate)
+            cos_r = math.cos(rad)
+            sin_r = math.sin(rad)
+            transform["scaleX"] = transform.get("scaleX", 1.0) * cos_r
+            transform["scaleY"] = transform.get("scaleY", 1.0) * cos_r
+            transform["shearX"] = -sin_r
+            transform["shearY"] = sin_r
+
+        if len(transform) == 1:  # Only 'unit'
+            raise InvalidArgsError("At least one transform parameter required")
+
+        request = {
+            "updatePageElementTransform": {
+                "objectId": object_id,
+                "transform": transform,
+                "applyMode": apply_mode,
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.transform_element",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                apply_mode=apply_mode,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.transform_element",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.transform_element",
+            object_id=object_id,
+            apply_mode=apply_mode,
+        )
 
     # =========================================================================
     # IMAGE PROPERTIES
     # =========================================================================
 
+    @_api_error("slides.update_image_properties")
     def update_image_properties(
         self,
         presentation_id: str,
@@ -2476,7 +2315,7 @@ class SlidesService(BaseService):
         transparency: float | None = None,
         outline_color: str | None = None,
         outline_weight: float | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Update image properties.
 
         Args:
@@ -2486,158 +2325,111 @@ class SlidesService(BaseService):
             outline_color: Outline color (hex, e.g., '#000000').
             outline_weight: Outline weight in points.
         """
-        try:
-            from gws.utils.colors import parse_hex_color
-
-            image_properties: dict[str, Any] = {}
-            fields = []
-
-            if transparency is not None:
-                image_properties["transparency"] = transparency
-                fields.append("transparency")
-
-            if outline_color is not None or outline_weight is not None:
-                outline: dict[str, Any] = {}
-                if outline_color:
-                    rgb = parse_hex_color(outline_color)
-                    outline["outlineFill"] = {
-                        "solidFill": {
-                            "color": {"rgbColor": rgb}
-                        }
+        image_properties: dict[str, Any] = {}
+        fields = []
+
+        if transparency is not None:
+            image_properties["transparency"] = transparency
+            fields.append("transparency")
+
+        if outline_color is not None or outline_weight is not None:
+            outline: dict[str, Any] = {}
+            if outline_color:
+                rgb = parse_color_arg(outline_color)
+                outline["outlineFill"] = {
+                    "solidFill": {
+                        "color": {"rgbColor": rgb}
                     }
-                    fields.append("outline.outlineFill.solidFill.color")
-                if outline_weight is not None:
-                    outline["weight"] = {"magnitude": outline_weight, "unit": "PT"}
-                    fields.append("outline.weight")
-                image_properties["outline"] = outline
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGUMENT",
-                    operation="slides.update_image_properties",
-                    message="At least one image property required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            request = {
-                "updateImageProperties": {
-                    "objectId": object_id,
-                    "imageProperties": image_properties,
-                    "fields": ",".join(fields),
                 }
+                fields.append("outline.outlineFill.solidFill.color")
+            if outline_weight is not None:
+                outline["weight"] = {"magnitude": outline_weight, "unit": "PT"}
+                fields.append("outline.weight")
+            image_properties["outline"] = outline
+
+        if not fields:
+            raise InvalidArgsError("At least one image property required")
+
+        request = {
+            "updateImageProperties": {
+                "objectId": object_id,
+                "imageProperties": image_properties,
+                "fields": ",".join(fields),
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.update_image_properties",
-                presentation_id=presentation_id,
-                object_id=object_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.update_image_properties",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.update_image_properties",
+            object_id=object_id,
+        )
 
     # =========================================================================
     # GROUPING
     # =========================================================================
 
+    @_api_error("slides.group_objects")
     def group_objects(
         self,
         presentation_id: str,
         children_object_ids: list[str],
         group_object_id: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | str:
         """Group multiple page elements.
 
+        Inside a batch, returns the new group's object ID.
+
         Args:
             presentation_id: The presentation ID.
             children_object_ids: List of object IDs to group.
             group_object_id: Optional ID for the new group (auto-generated if not provided).
         """
-        import uuid
-
-        try:
-            request: dict[str, Any] = {
-                "groupObjects": {
-                    "groupObjectId": group_object_id or f"group_{uuid.uuid4().hex[:8]}",
-                    "childrenObjectIds": children_object_ids,
-                }
+        group_object_id = group_object_id or f"group_{secrets.token_hex(4)}"
+        request: dict[str, Any] = {
+            "groupObjects": {
+                "groupObjectId": group_object_id,
+                "childrenObjectIds": children_object_ids,
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.group_objects",
-                presentation_id=presentation_id,
-                group_object_id=request["groupObjects"]["groupObjectId"],
-                children_count=len(children_object_ids),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.group_objects",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
-
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.group_objects",
+            queued_result=group_object_id,
+            group_object_id=group_object_id,
+            children_count=len(children_object_ids),
+        )
+
+    @_api_error("slides.ungroup_objects")
     def ungroup_objects(
         self,
         presentation_id: str,
         group_object_ids: list[str],
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Ungroup one or more groups.
 
         Args:
             presentation_id: The presentation ID.
             group_object_ids: List of group object IDs to ungroup.
         """
-        try:
-            requests = [
-                {"ungroupObjects": {"objectIds": group_object_ids}}
-            ]
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": requests}
-                )
-            )
+        requests = [
+            {"ungroupObjects": {"objectIds": group_object_ids}}
+        ]
 
-            output_success(
-                operation="slides.ungroup_objects",
-                presentation_id=presentation_id,
-                ungrouped_count=len(group_object_ids),
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.ungroup_objects",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            requests,
+            "slides.ungroup_objects",
+            ungrouped_count=len(group_object_ids),
+        )
 
     # =========================================================================
     # SHAPE REPLACEMENT
     # =========================================================================
 
+    @_api_error("slides.replace_shapes_with_image")
     def replace_shapes_with_image(
         self,
         presentation_id: str,
@@ -2645,7 +2437,7 @@ class SlidesService(BaseService):
         image_url: str,
         image_replace_method: str = "CENTER_INSIDE",
         page_object_ids: list[str] | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Replace all shapes containing specific text with an image.
 
         Args:
@@ -2655,31 +2447,26 @@ class SlidesService(BaseService):
             image_replace_method: How to replace ('CENTER_INSIDE' or 'CENTER_CROP').
             page_object_ids: Optional list of page IDs to limit the search.
         """
-        try:
-            request: dict[str, Any] = {
-                "replaceAllShapesWithImage": {
-                    "containsText": {
-                        "text": contains_text,
-                        "matchCase": False,
-                    },
-                    "imageUrl": image_url,
-                    "imageReplaceMethod": image_replace_method,
-                }
+        request: dict[str, Any] = {
+            "replaceAllShapesWithImage": {
+                "containsText": {
+                    "text": contains_text,
+                    "matchCase": False,
+                },
+                "imageUrl": image_url,
+                "imageReplaceMethod": image_replace_method,
             }
+        }
 
-            if page_object_ids:
-                request["replaceAllShapesWithImage"]["pageObjectIds"] = page_object_ids
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
+        if page_object_ids:
+            request["replaceAllShapesWithImage"]["pageObjectIds"] = page_object_ids
 
+        def on_reply(result: dict[str, Any]) -> dict[str, Any]:
             # Get replacement count from response
-            replies = result.get("replies", [{}])
-            occurrences = replies[0].get("replaceAllShapesWithImage", {}).get("occurrencesChanged", 0)
+            replies = result.get("replies") or [{}]
+            occurrences = replies[0].get("replaceAllShapesWithImage", {}).get(
+                "occurrencesChanged", 0
+            )
 
             output_success(
                 operation="slides.replace_shapes_with_image",
@@ -2688,25 +2475,21 @@ class SlidesService(BaseService):
                 occurrences_replaced=occurrences,
             )
             return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.replace_shapes_with_image",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+
+        return self._submit(presentation_id, [request], on_reply)
 
     # =========================================================================
     # ACCESSIBILITY
     # =========================================================================
 
+    @_api_error("slides.set_alt_text")
     def set_alt_text(
         self,
         presentation_id: str,
         object_id: str,
         title: str | None = None,
         description: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | None:
         """Set alt text (accessibility text) on a page element.
 
         Args:
@@ -2715,58 +2498,39 @@ class SlidesService(BaseService):
             title: Brief title for the element.
             description: Detailed description for screen readers.
         """
-        try:
-            alt_text: dict[str, Any] = {}
-            fields = []
-
-            if title is not None:
-                alt_text["title"] = title
-                fields.append("title")
-            if description is not None:
-                alt_text["description"] = description
-                fields.append("description")
-
-            if not fields:
-                output_error(
-                    error_code="INVALID_ARGUMENT",
-                    operation="slides.set_alt_text",
-                    message="At least one of title or description required",
-                )
-                raise SystemExit(ExitCode.INVALID_ARGS)
-
-            request = {
-                "updatePageElementAltText": {
-                    "objectId": object_id,
-                    **alt_text,
-                }
+        alt_text: dict[str, Any] = {}
+        fields = []
+
+        if title is not None:
+            alt_text["title"] = title
+            fields.append("title")
+        if description is not None:
+            alt_text["description"] = description
+            fields.append("description")
+
+        if not fields:
+            raise InvalidArgsError("At least one of title or description required")
+
+        request = {
+            "updatePageElementAltText": {
+                "objectId": object_id,
+                **alt_text,
             }
+        }
 
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.set_alt_text",
-                presentation_id=presentation_id,
-                object_id=object_id,
-                updated_fields=fields,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.set_alt_text",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.set_alt_text",
+            object_id=object_id,
+            updated_fields=fields,
+        )
 
     # =========================================================================
     # EMBEDDED CHARTS
     # =========================================================================
 
+    @_api_error("slides.insert_sheets_chart")
     def insert_sheets_chart(
         self,
         presentation_id: str,
@@ -2778,9 +2542,11 @@ class SlidesService(BaseService):
         width: float,
         height: float,
         linking_mode: str = "LINKED",
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | str:
         """Insert a chart from Google Sheets.
 
+        Inside a batch, returns the new chart's object ID.
+
         Args:
             presentation_id: The presentation ID.
             page_object_id: The page (slide) to insert on.
@@ -2792,54 +2558,38 @@ class SlidesService(BaseService):
             height: Height in points.
             linking_mode: 'LINKED' (updates with source) or 'NOT_LINKED_IMAGE' (static).
         """
-        import uuid
-
-        try:
-            element_id = f"chart_{uuid.uuid4().hex[:8]}"
-
-            request = {
-                "createSheetsChart": {
-                    "objectId": element_id,
-                    "spreadsheetId": spreadsheet_id,
-                    "chartId": chart_id,
-                    "linkingMode": linking_mode,
-                    "elementProperties": {
-                        "pageObjectId": page_object_id,
-                        "size": {
-                            "width": {"magnitude": width, "unit": "PT"},
-                            "height": {"magnitude": height, "unit": "PT"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "translateX": x * 12700,  # PT to EMU
-                            "translateY": y * 12700,  # PT to EMU
-                            "unit": "EMU",
-                        },
+        element_id = f"chart_{secrets.token_hex(4)}"
+
+        request = {
+            "createSheetsChart": {
+                "objectId": element_id,
+                "spreadsheetId": spreadsheet_id,
+                "chartId": chart_id,
+                "linkingMode": linking_mode,
+                "elementProperties": {
+                    "pageObjectId": page_object_id,
+                    "size": {
+                        "width": {"magnitude": width, "unit": "PT"},
+                        "height": {"magnitude": height, "unit": "PT"},
                     },
-                }
+                    "transform": {
+                        "scaleX": 1,
+                        "scaleY": 1,
+                        "translateX": x * 12700,  # PT to EMU
+                        "translateY": y * 12700,  # PT to EMU
+                        "unit": "EMU",
+                    },
+                },
             }
-
-            result = self.execute(
-                self.service.presentations()
-                .batchUpdate(
-                    presentationId=presentation_id, body={"requests": [request]}
-                )
-            )
-
-            output_success(
-                operation="slides.insert_sheets_chart",
-                presentation_id=presentation_id,
-                page_object_id=page_object_id,
-                element_id=element_id,
-                spreadsheet_id=spreadsheet_id,
-                chart_id=chart_id,
-            )
-            return result
-        except HttpError as e:
-            output_error(
-                error_code="API_ERROR",
-                operation="slides.insert_sheets_chart",
-                message=f"Google Slides API error: {e.reason}",
-            )
-            raise SystemExit(ExitCode.API_ERROR)
+        }
+
+        return self._submit_and_report(
+            presentation_id,
+            [request],
+            "slides.insert_sheets_chart",
+            queued_result=element_id,
+            page_object_id=page_object_id,
+            element_id=element_id,
+            spreadsheet_id=spreadsheet_id,
+            chart_id=chart_id,
+        )
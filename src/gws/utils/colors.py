@@ -1,5 +1,27 @@
 """Color parsing utilities."""
 
+from functools import lru_cache
+
+from gws.exceptions import InvalidArgsError
+
+
+@lru_cache(maxsize=256)
+def _parse_hex_rgb(color_str: str) -> tuple[float, float, float]:
+    """Parse hex color to an immutable (red, green, blue) tuple.
+
+    Cached because callers tend to reuse a small palette across many requests.
+    """
+    hex_color = color_str.lstrip("#")
+    if len(hex_color) == 3:
+        hex_color = hex_color[0] * 2 + hex_color[1] * 2 + hex_color[2] * 2
+    if len(hex_color) != 6:
+        raise ValueError(f"Invalid hex color: {color_str!r} (expected 3 or 6 hex digits)")
+    return (
+        int(hex_color[0:2], 16) / 255.0,
+        int(hex_color[2:4], 16) / 255.0,
+        int(hex_color[4:6], 16) / 255.0,
+    )
+
 
 def parse_hex_color(color_str: str) -> dict[str, float]:
     """Parse hex color to RGB float values (0.0-1.0).
@@ -8,18 +30,26 @@ def parse_hex_color(color_str: str) -> dict[str, float]:
         color_str: Hex color string like "#FF0000", "FF0000", "#F00", or "F00"
 
     Returns:
-        Dict with red, green, blue keys (0.0-1.0 range)
+        Dict with red, green, blue keys (0.0-1.0 range). A new dict is returned
+        on every call, so callers may embed or mutate it freely.
 
     Raises:
         ValueError: If color string is not a valid 3 or 6 character hex color.
     """
-    hex_color = color_str.lstrip("#")
-    if len(hex_color) == 3:
-        hex_color = hex_color[0] * 2 + hex_color[1] * 2 + hex_color[2] * 2
-    if len(hex_color) != 6:
-        raise ValueError(f"Invalid hex color: {color_str!r} (expected 3 or 6 hex digits)")
-    return {
-        "red": int(hex_color[0:2], 16) / 255.0,
-        "green": int(hex_color[2:4], 16) / 255.0,
-        "blue": int(hex_color[4:6], 16) / 255.0,
-    }
+    red, green, blue = _parse_hex_rgb(color_str)
+    return {"red": red, "green": green, "blue": blue}
+
+
+def parse_color_arg(color_str: str) -> dict[str, float]:
+    """Parse a user-supplied hex color, as parse_hex_color() does.
+
+    For service methods that raise GWSErrors: a malformed color raises
+    InvalidArgsError, which the CLI reports as an INVALID_ARGS error.
+
+    Raises:
+        InvalidArgsError: If color string is not a valid 3 or 6 character hex color.
+    """
+    try:
+        return parse_hex_color(color_str)
+    except ValueError as e:
+        raise InvalidArgsError(str(e)) from e
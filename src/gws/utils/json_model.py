@@ -0,0 +1,66 @@
+"""JSON request/response model for googleapiclient.
+
+Uses orjson for request body encoding and response decoding when it is
+installed, falling back to the stdlib json module otherwise (and for request
+bodies containing non-ASCII text or values orjson rejects, such as integers
+wider than 64 bits).
+"""
+
+import json
+from typing import Any
+
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def encoded_size(value: Any) -> int:
+    """Return the length in bytes of `value` encoded as compact JSON.
+
+    Used to size request bodies before sending them; the figure can differ by
+    a few bytes from the body actually sent (e.g. escaped non-ASCII text).
+    """
+    if orjson is not None:
+        try:
+            return len(orjson.dumps(value))
+        except TypeError:
+            pass
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+class FastJsonModel(JsonModel):
+    """JsonModel that encodes and decodes JSON with orjson when available."""
+
+    def serialize(self, body_value: Any) -> str:
+        if orjson is None:
+            return super().serialize(body_value)
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        try:
+            # Return str rather than bytes: multipart media uploads attach the
+            # body as a text MIME part, which rejects bytes payloads.
+            text = orjson.dumps(body_value).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values json accepts, e.g. integers wider
+            # than 64 bits.
+            return super().serialize(body_value)
+        if not text.isascii():
+            # http.client encodes str bodies as latin-1, and orjson emits raw
+            # UTF-8 with no ensure_ascii option, so let the stdlib escape it.
+            return super().serialize(body_value)
+        return text
+
+    def deserialize(self, content: bytes | str) -> Any:
+        if orjson is None:
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Non-JSON bodies are handed back as text, as JsonModel does.
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
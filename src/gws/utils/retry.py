@@ -9,6 +9,12 @@ from googleapiclient.errors import HttpError
 
 T = TypeVar("T")
 
+# Statuses worth retrying; every other error (400, 403, 404, ...) fails fast.
+RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on a single backoff sleep, including server-requested waits.
+MAX_RETRY_DELAY = 32.0
+
 
 def is_retryable_error(error: HttpError) -> bool:
     """Check if an HTTP error is retryable.
@@ -17,12 +23,28 @@ def is_retryable_error(error: HttpError) -> bool:
     - 500 Internal Error
     - 502 Bad Gateway
     - 503 Service Unavailable
+    - 504 Gateway Timeout
     - 429 Too Many Requests (rate limiting)
     """
     if error.resp is None:
         return False
     status = error.resp.status
-    return status in (429, 500, 502, 503)
+    return status in RETRYABLE_STATUSES
+
+
+def retry_delay(error: HttpError, delay: float) -> float:
+    """Return how long to sleep before retrying after `error`.
+
+    Honors a numeric Retry-After header when the server sends one, otherwise
+    uses `delay` plus up to 50% jitter. The result is capped at MAX_RETRY_DELAY.
+    """
+    retry_after = error.resp.get("retry-after") if error.resp is not None else None
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to our own backoff
+    return min(delay + random.uniform(0, 0.5 * delay), MAX_RETRY_DELAY)
 
 
 def retry_on_transient_error(
@@ -56,7 +78,7 @@ def retry_on_transient_error(
                     if not is_retryable_error(e) or attempt >= max_retries:
                         raise
                     last_error = e
-                    time.sleep(delay + random.uniform(0, 0.5 * delay))
+                    time.sleep(retry_delay(e, delay))
                     delay *= backoff_factor
 
             # This shouldn't be reached, but just in case
@@ -103,7 +125,7 @@ def execute_with_retry(
             if not is_retryable_error(e) or attempt >= max_retries:
                 raise
             last_error = e
-            time.sleep(delay + random.uniform(0, 0.5 * delay))
+            time.sleep(retry_delay(e, delay))
             delay *= backoff_factor
 
     if last_error:
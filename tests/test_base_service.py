@@ -0,0 +1,59 @@
+"""Tests for BaseService client construction."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gws.services import base
+from gws.services.sheets import SheetsService
+
+
+@pytest.fixture
+def mock_build():
+    """Patch auth and discovery so services can be built offline."""
+    mock_auth = MagicMock()
+    with patch("gws.services.base.resolve_auth_provider", return_value=mock_auth), \
+         patch("gws.services.base.build") as build:
+        yield build
+
+
+class TestSharedTransport:
+    """Test that API clients share one HTTP transport per thread."""
+
+    def test_services_share_transport(self, mock_build):
+        """Test that separate clients wrap the same underlying Http."""
+        service = SheetsService()
+        service.service
+        service.drive_service
+
+        transports = [c.kwargs["http"].http for c in mock_build.call_args_list]
+        assert len(transports) == 2
+        assert transports[0] is transports[1]
+
+    def test_credentials_not_passed_with_http(self, mock_build):
+        """Test build() gets an authorized http instead of raw credentials."""
+        SheetsService().service
+
+        kwargs = mock_build.call_args.kwargs
+        assert "credentials" not in kwargs
+        assert kwargs["http"].credentials is not None
+
+    def test_bundled_discovery_document(self, mock_build):
+        """Test that clients are built from the bundled discovery document."""
+        SheetsService().service
+
+        kwargs = mock_build.call_args.kwargs
+        assert kwargs["static_discovery"] is True
+        assert kwargs["cache_discovery"] is False
+
+    def test_transport_is_per_thread(self):
+        """Test that other threads get their own Http instance."""
+        main_http = base._shared_http()
+        other: list = []
+        thread = threading.Thread(target=lambda: other.append(base._shared_http()))
+        thread.start()
+        thread.join()
+
+        assert base._shared_http() is main_http
+        assert other[0] is not main_http
@@ -25,7 +25,7 @@ def docs_service():
         mock_docs_api = MagicMock()
         mock_drive_api = MagicMock()
 
-        def build_side_effect(service_name, version, credentials=None):
+        def build_side_effect(service_name, version, credentials=None, **kwargs):
             if service_name == "docs":
                 return mock_docs_api
             elif service_name == "drive":
@@ -1192,6 +1192,25 @@ class TestColorParsing:
         with pytest.raises(ValueError):
             parse_hex_color("")
 
+    def test_parse_color_arg_invalid(self):
+        """Test that invalid user-supplied colors raise InvalidArgsError."""
+        from gws.exceptions import InvalidArgsError
+        from gws.utils.colors import parse_color_arg
+
+        assert parse_color_arg("#F00") == {"red": 1.0, "green": 0.0, "blue": 0.0}
+        with pytest.raises(InvalidArgsError):
+            parse_color_arg("#GGGGGG")
+
+    def test_parse_hex_color_returns_fresh_dict(self):
+        """Test that cached parsing never hands out a shared dict."""
+        from gws.utils.colors import parse_hex_color
+
+        first = parse_hex_color("#4285F4")
+        first["red"] = 0.0
+        second = parse_hex_color("#4285F4")
+        assert second is not first
+        assert second["red"] == 0x42 / 255.0
+
 
 # =============================================================================
 # FIND TEXT TESTS
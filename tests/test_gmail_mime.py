@@ -31,7 +31,7 @@ def gmail_service():
 
         mock_gmail_api = MagicMock()
 
-        def build_side_effect(service_name, version, credentials=None):
+        def build_side_effect(service_name, version, credentials=None, **kwargs):
             if service_name == "gmail":
                 return mock_gmail_api
             return MagicMock()
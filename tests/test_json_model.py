@@ -0,0 +1,109 @@
+"""Tests for the googleapiclient JSON model."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.model import JsonModel
+
+from gws.utils import json_model
+from gws.utils.json_model import FastJsonModel
+
+
+class TestFastJsonModel:
+    """Test request body serialization."""
+
+    BODY = {"requests": [{"mergeCells": {"range": {"sheetId": 0}, "mergeType": "MERGE_ALL"}}]}
+
+    def test_serialize_round_trips(self):
+        """Test that the serialized body decodes to the original value."""
+        assert json.loads(FastJsonModel().serialize(self.BODY)) == self.BODY
+
+    def test_serialize_returns_str(self):
+        """Test that the body is text so multipart uploads can embed it."""
+        assert isinstance(FastJsonModel().serialize(self.BODY), str)
+
+    def test_serialize_non_ascii(self):
+        """Test that non-ASCII text survives encoding."""
+        body = {"title": "Ελληνικά ✓"}
+        text = FastJsonModel().serialize(body)
+        assert json.loads(text) == body
+        assert text.isascii()
+
+    def test_serialize_wide_integer(self):
+        """Test that integers orjson rejects fall back to the stdlib encoder."""
+        body = {"values": [[12345678901234567890123]]}
+        assert FastJsonModel().serialize(body) == JsonModel().serialize(body)
+
+    def test_body_is_wire_safe(self):
+        """Test that the body encodes the way http.client sends str bodies."""
+        body = {"values": [["naïve", "日本語"]]}
+        FastJsonModel().serialize(body).encode("latin-1")
+
+    def test_data_wrapper(self):
+        """Test that data-wrapped APIs still get the wrapper."""
+        assert json.loads(FastJsonModel(data_wrapper=True).serialize({"a": 1})) == {"data": {"a": 1}}
+
+    def test_falls_back_without_orjson(self):
+        """Test that the stdlib encoder is used when orjson is missing."""
+        with patch.object(json_model, "orjson", None):
+            assert json.loads(FastJsonModel().serialize(self.BODY)) == self.BODY
+
+    def test_request_sets_content_type(self):
+        """Test that request() still labels the body as JSON."""
+        headers, _, _, body = FastJsonModel().request({}, {}, {}, self.BODY)
+        assert headers["content-type"] == "application/json"
+        assert json.loads(body) == self.BODY
+
+    def test_unserializable_body_raises(self):
+        """Test that unsupported values fail at encode time."""
+        with pytest.raises(TypeError):
+            FastJsonModel().serialize({"value": object()})
+
+
+class TestFastJsonModelResponses:
+    """Test response body decoding."""
+
+    def test_deserialize_bytes(self):
+        """Test that raw response bytes decode to Python objects."""
+        content = '{"replies": [{"addChart": {"chart": {"chartId": 7}}}], "t": "Ελ"}'.encode()
+        assert FastJsonModel().deserialize(content) == {
+            "replies": [{"addChart": {"chart": {"chartId": 7}}}],
+            "t": "Ελ",
+        }
+
+    def test_deserialize_non_json(self):
+        """Test that non-JSON content is returned as text."""
+        assert FastJsonModel().deserialize(b"Not Found") == "Not Found"
+
+    def test_deserialize_data_wrapper(self):
+        """Test that the data wrapper is stripped from wrapped responses."""
+        assert FastJsonModel(data_wrapper=True).deserialize(b'{"data": {"a": 1}}') == {"a": 1}
+
+    def test_deserialize_matches_stdlib(self):
+        """Test that both decoders agree."""
+        content = b'{"a": [1, 2.5, null, true], "b": {"c": "d"}}'
+        with patch.object(json_model, "orjson", None):
+            expected = FastJsonModel().deserialize(content)
+        assert FastJsonModel().deserialize(content) == expected
+
+    def test_response_uses_deserialize(self):
+        """Test that response() decodes successful bodies."""
+        resp = MagicMock(status=200)
+        assert FastJsonModel().response(resp, b'{"ok": true}') == {"ok": True}
+
+
+class TestEncodedSize:
+    """Test request body sizing."""
+
+    @pytest.mark.parametrize("value", [
+        {"requests": [{"a": 1}, {"b": [1.5, None, True]}]},
+        {"title": "Ελληνικά ✓"},
+        {"values": [[12345678901234567890123]]},
+    ])
+    def test_matches_compact_utf8_encoding(self, value):
+        """Test that both encoders report the compact UTF-8 length."""
+        expected = len(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode())
+        assert json_model.encoded_size(value) == expected
+        with patch.object(json_model, "orjson", None):
+            assert json_model.encoded_size(value) == expected
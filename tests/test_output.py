@@ -1,10 +1,14 @@
-"""Tests for output_external_content security wrapping."""
+"""Tests for JSON output and output_external_content security wrapping."""
 
 import json
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 
+import pytest
+
+from gws import output
 from gws.config import Config
-from gws.output import output_external_content
+from gws.output import output_external_content, output_json
 
 
 class TestOutputExternalContent:
@@ -354,3 +358,38 @@ class TestOutputExternalContent:
 
         captured = json.loads(capsys.readouterr().out)
         assert captured["content"]["trust_level"] == "external"
+
+
+class TestOutputJson:
+    """Tests for output_json encoding."""
+
+    @pytest.mark.parametrize("data", [
+        {"status": "success", "nested": {"items": [1, 2.5, None, True], "empty": []}},
+        {"title": "Ελληνικά ✓"},
+        {"when": datetime(2024, 5, 1, 12, 30)},
+        {1: "non-string key"},
+        {"big": 2 ** 70},
+        {"small": 1e-07, "large": 1e+20, "wide": 1.2345678901234568e+16},
+    ])
+    def test_matches_stdlib_encoding(self, capsys, data):
+        """Test that output decodes to what json.dumps output decodes to."""
+        output_json(data)
+
+        out = capsys.readouterr().out
+        assert out.endswith("\n")
+        assert json.loads(out) == json.loads(json.dumps(data, indent=2, default=str))
+
+    def test_non_finite_floats_become_null(self, capsys):
+        """Test that orjson writes NaN and infinities as JSON null."""
+        if output.orjson is None:
+            pytest.skip("orjson not installed")
+        output_json({"nan": float("nan"), "inf": float("inf")})
+
+        assert json.loads(capsys.readouterr().out) == {"nan": None, "inf": None}
+
+    def test_without_orjson(self, capsys):
+        """Test that the stdlib encoder is used when orjson is missing."""
+        with patch.object(output, "orjson", None):
+            output_json({"a": [1, 2]})
+
+        assert json.loads(capsys.readouterr().out) == {"a": [1, 2]}
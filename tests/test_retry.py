@@ -0,0 +1,79 @@
+"""Tests for retry handling of Google API errors."""
+
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from gws.utils.retry import MAX_RETRY_DELAY, execute_with_retry, is_retryable_error, retry_delay
+
+
+def make_http_error(status: int, headers: dict | None = None) -> HttpError:
+    """Build an HttpError with a real httplib2 response."""
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    resp.reason = "error"
+    return HttpError(resp=resp, content=b"")
+
+
+class TestIsRetryable:
+    """Test which statuses are retried."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_transient_statuses(self, status):
+        """Test that rate limits and server errors are retried."""
+        assert is_retryable_error(make_http_error(status))
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 409])
+    def test_client_errors_fail_fast(self, status):
+        """Test that client errors are not retried."""
+        assert not is_retryable_error(make_http_error(status))
+
+
+class TestRetryDelay:
+    """Test backoff delay computation."""
+
+    def test_honors_retry_after_seconds(self):
+        """Test that a numeric Retry-After header is used as-is."""
+        error = make_http_error(429, {"retry-after": "3"})
+        assert retry_delay(error, 1.0) == 3.0
+
+    def test_retry_after_is_capped(self):
+        """Test that huge Retry-After values are capped."""
+        error = make_http_error(429, {"retry-after": "3600"})
+        assert retry_delay(error, 1.0) == MAX_RETRY_DELAY
+
+    def test_http_date_falls_back_to_backoff(self):
+        """Test that a date-form Retry-After uses the jittered backoff."""
+        error = make_http_error(503, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert 2.0 <= retry_delay(error, 2.0) <= 3.0
+
+    def test_backoff_is_capped(self):
+        """Test that exponential backoff never exceeds the cap."""
+        assert retry_delay(make_http_error(500), 100.0) == MAX_RETRY_DELAY
+
+
+class TestExecuteWithRetry:
+    """Test request execution with retries."""
+
+    def test_client_error_not_retried(self):
+        """Test that a 400 raises immediately without sleeping."""
+        request = MagicMock()
+        request.execute.side_effect = make_http_error(400)
+
+        with patch("gws.utils.retry.time.sleep") as sleep:
+            with pytest.raises(HttpError):
+                execute_with_retry(request)
+
+        assert request.execute.call_count == 1
+        sleep.assert_not_called()
+
+    def test_rate_limit_retried_with_retry_after(self):
+        """Test that a 429 is retried after the server-requested delay."""
+        request = MagicMock()
+        request.execute.side_effect = [make_http_error(429, {"retry-after": "2"}), {"ok": True}]
+
+        with patch("gws.utils.retry.time.sleep") as sleep:
+            assert execute_with_retry(request) == {"ok": True}
+
+        sleep.assert_called_once_with(2.0)
@@ -0,0 +1,1440 @@
+"""Tests for Google Sheets service operations."""
+
+import gzip
+import json
+import pytest
+import time
+from unittest.mock import MagicMock, patch
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from gws.exceptions import APIError, InvalidArgsError, NotFoundError
+
+
+# =============================================================================
+# TEST FIXTURES AND HELPERS
+# =============================================================================
+
+
+@pytest.fixture
+def sheets_service():
+    """Create a SheetsService with fully mocked API."""
+    mock_auth = MagicMock()
+    mock_creds = MagicMock()
+    mock_creds.valid = True
+    mock_auth.get_credentials.return_value = mock_creds
+
+    with patch("gws.services.base.resolve_auth_provider", return_value=mock_auth), \
+         patch("gws.services.base.build") as mock_build:
+
+        mock_sheets_api = MagicMock()
+        mock_build.return_value = mock_sheets_api
+
+        from gws.services.sheets import SheetsService
+
+        yield SheetsService()
+
+
+def setup_get_response(service, spreadsheet: dict):
+    """Configure mock to return specific spreadsheet metadata."""
+    service.service.spreadsheets().get().execute.return_value = spreadsheet
+
+
+def setup_batch_response(service, replies: list | None = None):
+    """Configure mock to return batch update response."""
+    response = {
+        "spreadsheetId": "sheet-123",
+        "replies": replies or [{}],
+    }
+    service.service.spreadsheets().batchUpdate().execute.return_value = response
+
+
+def make_http_error(status: int = 400, reason: str = "Bad Request") -> HttpError:
+    """Build an HttpError with the given status and reason."""
+    resp = MagicMock(status=status, reason=reason)
+    return HttpError(resp=resp, content=b"")
+
+
+def sent_requests(service) -> list[dict]:
+    """Return the requests list from the most recent batchUpdate call."""
+    return service.service.spreadsheets().batchUpdate.call_args.kwargs["body"]["requests"]
+
+
+def all_outputs(capsys) -> list[dict]:
+    """Parse every JSON document written to stdout."""
+    out = capsys.readouterr().out
+    decoder = json.JSONDecoder()
+    idx, docs = 0, []
+    while idx < len(out):
+        if out[idx].isspace():
+            idx += 1
+            continue
+        doc, idx = decoder.raw_decode(out, idx)
+        docs.append(doc)
+    return docs
+
+
+def last_output(capsys) -> dict:
+    """Parse the last JSON document written to stdout."""
+    docs = all_outputs(capsys)
+    return docs[-1] if docs else {}
+
+
+# =============================================================================
+# METADATA CACHE TESTS
+# =============================================================================
+
+
+class TestMetadataCache:
+    """Test the short-lived spreadsheet metadata cache."""
+
+    def test_clear_conditional_formats_uses_fields_mask(self, sheets_service, capsys):
+        """Test that only sheet IDs and conditional formats are requested."""
+        setup_get_response(sheets_service, {
+            "sheets": [{"properties": {"sheetId": 0}, "conditionalFormats": [{}, {}]}],
+        })
+        setup_batch_response(sheets_service)
+
+        sheets_service.clear_conditional_formats("sheet-123", 0)
+
+        get_kwargs = sheets_service.service.spreadsheets().get.call_args.kwargs
+        assert get_kwargs["fields"] == "sheets(properties(sheetId),conditionalFormats)"
+        assert [r["deleteConditionalFormatRule"]["index"] for r in sent_requests(sheets_service)] == [1, 0]
+        assert last_output(capsys)["rules_cleared"] == 2
+
+    def test_repeated_reads_hit_cache(self, sheets_service, capsys):
+        """Test that a second lookup within the TTL skips the network."""
+        setup_get_response(sheets_service, {
+            "sheets": [{"properties": {"sheetId": 0}}],
+        })
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        sheets_service.clear_conditional_formats("sheet-123", 0)
+        sheets_service.clear_conditional_formats("sheet-123", 0)
+
+        assert get_execute.call_count == 1
+
+    def test_batch_update_refreshes_cache(self, sheets_service, capsys):
+        """Test that a mutation refreshes cached metadata from its response."""
+        setup_get_response(sheets_service, {
+            "sheets": [{"properties": {"sheetId": 0}, "conditionalFormats": [{}]}],
+        })
+        sheets_service.service.spreadsheets().batchUpdate().execute.return_value = {
+            "spreadsheetId": "sheet-123",
+            "replies": [{}],
+            "updatedSpreadsheet": {"sheets": [{"properties": {"sheetId": 0}}]},
+        }
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        result = sheets_service.clear_conditional_formats("sheet-123", 0)
+        sheets_service.clear_conditional_formats("sheet-123", 0)
+
+        assert get_execute.call_count == 1
+        assert "updatedSpreadsheet" not in result
+        call_kwargs = sheets_service.service.spreadsheets().batchUpdate.call_args.kwargs
+        assert call_kwargs["body"]["includeSpreadsheetInResponse"] is True
+        assert call_kwargs["body"]["responseIncludeGridData"] is False
+        assert call_kwargs["fields"] == (
+            "spreadsheetId,replies,"
+            "updatedSpreadsheet(sheets(properties(sheetId),conditionalFormats))"
+        )
+        assert last_output(capsys)["rules_cleared"] == 0
+
+    def test_expired_entries_not_refreshed(self, sheets_service, capsys):
+        """Test that a mutation after the TTL does not request expired masks back."""
+        setup_get_response(sheets_service, {
+            "sheets": [{"properties": {"sheetId": 0}, "conditionalFormats": []}],
+        })
+        setup_batch_response(sheets_service)
+        sheets_service.clear_conditional_formats("sheet-123", 0)
+
+        later = time.monotonic() + sheets_service.METADATA_CACHE_TTL + 1
+        with patch("gws.services.sheets.time.monotonic", return_value=later):
+            sheets_service.insert_rows("sheet-123", 0, 0, 1)
+
+        call_kwargs = sheets_service.service.spreadsheets().batchUpdate.call_args.kwargs
+        assert call_kwargs["fields"] == "spreadsheetId,replies"
+        assert call_kwargs["body"]["includeSpreadsheetInResponse"] is False
+        assert "sheet-123" not in sheets_service._metadata_cache
+
+    def test_uncached_batch_update_skips_spreadsheet(self, sheets_service, capsys):
+        """Test that mutations without cached metadata ask for replies only."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.freeze_rows("sheet-123", 0, 1)
+
+        call_kwargs = sheets_service.service.spreadsheets().batchUpdate.call_args.kwargs
+        assert call_kwargs["body"]["includeSpreadsheetInResponse"] is False
+        assert call_kwargs["body"]["responseIncludeGridData"] is False
+        assert call_kwargs["fields"] == "spreadsheetId,replies"
+
+    def test_failed_batch_update_drops_cache(self, sheets_service, capsys):
+        """Test that a failed mutation forces the next lookup to refetch."""
+        setup_get_response(sheets_service, {
+            "sheets": [{"properties": {"sheetId": 0}, "conditionalFormats": [{}]}],
+        })
+        sheets_service.service.spreadsheets().batchUpdate().execute.side_effect = make_http_error()
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        for _ in range(2):
+            with pytest.raises(APIError):
+                sheets_service.clear_conditional_formats("sheet-123", 0)
+
+        assert get_execute.call_count == 2
+
+    def test_expired_entries_are_refetched(self, sheets_service, capsys):
+        """Test that entries older than the TTL are not reused."""
+        setup_get_response(sheets_service, {
+            "sheets": [{"properties": {"sheetId": 0}}],
+        })
+        get_execute = sheets_service.service.spreadsheets().get().execute
+        with patch.object(type(sheets_service), "METADATA_CACHE_TTL", 0.0):
+            sheets_service.clear_conditional_formats("sheet-123", 0)
+            sheets_service.clear_conditional_formats("sheet-123", 0)
+
+        assert get_execute.call_count == 2
+
+    def test_range_listers_share_one_fetch(self, sheets_service, capsys):
+        """Test that listing protected and named ranges issues a single GET."""
+        setup_get_response(sheets_service, {
+            "namedRanges": [{"namedRangeId": "nr-1", "name": "Totals", "range": {"sheetId": 0}}],
+            "sheets": [{
+                "properties": {"sheetId": 0, "title": "Data"},
+                "protectedRanges": [{"protectedRangeId": 3, "range": {"sheetId": 0}}],
+            }],
+        })
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        protected = sheets_service.list_protected_ranges("sheet-123")
+        named = sheets_service.list_named_ranges("sheet-123")
+
+        assert get_execute.call_count == 1
+        get_kwargs = sheets_service.service.spreadsheets().get.call_args.kwargs
+        assert get_kwargs["fields"] == (
+            "namedRanges(namedRangeId,name,range),"
+            "sheets(properties(sheetId,title),protectedRanges)"
+        )
+        assert protected["protected_ranges"][0]["protected_range_id"] == 3
+        assert protected["protected_ranges"][0]["sheet_title"] == "Data"
+        assert named["named_ranges"] == [{
+            "named_range_id": "nr-1",
+            "name": "Totals",
+            "sheet_id": 0,
+            "start_row": None,
+            "end_row": None,
+            "start_col": None,
+            "end_col": None,
+        }]
+
+    def test_mutation_refreshes_listing(self, sheets_service, capsys):
+        """Test that a listing after a mutation reads the refreshed entry."""
+        setup_get_response(sheets_service, {"namedRanges": [], "sheets": []})
+        sheets_service.service.spreadsheets().batchUpdate().execute.return_value = {
+            "spreadsheetId": "sheet-123",
+            "replies": [{"addNamedRange": {"namedRange": {"namedRangeId": "nr-2"}}}],
+            "updatedSpreadsheet": {"namedRanges": [{"namedRangeId": "nr-2", "name": "New"}]},
+        }
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        sheets_service.list_named_ranges("sheet-123")
+        sheets_service.create_named_range("sheet-123", "New", 0, 0, 1, 0, 1)
+        result = sheets_service.list_named_ranges("sheet-123")
+
+        assert get_execute.call_count == 1
+        assert [nr["name"] for nr in result["named_ranges"]] == ["New"]
+
+    def test_sheet_ids_resolved_from_one_fetch(self, sheets_service):
+        """Test that resolving several sheet names issues a single GET."""
+        setup_get_response(sheets_service, {"sheets": [
+            {"properties": {"sheetId": 0, "title": "Data"}},
+            {"properties": {"sheetId": 7, "title": "Report"}},
+        ]})
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        assert sheets_service.get_sheet_id("sheet-123", "Report") == 7
+        assert sheets_service.get_sheet_id("sheet-123", "Data") == 0
+        with pytest.raises(NotFoundError) as exc_info:
+            sheets_service.get_sheet_id("sheet-123", "Missing")
+
+        assert get_execute.call_count == 1
+        assert exc_info.value.operation == "sheets.get_sheet_id"
+
+    def test_list_all_takes_one_fetch(self, sheets_service, capsys):
+        """Test that list_all covers all three listings with a single GET."""
+        setup_get_response(sheets_service, {
+            "namedRanges": [{"namedRangeId": "nr-1", "name": "Totals", "range": {"sheetId": 0}}],
+            "sheets": [{
+                "properties": {"sheetId": 0, "title": "Data"},
+                "protectedRanges": [{"protectedRangeId": 3, "range": {"sheetId": 0}}],
+                "data": [{"rowData": [{"values": [{}, {"pivotTable": {"rows": [{}]}}]}]}],
+            }],
+        })
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        result = sheets_service.list_all("sheet-123")
+
+        assert get_execute.call_count == 1
+        get_kwargs = sheets_service.service.spreadsheets().get.call_args.kwargs
+        assert "protectedRanges" in get_kwargs["fields"]
+        assert "pivotTable" in get_kwargs["fields"]
+        assert [p["rows"] for p in result["pivot_tables"]] == [1]
+        assert [p["protected_range_id"] for p in result["protected_ranges"]] == [3]
+        assert [n["name"] for n in result["named_ranges"]] == ["Totals"]
+        assert last_output(capsys)["operation"] == "sheets.list_all"
+
+
+# =============================================================================
+# PIVOT TABLE TESTS
+# =============================================================================
+
+
+class TestPivotTables:
+    """Test pivot table listing."""
+
+    def test_list_pivot_tables_reads_anchor_cells(self, sheets_service, capsys):
+        """Test that pivots are found in cell data, once each, with one schema."""
+        pivot = {
+            "source": {"sheetId": 0},
+            "rows": [{"sourceColumnOffset": 0}],
+            "values": [{"sourceColumnOffset": 1}, {"sourceColumnOffset": 2}],
+        }
+        setup_get_response(sheets_service, {
+            "sheets": [
+                {"properties": {"sheetId": 0, "title": "Data"}, "data": [{"rowData": [{}]}]},
+                {
+                    "properties": {"sheetId": 5, "title": "Report"},
+                    "data": [{"rowData": [{"values": [{}, {"pivotTable": pivot}]}]}],
+                },
+            ],
+        })
+
+        result = sheets_service.list_pivot_tables("sheet-123")
+
+        get_kwargs = sheets_service.service.spreadsheets().get.call_args.kwargs
+        assert get_kwargs["fields"] == (
+            "sheets(properties(sheetId,title),"
+            "data(rowData(values(pivotTable(source,rows,columns,values)))))"
+        )
+        assert result["pivot_tables"] == [{
+            "sheet_id": 5,
+            "sheet_title": "Report",
+            "source": {"sheetId": 0},
+            "rows": 1,
+            "columns": 0,
+            "values": 2,
+        }]
+
+
+class TestBulkCreation:
+    """Test the plural create/protect methods."""
+
+    def test_create_named_ranges_single_request(self, sheets_service, capsys):
+        """Test that several named ranges go out in one batchUpdate."""
+        setup_batch_response(sheets_service, replies=[
+            {"addNamedRange": {"namedRange": {"namedRangeId": "a"}}},
+            {"addNamedRange": {"namedRange": {"namedRangeId": "b"}}},
+        ])
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        sheets_service.create_named_ranges("sheet-123", [
+            {"name": "First", "sheet_id": 0, "start_row": 0, "end_row": 1, "start_col": 0, "end_col": 1},
+            {"name": "Second", "sheet_id": 0, "start_row": 1, "end_row": 2, "start_col": 0, "end_col": 1},
+        ])
+
+        assert batch_update.call_count == 1
+        assert [r["addNamedRange"]["namedRange"]["name"] for r in sent_requests(sheets_service)] == [
+            "First", "Second",
+        ]
+        assert last_output(capsys)["named_ranges"] == [
+            {"name": "First", "named_range_id": "a"},
+            {"name": "Second", "named_range_id": "b"},
+        ]
+
+    def test_protect_ranges_matches_singular_request(self, sheets_service, capsys):
+        """Test that plural and singular methods build identical requests."""
+        setup_batch_response(sheets_service)
+        spec = {"sheet_id": 2, "start_row": 0, "end_row": 1, "start_col": 0, "end_col": 4,
+                "description": "Header", "editors": ["a@example.com"]}
+
+        sheets_service.protect_range("sheet-123", **spec)
+        single = sent_requests(sheets_service)
+        sheets_service.protect_ranges("sheet-123", [spec])
+
+        assert sent_requests(sheets_service) == single
+
+    def test_create_pivot_tables_reports_targets(self, sheets_service, capsys):
+        """Test that each pivot spec becomes an updateCells request."""
+        setup_batch_response(sheets_service, replies=[{}, {}])
+        spec = {
+            "source_sheet_id": 0, "source_start_row": 0, "source_end_row": 10,
+            "source_start_col": 0, "source_end_col": 3, "target_sheet_id": 1,
+            "target_row": 0, "target_col": 0, "row_source_columns": [0],
+            "value_source_columns": [2],
+        }
+
+        sheets_service.create_pivot_tables("sheet-123", [spec, {**spec, "target_col": 5}])
+
+        assert len(sent_requests(sheets_service)) == 2
+        assert [p["target_location"] for p in last_output(capsys)["pivot_tables"]] == [
+            "R0C0", "R0C5",
+        ]
+
+    def test_pivot_value_functions_padded_with_sum(self, sheets_service, capsys):
+        """Test that value columns without a function default to SUM."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.create_pivot_table(
+            "sheet-123", 0, 0, 10, 0, 4, 1, 0, 0,
+            row_source_columns=[0], value_source_columns=[1, 2, 3],
+            value_functions=["average"], column_source_columns=[4],
+        )
+
+        pivot = sent_requests(sheets_service)[0]["updateCells"]["rows"][0]["values"][0]["pivotTable"]
+        assert [v["summarizeFunction"] for v in pivot["values"]] == ["AVERAGE", "SUM", "SUM"]
+        assert [c["sourceColumnOffset"] for c in pivot["columns"]] == [4]
+
+    @pytest.mark.parametrize("overrides", [
+        {"value_functions": ["SUM", "SUM"]},
+        {"value_functions": ["TOTAL"]},
+        {"source_end_row": 0},
+    ])
+    def test_invalid_pivot_rejected_before_request(self, sheets_service, overrides):
+        """Test that bad pivot arguments fail locally, without an API call."""
+        spec = {
+            "source_sheet_id": 0, "source_start_row": 0, "source_end_row": 10,
+            "source_start_col": 0, "source_end_col": 4, "target_sheet_id": 1,
+            "target_row": 0, "target_col": 0, "row_source_columns": [0],
+            "value_source_columns": [1], **overrides,
+        }
+
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.create_pivot_table("sheet-123", **spec)
+
+        assert exc_info.value.operation == "sheets.create_pivot_table"
+        sheets_service.service.spreadsheets().batchUpdate.assert_not_called()
+
+    def test_reorganize_single_request_in_order(self, sheets_service, capsys):
+        """Test that moves, copies and fills go out as one ordered batchUpdate."""
+        setup_batch_response(sheets_service, replies=[{}, {}, {}])
+
+        sheets_service.reorganize(
+            "sheet-123",
+            copy_pastes=[{
+                "source_sheet_id": 0, "source_start_row": 0, "source_end_row": 2,
+                "source_start_col": 0, "source_end_col": 2, "dest_sheet_id": 1,
+                "dest_start_row": 5, "dest_start_col": 5,
+            }],
+            move_columns=[{"sheet_id": 0, "source_start": 3, "source_end": 4,
+                           "destination_index": 0}],
+            move_rows=[{"sheet_id": 0, "source_start": 1, "source_end": 2,
+                        "destination_index": 9}],
+        )
+
+        requests = sent_requests(sheets_service)
+        assert sheets_service.service.spreadsheets().batchUpdate().execute.call_count == 1
+        assert [next(iter(r)) for r in requests] == ["moveDimension", "moveDimension", "copyPaste"]
+        assert requests[0]["moveDimension"]["source"]["dimension"] == "ROWS"
+        assert requests[1]["moveDimension"]["source"]["dimension"] == "COLUMNS"
+        assert requests[2]["copyPaste"]["destination"]["endRowIndex"] == 7
+        output = last_output(capsys)
+        assert (output["rows_moved"], output["columns_moved"], output["copies"]) == (1, 1, 1)
+
+    @pytest.mark.parametrize("kwargs", [{}, {"move_rows": [{"sheet_id": 0}]}])
+    def test_reorganize_rejects_bad_input(self, sheets_service, kwargs):
+        """Test that an empty call or a malformed entry raises InvalidArgsError."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.reorganize("sheet-123", **kwargs)
+
+        assert exc_info.value.operation == "sheets.reorganize"
+
+    @pytest.mark.parametrize("specs", [[], [{"name": "X"}], [{"name": "X", "bogus": 1}]])
+    def test_invalid_specs_rejected(self, sheets_service, specs):
+        """Test that empty lists and bad entries raise InvalidArgsError."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.create_named_ranges("sheet-123", specs)
+
+        assert exc_info.value.operation == "sheets.create_named_ranges"
+
+
+# =============================================================================
+# FILTER VIEW TESTS
+# =============================================================================
+
+
+class TestFilterViews:
+    """Test filter view listing and updates."""
+
+    def test_list_filter_views_uses_fields_mask(self, sheets_service, capsys):
+        """Test that only the fields needed for the listing are fetched."""
+        setup_get_response(sheets_service, {
+            "sheets": [
+                {
+                    "properties": {"sheetId": 0, "title": "Data"},
+                    "filterViews": [{"filterViewId": 5, "title": "Mine", "range": {"sheetId": 0}}],
+                },
+                {"properties": {"sheetId": 1, "title": "Empty"}},
+            ],
+        })
+
+        result = sheets_service.list_filter_views("sheet-123")
+
+        get_kwargs = sheets_service.service.spreadsheets().get.call_args.kwargs
+        assert get_kwargs["fields"] == (
+            "sheets(properties(sheetId,title),filterViews(filterViewId,title,range))"
+        )
+        assert result["filter_views"] == [{
+            "filter_view_id": 5,
+            "title": "Mine",
+            "sheet_id": 0,
+            "sheet_title": "Data",
+            "range": {"sheetId": 0},
+        }]
+
+    def test_iter_filter_views_is_lazy(self, sheets_service, capsys):
+        """Test that iteration yields entries on demand without output."""
+        setup_get_response(sheets_service, {
+            "sheets": [
+                {"properties": {"sheetId": 0, "title": "A"}, "filterViews": [{"filterViewId": 1}]},
+                {"properties": {"sheetId": 1, "title": "B"}, "filterViews": [{"filterViewId": 2}]},
+            ],
+        })
+
+        views = sheets_service.iter_filter_views("sheet-123")
+
+        assert next(views)["filter_view_id"] == 1
+        assert [v["sheet_title"] for v in views] == ["B"]
+        assert capsys.readouterr().out == ""
+
+    def test_iter_filter_views_raises_eagerly(self, sheets_service):
+        """Test that API errors surface when the iterator is created."""
+        sheets_service.service.spreadsheets().get().execute.side_effect = make_http_error()
+
+        with pytest.raises(APIError) as exc_info:
+            sheets_service.iter_filter_views("sheet-123")
+
+        assert exc_info.value.operation == "sheets.iter_filter_views"
+
+    def test_list_filter_views_max_results(self, sheets_service, capsys):
+        """Test that max_results trims the entries but not the count."""
+        setup_get_response(sheets_service, {
+            "sheets": [
+                {"properties": {"sheetId": 0, "title": "A"},
+                 "filterViews": [{"filterViewId": i} for i in range(5)]},
+                {"properties": {"sheetId": 1, "title": "B"}, "filterViews": [{"filterViewId": 9}]},
+            ],
+        })
+
+        result = sheets_service.list_filter_views("sheet-123", max_results=2)
+
+        assert [v["filter_view_id"] for v in result["filter_views"]] == [0, 1]
+        output = last_output(capsys)
+        assert output["count"] == 6
+        assert len(output["filter_views"]) == 2
+
+    def test_list_filter_views_negative_max_results(self, sheets_service):
+        """Test that a negative limit is rejected before any request."""
+        with pytest.raises(InvalidArgsError):
+            sheets_service.list_filter_views("sheet-123", max_results=-1)
+
+    def test_repeated_listing_hits_cache(self, sheets_service, capsys):
+        """Test that listing twice within the TTL fetches once."""
+        setup_get_response(sheets_service, {"sheets": []})
+        get_execute = sheets_service.service.spreadsheets().get().execute
+
+        sheets_service.list_filter_views("sheet-123")
+        sheets_service.list_filter_views("sheet-123")
+
+        assert get_execute.call_count == 1
+
+    def test_update_filter_view_masks_given_fields(self, sheets_service, capsys):
+        """Test that only the title and bounds passed are sent and masked."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.update_filter_view("sheet-123", 5, title="", end_row=50)
+
+        update = sent_requests(sheets_service)[0]["updateFilterView"]
+        assert update["fields"] == "title,range"
+        assert update["filter"] == {"filterViewId": 5, "title": "", "range": {"endRowIndex": 50}}
+        assert last_output(capsys)["updated_fields"] == ["title", "range"]
+
+    def test_update_filter_view_requires_a_field(self, sheets_service):
+        """Test that an update with nothing to change is rejected."""
+        with pytest.raises(InvalidArgsError):
+            sheets_service.update_filter_view("sheet-123", 5)
+
+
+# =============================================================================
+# DIMENSION OPERATION TESTS
+# =============================================================================
+
+
+class TestDimensionOperations:
+    """Test row and column insert/delete/resize and auto-fill requests."""
+
+    def test_insert_rows_request(self, sheets_service, capsys):
+        """Test insert_rows sends an insertDimension over ROWS."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.insert_rows("sheet-123", 7, start_index=2, count=3)
+
+        assert sent_requests(sheets_service) == [{
+            "insertDimension": {
+                "range": {"sheetId": 7, "dimension": "ROWS", "startIndex": 2, "endIndex": 5},
+                "inheritFromBefore": True,
+            }
+        }]
+
+    def test_delete_columns_request(self, sheets_service, capsys):
+        """Test delete_columns sends a deleteDimension over COLUMNS."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.delete_columns("sheet-123", 0, start_index=1, end_index=4)
+
+        assert sent_requests(sheets_service) == [{
+            "deleteDimension": {
+                "range": {"sheetId": 0, "dimension": "COLUMNS", "startIndex": 1, "endIndex": 4},
+            }
+        }]
+        assert last_output(capsys)["deleted_count"] == 3
+
+    def test_auto_resize_columns_request(self, sheets_service, capsys):
+        """Test auto_resize_columns uses the dimensions key."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.auto_resize_columns("sheet-123", 0, 0, 2)
+
+        request = sent_requests(sheets_service)[0]["autoResizeDimensions"]
+        assert request["dimensions"]["dimension"] == "COLUMNS"
+        assert request["dimensions"]["endIndex"] == 2
+
+    @pytest.mark.parametrize("fill_end,expected", [
+        ((10, 2), ("ROWS", 8)),
+        ((2, 6), ("COLUMNS", 4)),
+        ((5, 9), ("ROWS", 3)),
+    ])
+    def test_auto_fill_direction(self, sheets_service, capsys, fill_end, expected):
+        """Test that the fill direction and length follow the fill range end."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.auto_fill("sheet-123", 0, 0, 2, 0, 2, 0, fill_end[0], 0, fill_end[1])
+
+        fill = sent_requests(sheets_service)[0]["autoFill"]["sourceAndDestination"]
+        assert (fill["dimension"], fill["fillLength"]) == expected
+
+    def test_auto_fill_must_extend_source(self, sheets_service):
+        """Test that a fill range inside the source fails without an API call."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.auto_fill("sheet-123", 0, 0, 2, 0, 2, 0, 2, 0, 2)
+
+        assert exc_info.value.operation == "sheets.auto_fill"
+        sheets_service.service.spreadsheets().batchUpdate.assert_not_called()
+
+
+# =============================================================================
+# ENUM ARGUMENT TESTS
+# =============================================================================
+
+
+class TestEnumArguments:
+    """Test case-insensitive handling of enum-like arguments."""
+
+    def test_merge_type_is_normalized(self, sheets_service, capsys):
+        """Test merge_type is upper-cased in the request and output."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.merge_cells("sheet-123", 0, 0, 2, 0, 2, merge_type="merge_rows")
+
+        assert sent_requests(sheets_service)[0]["mergeCells"]["mergeType"] == "MERGE_ROWS"
+        assert last_output(capsys)["merge_type"] == "MERGE_ROWS"
+
+    def test_invalid_merge_type(self, sheets_service, capsys):
+        """Test an unknown merge_type exits with INVALID_ARGS."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.merge_cells("sheet-123", 0, 0, 2, 0, 2, merge_type="diagonal")
+
+        assert exc_info.value.operation == "sheets.merge_cells"
+
+    def test_delimiter_type_is_normalized(self, sheets_service, capsys):
+        """Test delimiter types are upper-cased and CUSTOM carries its delimiter."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.text_to_columns("sheet-123", 0, 0, 10, 1, "custom", custom_delimiter="|")
+
+        request = sent_requests(sheets_service)[0]["textToColumns"]
+        assert (request["delimiterType"], request["delimiter"]) == ("CUSTOM", "|")
+        assert last_output(capsys)["delimiter_type"] == "CUSTOM"
+
+    @pytest.mark.parametrize("delimiter_type", ["TAB", "CUSTOM"])
+    def test_invalid_delimiter_rejected(self, sheets_service, delimiter_type):
+        """Test unknown delimiters, and CUSTOM without one, fail before the API call."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.text_to_columns("sheet-123", 0, 0, 10, 1, delimiter_type)
+
+        assert exc_info.value.operation == "sheets.text_to_columns"
+        sheets_service.service.spreadsheets().batchUpdate.assert_not_called()
+
+    def test_condition_type_is_normalized(self, sheets_service, capsys):
+        """Test mixed-case condition types map to the canonical value."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.add_conditional_format(
+            "sheet-123", 0, 0, 5, 0, 1,
+            condition_type="Number_Greater",
+            condition_values=["10"],
+            background_color="#FF0000",
+        )
+
+        rule = sent_requests(sheets_service)[0]["addConditionalFormatRule"]["rule"]
+        assert rule["booleanRule"]["condition"]["type"] == "NUMBER_GREATER"
+
+    def test_invalid_condition_type(self, sheets_service, capsys):
+        """Test an unknown condition type exits with INVALID_ARGS."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.add_conditional_format(
+                "sheet-123", 0, 0, 5, 0, 1, condition_type="sometimes", condition_values=[]
+            )
+
+        assert "condition_type" in exc_info.value.message
+
+    def test_invalid_chart_type_lists_sorted_choices(self, sheets_service, capsys):
+        """Test the chart type error lists choices in a stable order."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.add_chart("sheet-123", 0, "donut", 0, 10, 0, 2, 0, 4)
+
+        assert exc_info.value.message == (
+            "chart_type must be one of: ['AREA', 'BAR', 'COLUMN', 'LINE', 'PIE', 'SCATTER']"
+        )
+
+    def test_border_style_is_normalized(self, sheets_service, capsys):
+        """Test border style is upper-cased once and reused."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.set_borders("sheet-123", 0, 0, 1, 0, 1, top=True, style="dashed")
+
+        assert sent_requests(sheets_service)[0]["updateBorders"]["top"]["style"] == "DASHED"
+
+    @pytest.mark.parametrize("validation_type,values,formula,expected,custom_ui", [
+        ("one_of_list", ["a", "b"], None, ["a", "b"], True),
+        ("custom_formula", ["ignored"], "=A1>0", ["=A1>0"], False),
+        ("custom_formula", ["=B1"], None, ["=B1"], False),
+        ("number_between", ["1", "9"], "=A1", ["1", "9"], False),
+        ("text_is_email", None, None, None, False),
+    ])
+    def test_validation_condition_values(
+        self, sheets_service, capsys, validation_type, values, formula, expected, custom_ui
+    ):
+        """Test which argument feeds the condition values for each type."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.set_data_validation(
+            "sheet-123", 0, 0, 1, 0, 1, validation_type, values=values, formula=formula
+        )
+
+        rule = sent_requests(sheets_service)[0]["setDataValidation"]["rule"]
+        sent = [v["userEnteredValue"] for v in rule["condition"].get("values", [])] or None
+        assert rule["condition"]["type"] == validation_type.upper()
+        assert sent == expected
+        assert ("showCustomUi" in rule) is custom_ui
+
+
+class TestBanding:
+    """Test addBanding and updateBanding color handling."""
+
+    def test_default_palette(self, sheets_service, capsys):
+        """Test that the default palette is used when no colors are given."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.add_banding("sheet-123", 0, 0, 10, 0, 3)
+
+        props = sent_requests(sheets_service)[0]["addBanding"]["bandedRange"]["rowProperties"]
+        assert props == {
+            "headerColor": {"red": 0.26, "green": 0.52, "blue": 0.96},
+            "firstBandColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
+            "secondBandColor": {"red": 0.95, "green": 0.95, "blue": 0.95},
+        }
+
+    def test_default_palette_not_shared(self, sheets_service, capsys):
+        """Test that each request gets its own color dicts."""
+        setup_batch_response(sheets_service)
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+
+        sheets_service.add_banding("sheet-123", 0, 0, 10, 0, 3)
+        first = batch_update.call_args.kwargs["body"]["requests"][0]
+        sheets_service.add_banding("sheet-123", 0, 0, 10, 0, 3)
+        second = batch_update.call_args.kwargs["body"]["requests"][0]
+
+        first_props = first["addBanding"]["bandedRange"]["rowProperties"]
+        second_props = second["addBanding"]["bandedRange"]["rowProperties"]
+        assert first_props["headerColor"] is not second_props["headerColor"]
+
+    def test_custom_colors_only(self, sheets_service, capsys):
+        """Test that given colors replace the whole default palette."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.add_banding("sheet-123", 0, 0, 10, 0, 3, header_color="#000")
+
+        props = sent_requests(sheets_service)[0]["addBanding"]["bandedRange"]["rowProperties"]
+        assert props == {"headerColor": {"red": 0.0, "green": 0.0, "blue": 0.0}}
+
+    def test_invalid_color(self, sheets_service):
+        """Test that a malformed hex color is reported as invalid arguments."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.add_banding("sheet-123", 0, 0, 10, 0, 3, first_color="#12")
+
+        assert exc_info.value.operation == "sheets.add_banding"
+
+    def test_update_sets_only_given_colors(self, sheets_service, capsys):
+        """Test that update_banding sends and masks just the colors passed."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.update_banding("sheet-123", 7, header_color="#000", footer_color="#fff")
+
+        update = sent_requests(sheets_service)[0]["updateBanding"]
+        assert update["fields"] == (
+            "bandedRangeId,rowProperties.headerColor,rowProperties.footerColor"
+        )
+        assert update["bandedRange"] == {
+            "bandedRangeId": 7,
+            "rowProperties": {
+                "headerColor": {"red": 0.0, "green": 0.0, "blue": 0.0},
+                "footerColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
+            },
+        }
+
+    def test_update_invalid_color(self, sheets_service):
+        """Test that update_banding reports a malformed color the same way."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.update_banding("sheet-123", 7, footer_color="nope")
+
+        assert exc_info.value.operation == "sheets.update_banding"
+
+
+class TestRangeValidation:
+    """Test GridRange index checks."""
+
+    @pytest.mark.parametrize("rows,cols", [((5, 2), (0, 1)), ((0, 1), (-1, 3)), ((-2, 4), (0, 1))])
+    def test_bad_range_rejected_before_request(self, sheets_service, rows, cols):
+        """Test that inverted or negative ranges raise InvalidArgsError without an API call."""
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.sort_range("sheet-123", 0, *rows, *cols, sort_column=0)
+
+        assert exc_info.value.operation == "sheets.sort_range"
+        assert batch_update.call_count == 0
+
+    def test_empty_range_allowed(self, sheets_service, capsys):
+        """Test that a zero-width range is passed through."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.clear_data_validation("sheet-123", 0, 3, 3, 0, 1)
+
+        assert sent_requests(sheets_service)[0]["setDataValidation"]["range"]["startRowIndex"] == 3
+
+    @pytest.mark.parametrize("bounds,expected", [
+        ({}, {"sheetId": 4}),
+        ({"start_row": 2, "end_col": 5}, {"sheetId": 4, "startRowIndex": 2, "endColumnIndex": 5}),
+    ])
+    def test_open_range_omits_sheet_edges(self, sheets_service, capsys, bounds, expected):
+        """Test that bounds at the sheet edges are left out of the request."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.trim_whitespace("sheet-123", 4, **bounds)
+
+        assert sent_requests(sheets_service)[0]["trimWhitespace"]["range"] == expected
+
+    def test_open_range_rejects_inverted_bounds(self, sheets_service):
+        """Test that an end before its start is caught locally."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.trim_whitespace("sheet-123", 0, start_row=5, end_row=2)
+
+        assert exc_info.value.operation == "sheets.trim_whitespace"
+
+
+# =============================================================================
+# API ERROR HANDLING TESTS
+# =============================================================================
+
+
+class TestApiErrorHandling:
+    """Test that HttpErrors are converted to typed errors and reported."""
+
+    def test_http_error_raises_api_error(self, sheets_service, capsys):
+        """Test an HttpError is raised as APIError tagged with the operation."""
+        sheets_service.service.spreadsheets().batchUpdate().execute.side_effect = make_http_error()
+
+        with pytest.raises(APIError) as exc_info:
+            sheets_service.insert_rows("sheet-123", 0, 0, 1)
+
+        assert exc_info.value.exit_code == 2
+        assert exc_info.value.operation == "sheets.insert_rows"
+        assert "Bad Request" in exc_info.value.message
+        assert isinstance(exc_info.value.__cause__, HttpError)
+        assert capsys.readouterr().out == ""
+
+    def test_cli_reports_typed_error(self, capsys):
+        """Test the CLI entry point prints the error and exits with its code."""
+        from gws import cli
+
+        error = APIError("Google Sheets API error: Bad Request", operation="sheets.insert_rows")
+        with patch.object(cli, "app", side_effect=error):
+            with pytest.raises(SystemExit) as exc_info:
+                cli.run()
+
+        assert exc_info.value.code == 2
+        output = last_output(capsys)
+        assert output["status"] == "error"
+        assert output["error_code"] == "API_ERROR"
+        assert output["operation"] == "sheets.insert_rows"
+
+    def test_read_error_raises_api_error(self, sheets_service, capsys):
+        """Test that values API failures surface as APIError, not SystemExit."""
+        values = sheets_service.service.spreadsheets().values()
+        values.get().execute.side_effect = make_http_error(status=404, reason="Not Found")
+
+        with pytest.raises(APIError) as exc_info:
+            sheets_service.read("sheet-123", "A1:B2")
+
+        assert exc_info.value.operation == "sheets.read"
+        assert capsys.readouterr().out == ""
+
+    def test_format_cells_without_options(self, sheets_service):
+        """Test that a no-op format request raises InvalidArgsError."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.format_cells("sheet-123", 0, 0, 1, 0, 1)
+
+        assert exc_info.value.operation == "sheets.format"
+
+    def test_decorated_method_keeps_metadata(self, sheets_service):
+        """Test the wrapper preserves the method name and docstring."""
+        method = type(sheets_service).merge_cells
+        assert method.__name__ == "merge_cells"
+        assert method.__doc__.startswith("Merge cells")
+
+    def test_invalid_color_raises_invalid_args(self, sheets_service):
+        """Test that a malformed hex color raises InvalidArgsError, not ValueError."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.format_cells("sheet-123", 0, 0, 1, 0, 1, background_color="#12")
+
+        assert exc_info.value.operation == "sheets.format"
+        sheets_service.service.spreadsheets().batchUpdate.assert_not_called()
+
+
+# =============================================================================
+# REPLY PARSING TESTS
+# =============================================================================
+
+
+class TestReplyParsing:
+    """Test extraction of IDs from batchUpdate replies."""
+
+    def test_ids_read_from_first_reply(self, sheets_service, capsys):
+        """Test that created object IDs are reported from the reply."""
+        setup_batch_response(sheets_service, replies=[
+            {"addFilterView": {"filter": {"filterViewId": 77}}},
+        ])
+
+        sheets_service.create_filter_view("sheet-123", 0, "View", 0, 10, 0, 3)
+
+        assert last_output(capsys)["filter_view_id"] == 77
+
+    @pytest.mark.parametrize("replies", [[], [{}], [{"addChart": None}], [{"addChart": {}}]])
+    def test_missing_reply_fields_yield_none(self, sheets_service, capsys, replies):
+        """Test that absent or partial replies report None instead of raising."""
+        sheets_service.service.spreadsheets().batchUpdate().execute.return_value = {
+            "spreadsheetId": "sheet-123",
+            "replies": replies,
+        }
+
+        sheets_service.add_chart("sheet-123", 0, "line", 0, 10, 0, 2, 0, 4)
+
+        assert last_output(capsys)["chart_id"] is None
+
+    def test_find_replace_counts_default_to_zero(self, sheets_service, capsys):
+        """Test that an empty findReplace reply reports zero changes."""
+        setup_batch_response(sheets_service, replies=[{}])
+
+        sheets_service.find_replace("sheet-123", "a", "b")
+
+        output = last_output(capsys)
+        assert output["occurrences_changed"] == 0
+
+
+# =============================================================================
+# BATCH TESTS
+# =============================================================================
+
+
+class TestBatch:
+    """Test coalescing of requests with SheetsService.batch()."""
+
+    def test_queued_requests_sent_once(self, sheets_service, capsys):
+        """Test that queued operations go out as a single batchUpdate."""
+        setup_batch_response(sheets_service, replies=[
+            {},
+            {"addChart": {"chart": {"chartId": 42}}},
+            {"duplicateSheet": {"properties": {"sheetId": 9, "title": "Copy"}}},
+        ])
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            assert sheets_service.sort_range("sheet-123", 0, 0, 10, 0, 3, sort_column=1) is None
+            sheets_service.add_chart("sheet-123", 0, "line", 0, 10, 0, 2, 0, 4)
+            sheets_service.duplicate_sheet("sheet-123", 0, new_name="Copy")
+            assert batch.pending == 3
+            assert batch_update.call_count == 0
+
+        assert batch_update.call_count == 1
+        kinds = [next(iter(r)) for r in sent_requests(sheets_service)]
+        assert kinds == ["sortRange", "addChart", "duplicateSheet"]
+
+        outputs = all_outputs(capsys)
+        assert [o["operation"] for o in outputs] == [
+            "sheets.sort_range", "sheets.add_chart", "sheets.duplicate_sheet",
+        ]
+        assert outputs[1]["chart_id"] == 42
+        assert len(batch.results) == 3
+        assert batch.results[1]["replies"] == [{"addChart": {"chart": {"chartId": 42}}}]
+
+    def test_cached_lookup_flushes_queue(self, sheets_service, capsys):
+        """Test that a warm-cache lookup inside a batch sends queued requests first."""
+        setup_get_response(sheets_service, {"sheets": [
+            {"properties": {"sheetId": 0, "title": "Sheet1"}},
+        ]})
+        sheets_service.service.spreadsheets().batchUpdate().execute.return_value = {
+            "spreadsheetId": "sheet-123",
+            "replies": [{"addSheet": {"properties": {"sheetId": 5, "title": "New"}}}],
+            "updatedSpreadsheet": {"sheets": [
+                {"properties": {"sheetId": 0, "title": "Sheet1"}},
+                {"properties": {"sheetId": 5, "title": "New"}},
+            ]},
+        }
+        assert sheets_service.get_sheet_id("sheet-123", "Sheet1") == 0
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.add_sheet("sheet-123", "New")
+            assert sheets_service.get_sheet_id("sheet-123", "New") == 5
+            assert batch.pending == 0
+
+    def test_error_in_block_discards_queue(self, sheets_service, capsys):
+        """Test that an exception inside the block sends nothing."""
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with pytest.raises(RuntimeError):
+            with sheets_service.batch("sheet-123"):
+                sheets_service.delete_chart("sheet-123", 7)
+                raise RuntimeError("abort")
+
+        assert batch_update.call_count == 0
+        assert sheets_service._batch is None
+
+    def test_other_spreadsheet_runs_immediately(self, sheets_service, capsys):
+        """Test that calls for a different spreadsheet flush and run directly."""
+        setup_batch_response(sheets_service)
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.delete_chart("sheet-123", 7)
+            result = sheets_service.delete_chart("other-sheet", 8)
+            assert result is not None
+            assert batch.pending == 0
+
+        assert batch_update().execute.call_count == 2
+        ids = [o["spreadsheet_id"] for o in all_outputs(capsys)]
+        assert ids == ["sheet-123", "other-sheet"]
+
+    def test_direct_call_flushes_queue_first(self, sheets_service, capsys):
+        """Test that a non-batched API call sends queued requests first."""
+        setup_batch_response(sheets_service)
+        setup_get_response(sheets_service, {"sheets": [{"properties": {"sheetId": 0}}]})
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.delete_chart("sheet-123", 7)
+            sheets_service.clear_conditional_formats("sheet-123", 0)
+            assert batch_update.call_count == 1
+            assert batch.pending == 0
+
+    def test_nested_batch_rejected(self, sheets_service):
+        """Test that only one batch can be open at a time."""
+        with sheets_service.batch("sheet-123"):
+            with pytest.raises(InvalidArgsError):
+                with sheets_service.batch("sheet-123"):
+                    pass
+
+    def test_flush_error_raises_api_error(self, sheets_service, capsys):
+        """Test that a failed flush surfaces as APIError."""
+        sheets_service.service.spreadsheets().batchUpdate().execute.side_effect = make_http_error()
+
+        with pytest.raises(APIError) as exc_info:
+            with sheets_service.batch("sheet-123"):
+                sheets_service.delete_chart("sheet-123", 7)
+
+        assert exc_info.value.operation == "sheets.batch"
+        assert sheets_service._batch is None
+
+
+# =============================================================================
+# FAN-OUT TESTS
+# =============================================================================
+
+    def test_adjacent_validations_merged(self, sheets_service, capsys):
+        """Test that touching ranges with the same rule become one request."""
+        setup_batch_response(sheets_service, replies=[{}])
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.set_data_validation("sheet-123", 0, 0, 10, 0, 1, "one_of_list", ["a", "b"])
+            sheets_service.set_data_validation("sheet-123", 0, 0, 10, 1, 2, "one_of_list", ["a", "b"])
+            sheets_service.set_data_validation("sheet-123", 0, 10, 20, 0, 2, "one_of_list", ["a", "b"])
+            assert batch.pending == 1
+
+        requests = sent_requests(sheets_service)
+        assert len(requests) == 1
+        assert requests[0]["setDataValidation"]["range"] == {
+            "sheetId": 0, "startRowIndex": 0, "endRowIndex": 20,
+            "startColumnIndex": 0, "endColumnIndex": 2,
+        }
+        assert len(all_outputs(capsys)) == 3
+
+    def test_validations_not_merged(self, sheets_service, capsys):
+        """Test that differing rules, gaps and formulas are kept separate."""
+        setup_batch_response(sheets_service, replies=[{}, {}, {}, {}])
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.set_data_validation("sheet-123", 0, 0, 10, 0, 1, "one_of_list", ["a"])
+            sheets_service.set_data_validation("sheet-123", 0, 0, 10, 1, 2, "one_of_list", ["b"])
+            sheets_service.set_data_validation("sheet-123", 0, 0, 10, 3, 4, "one_of_list", ["b"])
+            sheets_service.set_data_validation(
+                "sheet-123", 0, 0, 10, 4, 5, "custom_formula", formula="=A1>0"
+            )
+            sheets_service.set_data_validation(
+                "sheet-123", 0, 0, 10, 5, 6, "custom_formula", formula="=A1>0"
+            )
+            assert batch.pending == 5
+
+    def test_clear_then_set_filter_folded(self, sheets_service, capsys):
+        """Test that setBasicFilter replaces a queued clear for the same sheet."""
+        setup_batch_response(sheets_service, replies=[{}, {}])
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.clear_basic_filter("sheet-123", 0)
+            sheets_service.set_basic_filter("sheet-123", 0, 0, 10, 0, 3)
+            sheets_service.clear_basic_filter("sheet-123", 1)
+            sheets_service.set_basic_filter("sheet-123", 2, 0, 10, 0, 3)
+            assert batch.pending == 3
+
+        kinds = [next(iter(r)) for r in sent_requests(sheets_service)]
+        assert kinds == ["setBasicFilter", "clearBasicFilter", "setBasicFilter"]
+        assert [o["operation"] for o in all_outputs(capsys)] == [
+            "sheets.clear_basic_filter", "sheets.set_basic_filter",
+            "sheets.clear_basic_filter", "sheets.set_basic_filter",
+        ]
+
+    def test_protection_and_named_ranges_batched(self, sheets_service, capsys):
+        """Test that protection, named range and move operations queue too."""
+        setup_batch_response(sheets_service, replies=[
+            {"addProtectedRange": {"protectedRange": {"protectedRangeId": 11}}},
+            {"addNamedRange": {"namedRange": {"namedRangeId": "nr-1"}}},
+            {},
+        ])
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            assert sheets_service.protect_range("sheet-123", 0, 0, 1, 0, 5) is None
+            sheets_service.create_named_range("sheet-123", "Totals", 0, 0, 10, 0, 2)
+            sheets_service.move_rows("sheet-123", 0, 5, 7, 0)
+            assert batch.pending == 3
+
+        assert batch_update.call_count == 1
+        outputs = all_outputs(capsys)
+        assert outputs[0]["protected_range_id"] == 11
+        assert outputs[1]["named_range_id"] == "nr-1"
+        assert outputs[2]["operation"] == "sheets.move_rows"
+
+    def test_update_chart_spec(self, sheets_service, capsys):
+        """Test that chart type and legend share one basicChart entry."""
+        setup_batch_response(sheets_service)
+
+        sheets_service.update_chart("sheet-123", 7, chart_type="BAR", legend_position="TOP_LEGEND")
+
+        spec = sent_requests(sheets_service)[0]["updateChartSpec"]["spec"]
+        assert spec == {"basicChart": {"chartType": "BAR", "legendPosition": "TOP_LEGEND"}}
+        assert last_output(capsys)["updated_fields"] == [
+            "basicChart.chartType", "basicChart.legendPosition",
+        ]
+
+    def test_update_chart_without_fields_rejected(self, sheets_service):
+        """Test that update_chart with nothing to change raises InvalidArgsError."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            sheets_service.update_chart("sheet-123", 7)
+
+        assert exc_info.value.operation == "sheets.update_chart"
+
+    def test_formatting_and_dimension_operations_batched(self, sheets_service, capsys):
+        """Test that formatting, merge and dimension operations queue in a batch."""
+        setup_batch_response(sheets_service, replies=[{}, {}, {}])
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            assert sheets_service.merge_cells("sheet-123", 0, 0, 1, 0, 3) is None
+            sheets_service.freeze_rows("sheet-123", 0, 1)
+            sheets_service.insert_rows("sheet-123", 0, 5, 2)
+            assert batch.pending == 3
+
+        assert batch_update.call_count == 1
+        outputs = all_outputs(capsys)
+        assert [o["operation"] for o in outputs] == [
+            "sheets.merge_cells", "sheets.freeze_rows", "sheets.insert_rows",
+        ]
+        assert all(o["spreadsheet_id"] == "sheet-123" for o in outputs)
+
+    def test_cleanup_and_update_operations_batched(self, sheets_service, capsys):
+        """Test that sheet, cleanup, banding and filter view edits queue in a batch."""
+        setup_batch_response(sheets_service, replies=[
+            {"addSheet": {"properties": {"sheetId": 42}}}, {}, {}, {}, {},
+        ])
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            assert sheets_service.add_sheet("sheet-123", "New") is None
+            sheets_service.trim_whitespace("sheet-123", 0)
+            sheets_service.text_to_columns("sheet-123", 0, 0, 10, 1)
+            sheets_service.update_banding("sheet-123", 7, header_color="#000")
+            sheets_service.update_filter_view("sheet-123", 9, title="Mine")
+            assert batch.pending == 5
+
+        assert batch_update.call_count == 1
+        outputs = all_outputs(capsys)
+        assert [o["operation"] for o in outputs] == [
+            "sheets.add_sheet", "sheets.trim_whitespace", "sheets.text_to_columns",
+            "sheets.update_banding", "sheets.update_filter_view",
+        ]
+        assert outputs[0]["sheet_id"] == 42
+
+    def test_repeated_idempotent_update_dropped(self, sheets_service, capsys):
+        """Test that a back-to-back identical update is sent once."""
+        setup_batch_response(sheets_service)
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.update_banding("sheet-123", 7, header_color="#000")
+            sheets_service.update_banding("sheet-123", 7, header_color="#000")
+            assert batch.pending == 1
+
+        assert len(batch.results) == 2
+        assert len(all_outputs(capsys)) == 2
+
+    def test_non_adjacent_or_non_idempotent_repeats_kept(self, sheets_service, capsys):
+        """Test that repeats separated by another change, or inserts, are all sent."""
+        setup_batch_response(sheets_service, replies=[{}] * 5)
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.update_banding("sheet-123", 7, header_color="#000")
+            sheets_service.update_banding("sheet-123", 7, header_color="#fff")
+            sheets_service.update_banding("sheet-123", 7, header_color="#000")
+            sheets_service.insert_rows("sheet-123", 0, 5, 2)
+            sheets_service.insert_rows("sheet-123", 0, 5, 2)
+            assert batch.pending == 5
+
+    def test_caught_error_keeps_queue(self, sheets_service, capsys):
+        """Test that an operation rejected inside the block does not drop the others."""
+        setup_batch_response(sheets_service, replies=[{}, {}])
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.freeze_rows("sheet-123", 0, 1)
+            with pytest.raises(InvalidArgsError):
+                sheets_service.update_banding("sheet-123", 7)
+            sheets_service.freeze_columns("sheet-123", 0, 1)
+
+        assert batch_update.call_count == 1
+        assert len(sent_requests(sheets_service)) == 2
+        assert len(batch.results) == 2
+
+    def test_oversized_queue_split_between_operations(self, sheets_service, capsys, monkeypatch):
+        """Test that a long queue goes out in parts, never splitting an operation."""
+        monkeypatch.setattr(type(sheets_service), "MAX_BATCH_REQUESTS", 2)
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.return_value.execute.side_effect = lambda: {
+            "spreadsheetId": "sheet-123",
+            "replies": [{} for _ in batch_update.call_args.kwargs["body"]["requests"]],
+        }
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123") as batch:
+            sheets_service.freeze_rows("sheet-123", 0, 1)
+            sheets_service.protect_ranges("sheet-123", [
+                {"sheet_id": 0, "start_row": 0, "end_row": 1, "start_col": 0, "end_col": 1},
+                {"sheet_id": 0, "start_row": 2, "end_row": 3, "start_col": 0, "end_col": 1},
+            ])
+            sheets_service.insert_rows("sheet-123", 0, 5, 2)
+            sheets_service.unmerge_cells("sheet-123", 0, 0, 1, 0, 1)
+
+        sizes = [len(c.kwargs["body"]["requests"]) for c in batch_update.call_args_list]
+        assert sizes == [1, 2, 2]
+        assert len(batch.results) == 4
+
+    def test_oversized_payload_split(self, sheets_service, capsys, monkeypatch):
+        """Test that the byte limit also splits the queue."""
+        monkeypatch.setattr(type(sheets_service), "MAX_BATCH_BYTES", 200)
+        setup_batch_response(sheets_service)
+        batch_update = sheets_service.service.spreadsheets().batchUpdate
+        batch_update.reset_mock()
+
+        with sheets_service.batch("sheet-123"):
+            sheets_service.find_replace("sheet-123", "a" * 150, "b")
+            sheets_service.find_replace("sheet-123", "c" * 150, "d")
+
+        assert batch_update.call_count == 2
+
+
+class TestRequestCompression:
+    """Test gzip compression of batchUpdate bodies."""
+
+    @staticmethod
+    def make_request(body: str) -> HttpRequest:
+        """Build a real POST HttpRequest carrying the given body."""
+        return HttpRequest(
+            MagicMock(), lambda resp, content: content,
+            "https://sheets.googleapis.com/v4/spreadsheets/x:batchUpdate",
+            method="POST", body=body, headers={"content-type": "application/json"},
+        )
+
+    def test_large_body_compressed(self, sheets_service):
+        """Test that bodies over the threshold are gzipped and relabelled."""
+        body = json.dumps({"requests": [{"values": ["option"] * 500}]})
+        request = sheets_service._gzip_body(self.make_request(body))
+
+        assert request.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(request.body).decode("utf-8") == body
+        assert request.body_size == len(request.body) < len(body)
+
+    def test_small_body_untouched(self, sheets_service):
+        """Test that short bodies are sent as-is."""
+        request = sheets_service._gzip_body(self.make_request('{"requests": []}'))
+
+        assert request.body == '{"requests": []}'
+        assert "content-encoding" not in request.headers
+
+
+class TestFanOut:
+    """Test running one operation across spreadsheets concurrently."""
+
+    def test_results_in_input_order(self, sheets_service, capsys):
+        """Test that each spreadsheet gets the call and results keep order."""
+        def batch_update(spreadsheetId, body, fields):
+            request = MagicMock()
+            request.execute.return_value = {"spreadsheetId": spreadsheetId, "replies": [{}]}
+            return request
+
+        sheets_service.service.spreadsheets().batchUpdate.side_effect = batch_update
+        ids = [f"sheet-{i}" for i in range(6)]
+
+        results = sheets_service.fan_out("insert_rows", ids, 0, 0, 1, max_workers=3)
+
+        assert [r["spreadsheetId"] for r in results] == ids
+        outputs = all_outputs(capsys)
+        assert sorted(o["spreadsheet_id"] for o in outputs) == ids
+
+    def test_failure_is_returned_in_place(self, sheets_service, capsys):
+        """Test that one failing spreadsheet does not abort the others."""
+        def batch_update(spreadsheetId, body, fields):
+            request = MagicMock()
+            if spreadsheetId == "bad":
+                request.execute.side_effect = make_http_error()
+            else:
+                request.execute.return_value = {"spreadsheetId": spreadsheetId, "replies": [{}]}
+            return request
+
+        sheets_service.service.spreadsheets().batchUpdate.side_effect = batch_update
+
+        results = sheets_service.fan_out("insert_rows", ["ok-1", "bad", "ok-2"], 0, 0, 1)
+
+        assert results[0]["spreadsheetId"] == "ok-1"
+        assert isinstance(results[1], APIError)
+        assert results[2]["spreadsheetId"] == "ok-2"
+
+    def test_unknown_method_rejected(self, sheets_service):
+        """Test that only public operations can be fanned out."""
+        for name in ("nope", "_batch_update", "fan_out"):
+            with pytest.raises(InvalidArgsError):
+                sheets_service.fan_out(name, ["sheet-123"])
+
+    def test_empty_input(self, sheets_service):
+        """Test that no spreadsheets means no work."""
+        assert sheets_service.fan_out("insert_rows", [], 0, 0, 1) == []
+
+    def test_execute_parallel_sends_each_job(self, sheets_service, capsys):
+        """Test that each spreadsheet gets its own requests, with errors in place."""
+        def batch_update(spreadsheetId, body, fields):
+            request = MagicMock()
+            if spreadsheetId == "bad":
+                request.execute.side_effect = make_http_error()
+            else:
+                request.execute.return_value = {
+                    "spreadsheetId": spreadsheetId,
+                    "replies": [{}] * len(body["requests"]),
+                }
+            return request
+
+        sheets_service.service.spreadsheets().batchUpdate.side_effect = batch_update
+        jobs = [("a", [{"x": 1}]), ("bad", [{"x": 2}]), ("b", [{"x": 3}, {"x": 4}])]
+
+        results = sheets_service.execute_parallel(jobs, max_workers=2)
+
+        assert len(results[0]["replies"]) == 1
+        assert isinstance(results[1], APIError)
+        assert results[1].operation == "sheets.execute_parallel"
+        assert len(results[2]["replies"]) == 2
+        assert capsys.readouterr().out == ""
+
+
+# =============================================================================
+# INSTANCE LAYOUT TESTS
+# =============================================================================
+
+
+class TestInstanceLayout:
+    """Test that SheetsService keeps a slotted instance layout."""
+
+    def test_no_instance_dict(self, sheets_service):
+        """Test that instances do not carry a per-instance __dict__."""
+        assert not hasattr(sheets_service, "__dict__")
+
+    def test_unknown_attribute_rejected(self, sheets_service):
+        """Test that stray attribute assignment fails loudly."""
+        with pytest.raises(AttributeError):
+            sheets_service.unexpected = 1
+
+
+    def test_spreadsheets_collection_reused(self, sheets_service, capsys):
+        """Test that the spreadsheets() collection is built once per service."""
+        setup_get_response(sheets_service, {"sheets": [{"properties": {"sheetId": 0}}]})
+        setup_batch_response(sheets_service)
+        spreadsheets = sheets_service.service.spreadsheets
+        spreadsheets.reset_mock(return_value=False)
+
+        sheets_service.list_protected_ranges("sheet-123")
+        sheets_service.freeze_rows("sheet-123", 0, 1)
+
+        assert spreadsheets.call_count == 1
+
+    def test_values_collection_reused(self, sheets_service, capsys):
+        """Test that the values() collection is built once per service."""
+        values = sheets_service.service.spreadsheets().values
+        values.reset_mock(return_value=False)
+
+        sheets_service.clear("sheet-123", "A1:B2")
+        sheets_service.clear("sheet-123", "C1:D2")
+
+        assert values.call_count == 1
@@ -0,0 +1,753 @@
+"""Tests for Google Slides service operations."""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from googleapiclient.errors import HttpError
+
+from gws.exceptions import APIError, InvalidArgsError, NotFoundError
+
+
+# =============================================================================
+# TEST FIXTURES AND HELPERS
+# =============================================================================
+
+
+@pytest.fixture
+def slides_service():
+    """Create a SlidesService with fully mocked API."""
+    mock_auth = MagicMock()
+    mock_creds = MagicMock()
+    mock_creds.valid = True
+    mock_auth.get_credentials.return_value = mock_creds
+
+    with patch("gws.services.base.resolve_auth_provider", return_value=mock_auth), \
+         patch("gws.services.base.build") as mock_build:
+
+        mock_slides_api = MagicMock()
+        mock_build.return_value = mock_slides_api
+
+        from gws.services.slides import SlidesService
+
+        yield SlidesService()
+
+
+def setup_get_response(service, presentation: dict):
+    """Configure mock to return specific presentation metadata."""
+    service.service.presentations().get().execute.return_value = presentation
+
+
+def setup_batch_response(service, replies: list | None = None):
+    """Configure mock to return batch update response."""
+    response = {
+        "presentationId": "pres-123",
+        "replies": replies or [{}],
+    }
+    service.service.presentations().batchUpdate().execute.return_value = response
+
+
+def make_http_error(status: int = 400, reason: str = "Bad Request") -> HttpError:
+    """Build an HttpError with the given status and reason."""
+    resp = MagicMock(status=status, reason=reason)
+    return HttpError(resp=resp, content=b"")
+
+
+def sent_requests(service) -> list[dict]:
+    """Return the requests list from the most recent batchUpdate call."""
+    return service.service.presentations().batchUpdate.call_args.kwargs["body"]["requests"]
+
+
+def all_outputs(capsys) -> list[dict]:
+    """Parse every JSON document written to stdout."""
+    out = capsys.readouterr().out
+    decoder = json.JSONDecoder()
+    idx, docs = 0, []
+    while idx < len(out):
+        if out[idx].isspace():
+            idx += 1
+            continue
+        doc, idx = decoder.raw_decode(out, idx)
+        docs.append(doc)
+    return docs
+
+
+def last_output(capsys) -> dict:
+    """Parse the last JSON document written to stdout."""
+    docs = all_outputs(capsys)
+    return docs[-1] if docs else {}
+
+
+# =============================================================================
+# METADATA CACHE TESTS
+# =============================================================================
+
+
+class TestMetadataCache:
+    """Test the short-lived presentation metadata cache."""
+
+    def test_repeated_reads_hit_cache(self, slides_service, capsys):
+        """Test that a second lookup within the TTL skips the network."""
+        setup_get_response(slides_service, {"title": "Deck", "slides": [{"objectId": "s1"}]})
+        get_execute = slides_service.service.presentations().get().execute
+        get_execute.reset_mock()
+
+        slides_service.metadata("pres-123")
+        slides_service.metadata("pres-123")
+
+        assert get_execute.call_count == 1
+        assert last_output(capsys)["slide_count"] == 1
+
+    def test_metadata_uses_fields_mask(self, slides_service, capsys):
+        """Test that metadata() requests only titles and slide/element IDs."""
+        setup_get_response(slides_service, {
+            "title": "Deck",
+            "slides": [{"objectId": "s1", "pageElements": [{"objectId": "e1"}]}],
+        })
+
+        slides_service.metadata("pres-123")
+
+        get_kwargs = slides_service.service.presentations().get.call_args.kwargs
+        assert get_kwargs["fields"] == (
+            "revisionId,title,slides(objectId,pageElements(objectId,shape(shapeType),"
+            "image,table(rows,columns),line,video))"
+        )
+        output = last_output(capsys)
+        assert output["slides"] == [
+            {"object_id": "s1", "index": 0, "element_count": 1, "element_types": {"UNKNOWN": 1}},
+        ]
+
+    def test_metadata_counts_element_types(self, slides_service, capsys):
+        """Test that metadata() reports each slide's element types without reading text."""
+        setup_get_response(slides_service, {
+            "title": "Deck",
+            "slides": [{"objectId": "s1", "pageElements": [
+                {"objectId": "e1", "shape": {"shapeType": "TEXT_BOX"}},
+                {"objectId": "e2", "shape": {"shapeType": "TEXT_BOX"}},
+                {"objectId": "e3", "image": {}},
+            ]}],
+        })
+
+        slides_service.metadata("pres-123")
+
+        slide = last_output(capsys)["slides"][0]
+        assert slide["element_count"] == 3
+        assert slide["element_types"] == {"TEXT_BOX": 2, "IMAGE": 1}
+
+    def test_batch_update_drops_cache(self, slides_service, capsys):
+        """Test that a mutation forces the next lookup back to the API."""
+        setup_get_response(slides_service, {"title": "Deck", "slides": []})
+        setup_batch_response(slides_service)
+        get_execute = slides_service.service.presentations().get().execute
+        get_execute.reset_mock()
+
+        slides_service.metadata("pres-123")
+        slides_service.add_slide("pres-123")
+        slides_service.metadata("pres-123")
+
+        assert get_execute.call_count == 2
+
+    def test_expired_entry_refetched(self, slides_service, monkeypatch, capsys):
+        """Test that entries older than METADATA_CACHE_TTL are fetched again."""
+        monkeypatch.setattr(type(slides_service), "METADATA_CACHE_TTL", 0)
+        setup_get_response(slides_service, {"title": "Deck", "slides": []})
+        get_execute = slides_service.service.presentations().get().execute
+        get_execute.reset_mock()
+
+        slides_service.metadata("pres-123")
+        slides_service.metadata("pres-123")
+
+        assert get_execute.call_count == 2
+
+    def test_expired_entry_revalidated_by_revision(self, slides_service, monkeypatch, capsys):
+        """Test that an expired entry is reused when its revisionId is unchanged."""
+        monkeypatch.setattr(type(slides_service), "METADATA_CACHE_TTL", 0)
+        get = slides_service.service.presentations().get
+        get.reset_mock()
+        revision = {"rev": "r1"}
+
+        def fetch(presentationId, fields):
+            request = MagicMock()
+            if fields == "revisionId":
+                request.execute.return_value = {"revisionId": revision["rev"]}
+            else:
+                request.execute.return_value = {
+                    "revisionId": revision["rev"], "title": "Deck", "slides": [],
+                }
+            return request
+
+        get.side_effect = fetch
+
+        slides_service.metadata("pres-123")
+        slides_service.metadata("pres-123")
+        revision["rev"] = "r2"
+        slides_service.metadata("pres-123")
+
+        masks = [call.kwargs["fields"] for call in get.call_args_list]
+        assert masks[1:3] == ["revisionId", "revisionId"]
+        assert masks[0] == masks[3] != "revisionId"
+        assert len(masks) == 4
+
+    def test_cache_size_bounded(self, slides_service, monkeypatch, capsys):
+        """Test that the oldest presentation is evicted past METADATA_CACHE_SIZE."""
+        monkeypatch.setattr(type(slides_service), "METADATA_CACHE_SIZE", 2)
+        setup_get_response(slides_service, {"title": "Deck", "slides": []})
+
+        for presentation_id in ("p1", "p2", "p3"):
+            slides_service.metadata(presentation_id)
+
+        assert list(slides_service._metadata_cache) == ["p2", "p3"]
+
+
+# =============================================================================
+# MUTATION TESTS
+# =============================================================================
+
+
+class TestMutations:
+    """Test single mutations sent outside a batch."""
+
+    def test_add_slide_sends_request(self, slides_service, capsys):
+        """Test that add_slide sends one createSlide request immediately."""
+        setup_batch_response(slides_service)
+
+        result = slides_service.add_slide("pres-123", layout="TITLE", insertion_index=2)
+
+        assert result["presentationId"] == "pres-123"
+        request = sent_requests(slides_service)[0]["createSlide"]
+        assert request["slideLayoutReference"] == {"predefinedLayout": "TITLE"}
+        assert request["insertionIndex"] == 2
+        output = last_output(capsys)
+        assert output["operation"] == "slides.add_slide"
+        assert output["slide_id"] == request["objectId"]
+
+    def test_add_slide_normalizes_layout(self, slides_service, capsys):
+        """Test that layout names are accepted in any case."""
+        setup_batch_response(slides_service)
+
+        slides_service.add_slide("pres-123", layout="title_only")
+
+        request = sent_requests(slides_service)[0]["createSlide"]
+        assert request["slideLayoutReference"] == {"predefinedLayout": "TITLE_ONLY"}
+        assert last_output(capsys)["layout"] == "TITLE_ONLY"
+
+    @pytest.mark.parametrize("layout", ["CAPTION_ONLY", "SECTION_TITLE_AND_DESCRIPTION"])
+    def test_add_slide_accepts_all_predefined_layouts(self, slides_service, layout, capsys):
+        """Test that every layout in the API's PredefinedLayout enum is accepted."""
+        setup_batch_response(slides_service)
+
+        slides_service.add_slide("pres-123", layout=layout)
+
+        request = sent_requests(slides_service)[0]["createSlide"]
+        assert request["slideLayoutReference"] == {"predefinedLayout": layout}
+
+    def test_add_slide_rejects_unknown_layout(self, slides_service):
+        """Test that an unknown layout fails before any API call."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            slides_service.add_slide("pres-123", layout="FANCY")
+
+        assert exc_info.value.operation == "slides.add_slide"
+        assert "BIG_NUMBER" in exc_info.value.message
+        slides_service.service.presentations().batchUpdate.assert_not_called()
+
+    def test_insert_image_size_optional(self, slides_service, capsys):
+        """Test that an image without width and height keeps its natural size."""
+        setup_batch_response(slides_service)
+
+        slides_service.insert_image("pres-123", "s1", "https://x/a.png", 5, 6)
+        sized = slides_service.insert_image("pres-123", "s1", "https://x/a.png", 5, 6, 40, 30)
+
+        properties = sent_requests(slides_service)[0]["createImage"]["elementProperties"]
+        assert properties["size"]["width"] == {"magnitude": 40, "unit": "PT"}
+        assert properties["transform"]["translateX"] == 5
+        first = slides_service.service.presentations().batchUpdate.call_args_list[-2]
+        assert "size" not in first.kwargs["body"]["requests"][0]["createImage"]["elementProperties"]
+        assert sized["presentationId"] == "pres-123"
+
+    def test_replace_text_reports_occurrences(self, slides_service, capsys):
+        """Test that replace_text reads the occurrence count from its reply."""
+        setup_batch_response(slides_service, replies=[
+            {"replaceAllText": {"occurrencesChanged": 3}},
+        ])
+
+        slides_service.replace_text("pres-123", "{{name}}", "Ada")
+
+        assert last_output(capsys)["occurrences_changed"] == 3
+
+    def test_format_text_fields_follow_options(self, slides_service, capsys):
+        """Test that the fields mask lists exactly the supplied options."""
+        setup_batch_response(slides_service)
+
+        slides_service.format_text("pres-123", "shape-1", italic=False, font_size=14)
+
+        request = sent_requests(slides_service)[0]["updateTextStyle"]
+        assert request["fields"] == "italic,fontSize"
+        assert request["style"] == {"italic": False, "fontSize": {"magnitude": 14, "unit": "PT"}}
+        assert last_output(capsys)["formatting"] == ["italic", "fontSize"]
+
+    def test_format_paragraph_fields_follow_options(self, slides_service, capsys):
+        """Test that paragraph formatting sends a mask of the supplied options."""
+        setup_batch_response(slides_service)
+
+        slides_service.format_paragraph(
+            "pres-123", "shape-1", alignment="center", indent_start=12
+        )
+
+        request = sent_requests(slides_service)[0]["updateParagraphStyle"]
+        assert request["fields"] == "alignment,indentStart"
+        assert request["style"]["alignment"] == "CENTER"
+
+    def test_format_text_requires_option(self, slides_service):
+        """Test that format_text without options fails before any API call."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            slides_service.format_text("pres-123", "shape-1")
+
+        assert exc_info.value.operation == "slides.format_text"
+        slides_service.service.presentations().batchUpdate.assert_not_called()
+
+    def test_validation_error_tagged_with_operation(self, slides_service):
+        """Test that argument errors raise InvalidArgsError for the method."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            slides_service.create_line("pres-123", "s1", 0, 0, 10, 10, line_category="zigzag")
+
+        assert exc_info.value.operation == "slides.create_line"
+        slides_service.service.presentations().batchUpdate.assert_not_called()
+
+    @pytest.mark.parametrize("call", [
+        lambda svc: svc.create_line("pres-123", "s1", 0, 0, 10, 10, color="#12"),
+        lambda svc: svc.set_slide_background("pres-123", "s1", color="nope"),
+    ])
+    def test_invalid_color_raises_invalid_args(self, slides_service, call):
+        """Test that a malformed hex color raises InvalidArgsError, not ValueError."""
+        with pytest.raises(InvalidArgsError) as exc_info:
+            call(slides_service)
+
+        assert exc_info.value.operation.startswith("slides.")
+        slides_service.service.presentations().batchUpdate.assert_not_called()
+
+    def test_missing_notes_shape_raises_not_found(self, slides_service):
+        """Test that set_speaker_notes reports a slide without a notes shape."""
+        setup_get_response(slides_service, {"slides": [{"objectId": "s1"}]})
+
+        with pytest.raises(NotFoundError) as exc_info:
+            slides_service.set_speaker_notes("pres-123", "s1", "Notes")
+
+        assert exc_info.value.operation == "slides.set_speaker_notes"
+
+    def test_transient_error_retried(self, slides_service, capsys):
+        """Test that a 503 from batchUpdate is retried before succeeding."""
+        execute = slides_service.service.presentations().batchUpdate().execute
+        execute.side_effect = [
+            make_http_error(503, "Service Unavailable"),
+            {"presentationId": "pres-123", "replies": [{}]},
+        ]
+
+        with patch("gws.utils.retry.time.sleep") as sleep:
+            slides_service.delete_slide("pres-123", "s1")
+
+        assert execute.call_count == 2
+        sleep.assert_called_once()
+        assert last_output(capsys)["operation"] == "slides.delete_slide"
+
+    def test_http_error_raises_api_error(self, slides_service):
+        """Test that API failures surface as APIError tagged with the operation."""
+        slides_service.service.presentations().batchUpdate().execute.side_effect = (
+            make_http_error(404, "Not Found")
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            slides_service.delete_element("pres-123", "shape-1")
+
+        assert exc_info.value.operation == "slides.delete_element"
+        assert "Not Found" in exc_info.value.message
+
+
+# =============================================================================
+# BATCH TESTS
+# =============================================================================
+
+
+class TestBatch:
+    """Test coalescing of requests with SlidesService.batch()."""
+
+    def test_queued_requests_sent_once(self, slides_service, capsys):
+        """Test that queued operations go out as a single batchUpdate."""
+        setup_batch_response(slides_service, replies=[
+            {"createSlide": {"objectId": "s1"}},
+            {"createShape": {"objectId": "t1"}},
+            {},
+            {"replaceAllText": {"occurrencesChanged": 2}},
+        ])
+        batch_update = slides_service.service.presentations().batchUpdate
+        batch_update.reset_mock()
+
+        with slides_service.batch("pres-123") as batch:
+            slide_id = slides_service.add_slide("pres-123")
+            textbox_id = slides_service.create_textbox(
+                "pres-123", slide_id, "Hello", 10, 10, 200, 50
+            )
+            assert slides_service.replace_text("pres-123", "a", "b") is None
+            assert batch.pending == 4
+            assert batch_update.call_count == 0
+
+        assert batch_update.call_count == 1
+        requests = sent_requests(slides_service)
+        assert [next(iter(r)) for r in requests] == [
+            "createSlide", "createShape", "insertText", "replaceAllText",
+        ]
+        assert requests[0]["createSlide"]["objectId"] == slide_id
+        assert requests[1]["createShape"]["objectId"] == textbox_id
+        assert requests[1]["createShape"]["elementProperties"]["pageObjectId"] == slide_id
+
+        outputs = all_outputs(capsys)
+        assert [o["operation"] for o in outputs] == [
+            "slides.add_slide", "slides.create_textbox", "slides.replace_text",
+        ]
+        assert outputs[2]["occurrences_changed"] == 2
+        assert len(batch.results) == 3
+        assert batch.results[1]["replies"] == [{"createShape": {"objectId": "t1"}}, {}]
+
+    def test_error_in_block_discards_queue(self, slides_service):
+        """Test that an exception inside the block sends nothing."""
+        batch_update = slides_service.service.presentations().batchUpdate
+        batch_update.reset_mock()
+
+        with pytest.raises(RuntimeError):
+            with slides_service.batch("pres-123"):
+                slides_service.delete_slide("pres-123", "s1")
+                raise RuntimeError("abort")
+
+        assert batch_update.call_count == 0
+        assert slides_service._batch is None
+
+    def test_other_presentation_runs_immediately(self, slides_service, capsys):
+        """Test that calls for a different presentation flush and run directly."""
+        setup_batch_response(slides_service)
+        batch_update = slides_service.service.presentations().batchUpdate
+        batch_update.reset_mock()
+
+        with slides_service.batch("pres-123") as batch:
+            slides_service.delete_element("pres-123", "shape-1")
+            result = slides_service.delete_element("other-pres", "shape-2")
+            assert result is not None
+            assert batch.pending == 0
+
+        assert batch_update().execute.call_count == 2
+        ids = [o["presentation_id"] for o in all_outputs(capsys)]
+        assert ids == ["pres-123", "other-pres"]
+
+    def test_all_mutators_queue(self, slides_service, capsys):
+        """Test that table, shape and grouping methods queue like the rest."""
+        setup_batch_response(slides_service, replies=[
+            {}, {}, {}, {"replaceAllShapesWithImage": {"occurrencesChanged": 4}},
+        ])
+        batch_update = slides_service.service.presentations().batchUpdate
+        batch_update.reset_mock()
+
+        with slides_service.batch("pres-123"):
+            shape_id = slides_service.create_shape("pres-123", "s1", "ellipse", 0, 0, 10, 10)
+            assert slides_service.format_shape("pres-123", shape_id, fill_color="#00FF00") is None
+            group_id = slides_service.group_objects("pres-123", [shape_id, "t1"])
+            slides_service.replace_shapes_with_image("pres-123", "{{logo}}", "https://x/logo.png")
+            assert batch_update.call_count == 0
+
+        assert batch_update.call_count == 1
+        requests = sent_requests(slides_service)
+        assert requests[0]["createShape"]["objectId"] == shape_id
+        assert requests[2]["groupObjects"]["groupObjectId"] == group_id
+        outputs = all_outputs(capsys)
+        assert outputs[-1]["occurrences_replaced"] == 4
+
+    def test_lookup_flushes_queue(self, slides_service, capsys):
+        """Test that a metadata lookup inside a batch sends queued requests first."""
+        setup_get_response(slides_service, {"title": "Deck", "slides": []})
+        setup_batch_response(slides_service)
+        slides_service.metadata("pres-123")
+        batch_update = slides_service.service.presentations().batchUpdate
+        batch_update.reset_mock()
+        get_execute = slides_service.service.presentations().get().execute
+        get_execute.reset_mock()
+
+        with slides_service.batch("pres-123") as batch:
+            slides_service.add_slide("pres-123")
+            slides_service.metadata("pres-123")
+            assert batch.pending == 0
+
+        assert batch_update.call_count == 1
+        assert get_execute.call_count == 1
+
+    def test_nested_batch_rejected(self, slides_service):
+        """Test that opening a second batch on the same service fails."""
+        with slides_service.batch("pres-123"):
+            with pytest.raises(InvalidArgsError):
+                with slides_service.batch("pres-123"):
+                    pass
+
+    def test_flush_error_raises_api_error(self, slides_service):
+        """Test that a failed flush surfaces as APIError for slides.batch."""
+        slides_service.service.presentations().batchUpdate().execute.side_effect = (
+            make_http_error(400, "Invalid requests")
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            with slides_service.batch("pres-123"):
+                slides_service.insert_text("pres-123", "shape-1", "Hi")
+
+        assert exc_info.value.operation == "slides.batch"
+        assert slides_service._batch is None
+
+
+# =============================================================================
+# PARALLEL EXECUTION TESTS
+# =============================================================================
+
+
+class TestParallel:
+    """Test sending batchUpdates to several presentations concurrently."""
+
+    def test_execute_parallel_sends_each_job(self, slides_service, capsys):
+        """Test that each presentation gets its own requests, with errors in place."""
+        def batch_update(presentationId, body):
+            request = MagicMock()
+            if presentationId == "bad":
+                request.execute.side_effect = make_http_error()
+            else:
+                request.execute.return_value = {
+                    "presentationId": presentationId,
+                    "replies": [{}] * len(body["requests"]),
+                }
+            return request
+
+        slides_service.service.presentations().batchUpdate.side_effect = batch_update
+        jobs = [("a", [{"x": 1}]), ("bad", [{"x": 2}]), ("b", [{"x": 3}, {"x": 4}])]
+
+        results = slides_service.execute_parallel(jobs, max_workers=2)
+
+        assert results[0]["presentationId"] == "a"
+        assert isinstance(results[1], APIError)
+        assert results[1].operation == "slides.execute_parallel"
+        assert len(results[2]["replies"]) == 2
+        assert capsys.readouterr().out == ""
+
+    def test_empty_input(self, slides_service):
+        """Test that no jobs means no work."""
+        assert slides_service.execute_parallel([]) == []
+
+    def test_fan_out_results_in_input_order(self, slides_service, capsys):
+        """Test that each presentation gets the call, with errors in place."""
+        def batch_update(presentationId, body):
+            request = MagicMock()
+            if presentationId == "bad":
+                request.execute.side_effect = make_http_error()
+            else:
+                request.execute.return_value = {"presentationId": presentationId, "replies": [{}]}
+            return request
+
+        slides_service.service.presentations().batchUpdate.side_effect = batch_update
+        ids = ["p-0", "bad", "p-1", "p-2"]
+
+        results = slides_service.fan_out("delete_slide", ids, "s1", max_workers=2)
+
+        assert results[0]["presentationId"] == "p-0"
+        assert isinstance(results[1], APIError)
+        assert results[1].operation == "slides.delete_slide"
+        assert [r["presentationId"] for r in results[2:]] == ["p-1", "p-2"]
+        outputs = all_outputs(capsys)
+        assert sorted(o["presentation_id"] for o in outputs) == ["p-0", "p-1", "p-2"]
+
+    def test_fan_out_unknown_method_rejected(self, slides_service):
+        """Test that only public operations can be fanned out."""
+        for name in ("nope", "_batch_update", "fan_out"):
+            with pytest.raises(InvalidArgsError):
+                slides_service.fan_out(name, ["pres-123"])
+
+
+# =============================================================================
+# INSTANCE LAYOUT TESTS
+# =============================================================================
+
+
+class TestInstanceLayout:
+    """Test that SlidesService keeps a slotted instance layout."""
+
+    def test_no_instance_dict(self, slides_service):
+        """Test that instances do not carry a per-instance __dict__."""
+        assert not hasattr(slides_service, "__dict__")
+
+    def test_presentations_collection_reused(self, slides_service, capsys):
+        """Test that the presentations() collection is built once per service."""
+        setup_batch_response(slides_service)
+        presentations = slides_service.service.presentations
+        presentations.reset_mock(return_value=False)
+
+        slides_service.add_slide("pres-123")
+        slides_service.delete_slide("pres-123", "s1")
+
+        assert presentations.call_count == 1
+
+    def test_pages_collection_reused(self, slides_service):
+        """Test that the pages() collection is built once per service."""
+        slides_service.service.presentations().pages().get().execute.return_value = {
+            "pageElements": [],
+        }
+        pages = slides_service.service.presentations().pages
+        pages.reset_mock(return_value=False)
+
+        with patch("gws.services.slides.output_external_content"):
+            slides_service.read("pres-123", page_object_id="s1")
+            slides_service.read("pres-123", page_object_id="s2")
+
+        assert pages.call_count == 1
+
+
+# =============================================================================
+# READ HELPER TESTS
+# =============================================================================
+
+
+class TestReadHelpers:
+    """Test the element inspection helpers used by read()."""
+
+    def test_read_summarizes_every_slide(self, slides_service):
+        """Test that read() lists each slide's elements with their text."""
+        setup_get_response(slides_service, {
+            "title": "Deck",
+            "slides": [
+                {"objectId": "s1", "pageElements": [
+                    {"objectId": "t1", "shape": {
+                        "shapeType": "TEXT_BOX",
+                        "text": {"textElements": [{"textRun": {"content": "Hi\n"}}]},
+                    }},
+                    {"objectId": "i1", "image": {}},
+                ]},
+                {"objectId": "s2"},
+            ],
+        })
+
+        with patch("gws.services.slides.output_external_content") as output:
+            slides_service.read("pres-123")
+
+        fields = slides_service.service.presentations().get.call_args.kwargs["fields"]
+        assert fields.startswith("revisionId,title,slides(objectId,pageElements(objectId,shape(")
+        assert "textRun(content)" in fields
+        kwargs = output.call_args.kwargs
+        assert kwargs["slide_count"] == 2
+        assert json.loads(kwargs["content_fields"]["slides"]) == [
+            {"object_id": "s1", "index": 0, "elements": [
+                {"object_id": "t1", "type": "TEXT_BOX", "text": "Hi"},
+                {"object_id": "i1", "type": "IMAGE"},
+            ]},
+            {"object_id": "s2", "index": 1, "elements": []},
+        ]
+
+    def test_read_page_uses_fields_mask(self, slides_service):
+        """Test that a single-page read requests only the summarized element fields."""
+        slides_service.service.presentations().pages().get().execute.return_value = {
+            "pageElements": [{"objectId": "l1", "line": {}}],
+        }
+
+        with patch("gws.services.slides.output_external_content") as output:
+            slides_service.read("pres-123", page_object_id="s1")
+
+        get_kwargs = slides_service.service.presentations().pages().get.call_args.kwargs
+        assert get_kwargs["pageObjectId"] == "s1"
+        assert get_kwargs["fields"].startswith("pageElements(objectId,shape(")
+        assert json.loads(output.call_args.kwargs["content_fields"]["elements"]) == [
+            {"object_id": "l1", "type": "LINE"},
+        ]
+
+    def test_speaker_notes_use_fields_mask(self, slides_service, capsys):
+        """Test that get_speaker_notes() requests only notes pages."""
+        setup_get_response(slides_service, {"slides": [{
+            "objectId": "s1",
+            "slideProperties": {"notesPage": {"objectId": "n1", "pageElements": [
+                {"objectId": "b1", "shape": {
+                    "shapeType": "TEXT_BOX",
+                    "placeholder": {"type": "BODY"},
+                    "text": {"textElements": [{"textRun": {"content": "Say hi\n"}}]},
+                }},
+            ]}},
+        }]})
+
+        result = slides_service.get_speaker_notes("pres-123", "s1")
+
+        fields = slides_service.service.presentations().get.call_args.kwargs["fields"]
+        assert fields.startswith("revisionId,slides(objectId,slideProperties(notesPage(")
+        assert result == {"notes_text": "Say hi", "notes_page_id": "n1"}
+
+    def test_read_pages_uses_one_batch(self, slides_service):
+        """Test that read_pages() sends every page GET in one batch request."""
+        responses = {
+            "s1": ({"pageElements": [{"objectId": "i1", "image": {}}]}, None),
+            "s2": (None, make_http_error(404, "Not Found")),
+        }
+        added = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, *responses[request_id]) for request_id in added
+            ]
+            return batch
+
+        slides_service.service.new_batch_http_request.side_effect = new_batch
+
+        with patch("gws.services.slides.output_external_content") as output:
+            pages = slides_service.read_pages("pres-123", ["s1", "s2", "s1"])
+
+        assert added == ["s1", "s2"]
+        assert list(pages) == ["s1"]
+        kwargs = output.call_args.kwargs
+        assert kwargs["operation"] == "slides.read_pages"
+        assert kwargs["page_count"] == 1
+        assert list(kwargs["failed_ids"]) == ["s2"]
+        assert json.loads(kwargs["content_fields"]["pages"]) == [
+            {"object_id": "s1", "elements": [{"object_id": "i1", "type": "IMAGE"}]},
+        ]
+
+    def test_read_pages_requires_ids(self, slides_service):
+        """Test that read_pages() with no page IDs fails before any API call."""
+        with pytest.raises(InvalidArgsError):
+            slides_service.read_pages("pres-123", [])
+
+        slides_service.service.new_batch_http_request.assert_not_called()
+
+    def test_extract_text_joins_runs(self, slides_service):
+        """Test that text runs are concatenated and other elements skipped."""
+        text = {"textElements": [
+            {"paragraphMarker": {}},
+            {"textRun": {"content": "Hello "}},
+            {"autoText": {"type": "SLIDE_NUMBER"}},
+            {"textRun": {"content": "world\n"}},
+            {"textRun": {}},
+        ]}
+
+        assert slides_service._extract_text(text) == "Hello world"
+
+    def test_extract_text_empty(self, slides_service):
+        """Test that shapes without text elements yield an empty string."""
+        assert slides_service._extract_text({}) == ""
+
+    @pytest.mark.parametrize("element, expected", [
+        ({"shape": {"shapeType": "RECTANGLE"}}, "RECTANGLE"),
+        ({"shape": {}}, "SHAPE"),
+        ({"image": {}}, "IMAGE"),
+        ({"table": {}}, "TABLE"),
+        ({"line": {}}, "LINE"),
+        ({"video": {}}, "VIDEO"),
+        ({"sheetsChart": {}}, "UNKNOWN"),
+    ])
+    def test_get_element_type(self, slides_service, element, expected):
+        """Test the reported type for each kind of page element."""
+        assert slides_service._get_element_type({"objectId": "e1", **element}) == expected
+
+    def test_generated_object_ids(self, slides_service):
+        """Test that object IDs are unique, prefixed and 12 hex digits long."""
+        ids = {slides_service._generate_object_id() for _ in range(100)}
+
+        assert len(ids) == 100
+        for object_id in ids:
+            assert object_id.startswith("gws_")
+            int(object_id[4:], 16)
+            assert len(object_id) == 16